@@ -0,0 +1,93 @@
+"""Persistent on-disk caches (SQLite, per-entry TTL); AboutCache holds artist 'about' text."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from yt_artist.hashing import content_hash
+
+log = logging.getLogger("yt_artist.artist_about_cache")
+
+DEFAULT_TTL = 7 * 86400  # seconds
+
+
+def about_cache_key(artist_id: str, artist_name: str, channel_url: str) -> str:
+    """Return deterministic cache key for an artist's identity."""
+    return content_hash(f"{artist_id}|{artist_name}|{channel_url}")
+
+
+class _SqliteTTLCache:
+    """SQLite-backed key/value store with expiry in *table*, separate from the main DB.
+
+    Best-effort: read/write errors are logged and treated as a miss, so a
+    locked or corrupt cache file never breaks the caller. Several caches can
+    share one file under different tables.
+    """
+
+    def __init__(self, path: Union[str, Path], table: str):
+        self.path = Path(path)
+        self._table = table
+        self._initialized = False
+
+    def _conn(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path))
+        if not self._initialized:
+            # Directory + table are created once per instance, not on every get/set.
+            try:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self._table} ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached value for *key*, or None if missing/expired."""
+        try:
+            conn = self._conn()
+            try:
+                row = conn.execute(f"SELECT value, expires_at FROM {self._table} WHERE key = ?", (key,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            log.debug("Cache read failed (%s/%s)", self.path, self._table, exc_info=True)
+            return None
+        if not row or row[1] <= time.time():
+            return None
+        return row[0] or None
+
+    def set(self, key: str, value: str, ttl: float = DEFAULT_TTL) -> None:
+        """Store *value* under *key* for *ttl* seconds. Never raises."""
+        try:
+            conn = self._conn()
+            try:
+                conn.execute(
+                    f"""
+                    INSERT INTO {self._table} (key, value, expires_at) VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        value = excluded.value,
+                        expires_at = excluded.expires_at
+                    """,
+                    (key, value, time.time() + ttl),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            log.debug("Cache write failed (%s/%s)", self.path, self._table, exc_info=True)
+
+
+class AboutCache(_SqliteTTLCache):
+    """Artist 'about' text, keyed by :func:`about_cache_key`."""
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__(path, "about_cache")
@@ -2,52 +2,334 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import logging
+import re
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from difflib import SequenceMatcher
+from typing import Any, Optional
 
-from yt_artist.llm import complete
+from yt_artist.artist_about_cache import AboutCache, about_cache_key
+from yt_artist.config import get_concurrency_config
+from yt_artist.llm import complete_stream
+from yt_artist.llm_cache import LLMCache, cached_complete
+
+try:
+    from duckduckgo_search import DDGS as _DDGS
+except ImportError:
+    _DDGS = None  # type: ignore[misc, assignment]
 
 log = logging.getLogger("yt_artist.artist_prompt")
 
+_QUERY_TEMPLATE = "{name} YouTube channel"
+_SYSTEM_SUMMARIZE = (
+    "You are a concise editor. Summarize the following search results about a YouTube channel "
+    "into 2-3 sentences. Output only the summary, no preamble."
+)
+_SYSTEM_FALLBACK = (
+    "You are a concise editor. Given a YouTube channel name and URL, write 1-2 sentences "
+    "describing what kind of channel it might be. Output only the description."
+)
+_FALLBACK_USER_TEMPLATE = "Channel name: {name}\nChannel URL: {url}"
 
-def _search_about(query: str, max_results: int = 3) -> str:
-    """Return concatenated snippets from web search. Uses duckduckgo-search if available."""
-    try:
-        from duckduckgo_search import DDGS
-
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=max_results))
-        if not results:
-            return ""
-        return " ".join((r.get("body") or r.get("title") or "") for r in results)
-    except ImportError:
+# Max seconds to wait for web search before settling for the LLM-only fallback.
+_SEARCH_WAIT = 3.0
+
+# Snippet budget sent to the summarizer LLM: ~800 tokens at ~4 chars/token.
+_MAX_SNIPPET_CHARS = 3200
+# Snippets at least this similar (after normalizing) to a kept one are dropped.
+_DUP_SIMILARITY = 0.8
+
+# Search text that already reads like an "about" is returned without an LLM call.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_URL_OR_HTML_RE = re.compile(r"https?://|<[^>]+>")
+
+# The summarizer is asked for 2-3 sentences; stop streaming once it has produced this many.
+_MAX_ABOUT_SENTENCES = 3
+
+# Per-call caps so a stalled upstream can't hang build-artist-prompt.
+_SEARCH_TIMEOUT = 4.0  # seconds per DuckDuckGo HTTP request
+_LLM_TIMEOUT = 15.0  # seconds per LLM attempt
+_LLM_RETRIES = 1
+
+# Queries whose search came back empty/failed are not retried for this many seconds.
+_NEG_CACHE_TTL = 60.0
+_neg_cache: dict[str, float] = {}  # query -> monotonic expiry
+_neg_cache_lock = threading.Lock()
+
+_cached_ddgs: Optional[Any] = None
+_ddgs_lock = threading.Lock()
+
+
+def _get_ddgs() -> Any:
+    """Return a shared DDGS client, created on first use.
+
+    Reusing one client keeps its HTTP session (and TLS connection) alive
+    across searches instead of handshaking on every call.
+    Caller must check that duckduckgo-search is installed (``_DDGS is not None``).
+    """
+    global _cached_ddgs
+    with _ddgs_lock:
+        if _cached_ddgs is None:
+            _cached_ddgs = _DDGS(timeout=_SEARCH_TIMEOUT)
+            atexit.register(_close_ddgs)
+        return _cached_ddgs
+
+
+def _close_ddgs() -> None:
+    global _cached_ddgs
+    with _ddgs_lock:
+        if _cached_ddgs is not None:
+            with contextlib.suppress(Exception):
+                _cached_ddgs.__exit__(None, None, None)
+            _cached_ddgs = None
+
+
+def _search_about(query: str, max_results: int = 3) -> list[str]:
+    """Return snippets from web search (empty list on failure). Uses duckduckgo-search if available.
+
+    Empty/failed results are remembered for _NEG_CACHE_TTL seconds so repeat
+    builds don't pay the failing request again.
+    """
+    with _neg_cache_lock:
+        if _neg_cache.get(query, 0.0) > time.monotonic():
+            log.debug("Skipping web search for %r (recently empty/failed).", query)
+            return []
+    snippets: list[str] = []
+    if _DDGS is None:
         log.warning(
             "duckduckgo-search not installed; using LLM-only fallback. "
             "For better results: pip install yt-artist[search]"
         )
-        return ""
-    except Exception as exc:
-        log.warning("Web search failed (continuing with LLM fallback): %s", exc)
-        return ""
+    else:
+        try:
+            snippets = [r.get("body") or r.get("title") or "" for r in _get_ddgs().text(query, max_results=max_results)]
+        except Exception as exc:
+            log.warning("Web search failed (continuing with LLM fallback): %s", exc)
+    if not any(snippets):
+        with _neg_cache_lock:
+            _neg_cache[query] = time.monotonic() + _NEG_CACHE_TTL
+    return snippets
+
+
+def _dedupe_snippets(snippets: list[str]) -> list[str]:
+    """Drop empty and near-duplicate snippets; search engines often return overlapping text."""
+    kept: list[str] = []
+    kept_norm: list[str] = []
+    for snippet in snippets:
+        norm = " ".join(snippet.lower().split())
+        if not norm:
+            continue
+        if any(SequenceMatcher(None, norm, k).ratio() > _DUP_SIMILARITY for k in kept_norm):
+            continue
+        kept.append(snippet.strip())
+        kept_norm.append(norm)
+    return kept
+
+
+def _is_usable_about(text: str) -> bool:
+    """True if *text* is already a short about: 100-400 chars, 1-3 full sentences, no URLs/HTML."""
+    if not 100 <= len(text) <= 400 or _URL_OR_HTML_RE.search(text):
+        return False
+    # Search engines elide long bodies with "..."; those aren't complete sentences.
+    if not text.endswith((".", "!", "?")) or text.endswith(("...", "\u2026")):
+        return False
+    return len(_SENTENCE_SPLIT_RE.split(text)) <= 3
+
+
+def _stream_about(
+    system_prompt: str,
+    user_content: str,
+    *,
+    model: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> str:
+    """Stream a completion and stop as soon as _MAX_ABOUT_SENTENCES sentences are complete.
+
+    Skips waiting for the model's tail (extra sentences, sign-offs).
+    """
+    buf = ""
+    stream = complete_stream(system_prompt, user_content, model=model, timeout=timeout)
+    try:
+        for piece in stream:
+            buf += piece
+            parts = _SENTENCE_SPLIT_RE.split(buf)
+            if len(parts) > _MAX_ABOUT_SENTENCES:
+                buf = " ".join(parts[:_MAX_ABOUT_SENTENCES])
+                break
+    finally:
+        stream.close()
+    return buf.strip()
+
+
+def _truncate_words(text: str, max_chars: int) -> str:
+    """Cut *text* to at most *max_chars*, backing up to a word boundary."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    space = cut.rfind(" ")
+    return cut[:space] if space > 0 else cut
 
 
 def build_artist_about(
     artist_id: str,
     artist_name: str,
     channel_url: str,
+    *,
+    cache: Optional[AboutCache] = None,
+    llm_cache: Optional[LLMCache] = None,
+    refresh: bool = False,
 ) -> str:
     """
     Build a short 'about' text for the artist: try web search first, else LLM from channel name + URL.
     Does not write to storage; caller can call storage.set_artist_about(artist_id, about).
+    With *cache*, a fresh hit is returned without any network I/O; new results are stored.
+    With *llm_cache*, identical LLM prompts (e.g. same search snippets) reuse a stored completion.
+    With *refresh*, both caches are skipped on read; the rebuilt about still replaces the *cache* entry.
     """
-    query = f"{artist_name} YouTube channel"
-    raw = _search_about(query)
-    if raw and len(raw.strip()) > 50:
+    if refresh:
+        llm_cache = None
+    if cache is None:
+        return _build_about(artist_name, channel_url, llm_cache)
+    key = about_cache_key(artist_id, artist_name, channel_url)
+    cached = None if refresh else cache.get(key)
+    if cached:
+        log.info("Using cached about text for %s.", artist_id)
+        return cached
+    about = _build_about(artist_name, channel_url, llm_cache)
+    # Don't cache the bare "name (url)" placeholder — retry search/LLM next time.
+    if about != _placeholder_about(artist_name, channel_url):
+        cache.set(key, about)
+    return about
+
+
+def build_artist_about_many(
+    items: list[tuple[str, str, str]],
+    *,
+    concurrency: Optional[int] = None,
+    cache: Optional[AboutCache] = None,
+    llm_cache: Optional[LLMCache] = None,
+) -> dict[str, str]:
+    """Build about text for many ``(artist_id, artist_name, channel_url)`` items concurrently.
+
+    Wall time approaches the slowest item instead of the sum. *concurrency*
+    defaults to ConcurrencyConfig.max_concurrency (keeps search/LLM load modest).
+    Returns ``{artist_id: about}``; items that fail are logged and omitted.
+    """
+    workers = max(1, concurrency or get_concurrency_config().max_concurrency)
+    results: dict[str, str] = {}
+    if not items:
+        return results
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(build_artist_about, aid, name, url, cache=cache, llm_cache=llm_cache): aid
+            for aid, name, url in items
+        }
+        for fut in as_completed(futures):
+            aid = futures[fut]
+            try:
+                results[aid] = fut.result()
+            except Exception as exc:  # noqa: BLE001
+                log.warning("Could not build about text for %s: %s", aid, exc)
+    return results
+
+
+def prewarm(
+    artists: Iterable[Mapping[str, Any]],
+    *,
+    cache: AboutCache,
+    llm_cache: Optional[LLMCache] = None,
+    concurrency: Optional[int] = None,
+) -> Optional[threading.Thread]:
+    """Fill *cache* in a daemon thread for artist rows that have no about text yet.
+
+    Later build-artist-prompt runs for those artists become cache hits. Does not
+    write to storage. Returns the started thread, or None if nothing needs building.
+    """
+    items = [
+        (a["id"], a.get("name") or a["id"], a.get("channel_url") or "")
+        for a in artists
+        if not (a.get("about") or "").strip()
+    ]
+    if not items:
+        return None
+    log.info("Prewarming about cache for %d artists in the background.", len(items))
+    thread = threading.Thread(
+        target=build_artist_about_many,
+        args=(items,),
+        kwargs={"concurrency": concurrency, "cache": cache, "llm_cache": llm_cache},
+        name="about-prewarm",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _placeholder_about(artist_name: str, channel_url: str) -> str:
+    return f"{artist_name} ({channel_url})"
+
+
+def _search_in_background(query: str) -> Future:
+    """Run :func:`_search_about` on a daemon thread and return a future for its snippets.
+
+    A daemon thread (rather than an executor worker, which is joined at
+    interpreter exit) lets a search that overruns ``_SEARCH_WAIT`` be abandoned
+    without holding up process exit.
+    """
+    fut: Future = Future()
+
+    def run() -> None:
+        try:
+            fut.set_result(_search_about(query))
+        except BaseException as exc:  # noqa: BLE001
+            fut.set_exception(exc)
+
+    threading.Thread(target=run, name="about-search", daemon=True).start()
+    return fut
+
+
+def _build_about(artist_name: str, channel_url: str, llm_cache: Optional[LLMCache] = None) -> str:
+    """Uncached search + LLM path of build_artist_about.
+
+    Web search gets up to ``_SEARCH_WAIT`` seconds; the LLM-only fallback is
+    requested only when search is slow or returns nothing usable.
+    """
+    query = _QUERY_TEMPLATE.format(name=artist_name)
+    try:
+        snippets = _dedupe_snippets(_search_in_background(query).result(timeout=_SEARCH_WAIT))
+    except FuturesTimeout:
+        log.warning("Web search took over %.0fs; using LLM fallback.", _SEARCH_WAIT)
+        snippets = []
+    direct = " ".join(snippets)
+    if _is_usable_about(direct):
+        log.debug("About for %s: search snippet used as-is", artist_name)
+        return direct
+    raw = _truncate_words("- " + "\n- ".join(snippets), _MAX_SNIPPET_CHARS) if snippets else ""
+    if len(raw) > 50:
+        log.debug("About for %s: search path", artist_name)
         # Summarize search results into a short "about" (2-3 sentences)
-        system = "You are a concise editor. Summarize the following search results about a YouTube channel into 2-3 sentences. Output only the summary, no preamble."
-        about = complete(system_prompt=system, user_content=raw[:3000])
-        return (about or "").strip() or raw[:500]
-    # Fallback: LLM from channel name + URL only
-    system = "You are a concise editor. Given a YouTube channel name and URL, write 1-2 sentences describing what kind of channel it might be. Output only the description."
-    user = f"Channel name: {artist_name}\nChannel URL: {channel_url}"
-    about = complete(system_prompt=system, user_content=user)
-    return (about or "").strip() or f"{artist_name} ({channel_url})"
+        try:
+            about = cached_complete(
+                system_prompt=_SYSTEM_SUMMARIZE,
+                user_content=raw,
+                cache=llm_cache,
+                complete_fn=_stream_about,
+                timeout=_LLM_TIMEOUT,
+            )
+            return (about or "").strip() or " ".join(snippets)[:500]
+        except RuntimeError as exc:
+            log.warning("Summarizing search results failed; using LLM fallback: %s", exc)
+    log.debug("About for %s: LLM fallback path", artist_name)
+    about = cached_complete(
+        system_prompt=_SYSTEM_FALLBACK,
+        user_content=_FALLBACK_USER_TEMPLATE.format(name=artist_name, url=channel_url),
+        cache=llm_cache,
+        timeout=_LLM_TIMEOUT,
+        max_retries=_LLM_RETRIES,
+    )
+    return (about or "").strip() or _placeholder_about(artist_name, channel_url)
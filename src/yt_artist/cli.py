@@ -18,19 +18,36 @@ if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(line_buffering=True)
 
 from yt_artist import __version__
-from yt_artist.artist_prompt import build_artist_about
-from yt_artist.config import get_concurrency_config
-from yt_artist.fetcher import ensure_artist_and_video_for_video_url, fetch_channel
+from yt_artist.config import get_app_config, get_concurrency_config, has_pot_provider
+from yt_artist.fetcher import ensure_artist_and_video_for_video_url, fetch_channel, fetch_channels
+from yt_artist.jobs import (
+    attach_job,
+    cleanup_old_jobs,
+    estimate_time,
+    finalize_job,
+    format_estimate,
+    get_job,
+    launch_background,
+    list_jobs,
+    maybe_suggest_background,
+    retry_job,
+    stop_job,
+    update_job_progress,
+)
 from yt_artist.llm import check_connectivity as _check_llm
+from yt_artist.llm import get_config_summary
 from yt_artist.storage import Storage
 from yt_artist.summarizer import summarize
-from yt_artist.transcriber import extract_video_id, transcribe
+from yt_artist.transcriber import _classify_yt_dlp_error, extract_video_id, transcribe
 from yt_artist.yt_dlp_util import (
     channel_url_for,
     get_auth_config,
     get_inter_video_delay,
     validate_youtube_channel_url,
     validate_youtube_video_url,
+    video_url_for,
+    yt_dlp_cmd,
+    yt_dlp_path,
 )
 
 log = logging.getLogger("yt_artist.cli")
@@ -47,6 +64,9 @@ _DEMO_CHANNEL_URL = "https://www.youtube.com/@TED"
 _DEMO_VIDEO_URL = "https://www.youtube.com/watch?v=UyyjU8fzEYU"
 _DEMO_VIDEO_ID = "UyyjU8fzEYU"
 
+# Background-mode progress is written to the jobs table at most this often (seconds).
+_PROGRESS_FLUSH_INTERVAL = 1.0
+
 
 # ---------------------------------------------------------------------------
 # AppContext — replaces module globals + (args, storage, data_dir) triple
@@ -78,9 +98,8 @@ def _hint(*lines: str, quiet: bool = False) -> None:
     """Print next-step hints to stderr.  Suppressed when *quiet* is True."""
     if quiet:
         return
-    sys.stderr.write("\n")
-    for line in lines:
-        sys.stderr.write(f"  {line}\n")
+    # One write: stderr is line-buffered, so per-line writes would flush per line.
+    sys.stderr.write("\n" + "".join(f"  {line}\n" for line in lines))
 
 
 def _json_print(data: object, args: argparse.Namespace) -> bool:
@@ -113,8 +132,10 @@ class _ProgressCounter:
     """Thread-safe counter for parallel bulk operations.
 
     When *job_id* and *job_storage* are provided (background-worker mode),
-    each tick() also persists done/errors to the ``jobs`` table so that
-    ``yt-artist jobs`` can display live progress from another process.
+    done/errors are persisted to the ``jobs`` table so that ``yt-artist jobs``
+    can display live progress from another process. tick() only marks the
+    counts dirty; a daemon flusher writes them at most every
+    ``_PROGRESS_FLUSH_INTERVAL`` seconds, and finalize() writes the last counts.
     """
 
     def __init__(
@@ -131,37 +152,64 @@ class _ProgressCounter:
         self.t0 = time.monotonic()
         self._job_id = job_id
         self._job_storage = job_storage
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
         if job_id and job_storage:
-            from yt_artist.jobs import update_job_progress
-
             update_job_progress(job_storage, job_id, total=total)
+            self._flusher = threading.Thread(target=self._flush_loop, name="progress-flusher", daemon=True)
+            self._flusher.start()
 
     def tick(self, label: str, video_id: str, error: str | None = None) -> None:
         with self._lock:
             self._done += 1
             if error:
                 self._errors += 1
+            n = self._done
+        if log.isEnabledFor(logging.INFO):
+            elapsed = time.monotonic() - self.t0
+            remaining = elapsed / n * (self.total - n) if 0 < n < self.total else 0.0
+            log.info(
+                "%s %d/%d: %s  [%.0fs elapsed, ETA %.0fs]%s",
+                label,
+                n,
+                self.total,
+                video_id,
+                elapsed,
+                remaining,
+                f"  ERROR: {error}" if error else "",
+            )
+        if self._flusher is not None:
+            self._dirty.set()
+
+    def flush(self) -> None:
+        """Write current done/errors to the jobs table now (no-op in foreground mode)."""
+        if not self._job_id or not self._job_storage:
+            return
+        with self._lock:
             n, errs = self._done, self._errors
-        elapsed = time.monotonic() - self.t0
-        eta = ""
-        if n > 0 and n < self.total:
-            avg = elapsed / n
-            remaining = avg * (self.total - n)
-            eta = f"  ETA {remaining:.0f}s"
-        status = f"  ERROR: {error}" if error else ""
-        log.info("%s %d/%d: %s  [%.0fs elapsed%s]%s", label, n, self.total, video_id, elapsed, eta, status)
-        # Persist to jobs table for background mode
-        if self._job_id and self._job_storage:
-            from yt_artist.jobs import update_job_progress
-
-            update_job_progress(self._job_storage, self._job_id, done=n, errors=errs)
+        update_job_progress(self._job_storage, self._job_id, done=n, errors=errs)
+
+    def _flush_loop(self) -> None:
+        while not self._stop.is_set():
+            self._dirty.wait()
+            self._dirty.clear()
+            try:
+                self.flush()
+            except Exception:
+                log.debug("Job progress flush failed", exc_info=True)
+            self._stop.wait(_PROGRESS_FLUSH_INTERVAL)
 
     def finalize(self, status: str = "completed", error_message: str | None = None) -> None:
         """Mark the job as finished in the DB (no-op in foreground mode)."""
         if not self._job_id or not self._job_storage:
             return
-        from yt_artist.jobs import finalize_job
-
+        if self._flusher is not None:
+            self._stop.set()
+            self._dirty.set()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
         finalize_job(self._job_storage, self._job_id, status=status, error_message=error_message)
 
     @property
@@ -175,6 +223,29 @@ class _ProgressCounter:
             return self._done
 
 
+class _RateLimiter:
+    """Enforce a minimum gap between call starts across worker threads.
+
+    Each acquire() reserves the next start slot on a shared monotonic schedule
+    and sleeps (outside the lock) until it arrives. The first call never waits.
+    """
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.delay <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next - now)
+            self._next = max(self._next, now) + self.delay
+        if wait > 0:
+            time.sleep(wait)
+
+
 def _run_bulk(
     items: list,
     worker_fn,
@@ -188,6 +259,8 @@ def _run_bulk(
     """Run *worker_fn* over *items* with ThreadPool, progress tracking, and delay.
 
     *worker_fn(item)* must return a tuple whose last element is ``error_or_None``.
+    Item starts are spaced at least *inter_delay* apart by a shared _RateLimiter;
+    the sleep happens in the workers, so submission itself never blocks.
     Returns the _ProgressCounter so the caller can inspect done/errors.
     """
     progress = _ProgressCounter(len(items), job_id=job_id, job_storage=job_storage)
@@ -195,12 +268,14 @@ def _run_bulk(
         log.info(
             "Bulk %s: %d items with %d workers (%.1fs inter-item delay).", label, len(items), concurrency, inter_delay
         )
+    limiter = _RateLimiter(inter_delay)
+
+    def _paced(item):
+        limiter.acquire()
+        return worker_fn(item)
+
     with ThreadPoolExecutor(max_workers=concurrency) as pool:
-        futures: dict = {}
-        for i, item in enumerate(items):
-            futures[pool.submit(worker_fn, item)] = item
-            if inter_delay > 0 and i < len(items) - 1:
-                time.sleep(inter_delay)
+        futures = [pool.submit(_paced, item) for item in items]
         for fut in as_completed(futures):
             result = fut.result()
             # Last element of result tuple is error_or_None
@@ -221,8 +296,6 @@ def _resolve_prompt_id(storage: Storage, artist_id: str | None, prompt_override:
         pid = storage.get_artist_default_prompt_id(artist_id)
         if pid:
             return pid
-    from yt_artist.config import get_app_config
-
     env_default = get_app_config().default_prompt
     if env_default and storage.get_prompt(env_default):
         return env_default
@@ -287,7 +360,7 @@ def main() -> None:
         default=1,
         metavar="N",
         help=(
-            "Number of parallel workers for bulk transcribe/summarize "
+            "Number of parallel workers for bulk transcribe/summarize and multi-channel fetch-channel "
             f"(default: 1, max: {get_concurrency_config().max_concurrency}). Higher values increase "
             "YouTube rate-limit risk."
         ),
@@ -333,10 +406,14 @@ def main() -> None:
     p_fetch = subparsers.add_parser(
         "fetch-channel", help="Fetch all video URLs for a channel (bulk urllist per artist)"
     )
-    p_fetch.add_argument("channel_url", help="YouTube channel URL (e.g. https://www.youtube.com/@handle)")
+    p_fetch.add_argument(
+        "channel_url",
+        nargs="+",
+        help="YouTube channel URL(s) (e.g. https://www.youtube.com/@handle); several are listed --concurrency at a time",
+    )
     p_fetch.set_defaults(func=_cmd_fetch_channel)
     p_urllist = subparsers.add_parser("urllist", help="Alias for fetch-channel: fetch all video URLs for a channel")
-    p_urllist.add_argument("channel_url", help="YouTube channel URL")
+    p_urllist.add_argument("channel_url", nargs="+", help="YouTube channel URL(s)")
     p_urllist.set_defaults(func=_cmd_fetch_channel)
 
     # transcribe [video_url | --artist-id ARTIST_ID]
@@ -465,6 +542,12 @@ def main() -> None:
     p_build.add_argument(
         "--save-as-default", action="store_true", help="Create a prompt from about and set as artist default"
     )
+    p_build.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Ignore cached about text and rebuild it from search/LLM",
+    )
     p_build.set_defaults(func=_cmd_build_artist_prompt)
 
     # quickstart: guided tour for new users
@@ -586,8 +669,6 @@ def main() -> None:
     args = parser.parse_args()
 
     # Configure logging: default INFO; YT_ARTIST_LOG_LEVEL overrides (e.g. DEBUG, WARNING).
-    from yt_artist.config import get_app_config
-
     level_name = get_app_config().log_level
     logging.basicConfig(
         format="%(levelname)s: %(message)s",
@@ -613,8 +694,6 @@ def main() -> None:
 
     if getattr(args, "background", False) and not bg_worker_id:
         # Parent process: launch as background and exit immediately.
-        from yt_artist.jobs import launch_background
-
         job_id = launch_background(sys.argv, storage, data_dir)
         print(f"Job started: {job_id[:8]}")
         print("Check progress: yt-artist jobs")
@@ -627,8 +706,6 @@ def main() -> None:
         import signal as _signal
 
         def _bg_sigterm_handler(signum, frame):
-            from yt_artist.jobs import finalize_job
-
             finalize_job(storage, bg_worker_id, status="stopped")
             sys.exit(0)
 
@@ -658,7 +735,8 @@ def main() -> None:
     )
 
     # First-run hint: suggest doctor + quickstart if DB is empty.
-    if not ctx.quiet and args.command not in ("quickstart", "doctor", "jobs", "status"):
+    # Interactive only: skips the artists query when stderr is piped/redirected (scripts, --bg logs).
+    if not ctx.quiet and sys.stderr.isatty() and args.command not in ("quickstart", "doctor", "jobs", "status"):
         if not storage.list_artists():
             sys.stderr.write(
                 "\n  \U0001f4a1 First time? Check your setup and get started:\n"
@@ -670,22 +748,16 @@ def main() -> None:
         args.func(ctx)
         # If background worker completed normally, ensure job is marked done.
         if bg_worker_id:
-            from yt_artist.jobs import finalize_job, get_job
-
             job = get_job(storage, bg_worker_id)
             if job and job["status"] == "running":
                 finalize_job(storage, bg_worker_id, status="completed")
     except KeyboardInterrupt:
         if bg_worker_id:
-            from yt_artist.jobs import finalize_job
-
             finalize_job(storage, bg_worker_id, status="stopped")
         log.info("Interrupted.")
         sys.exit(130)
     except Exception as e:  # noqa: BLE001
         if bg_worker_id:
-            from yt_artist.jobs import finalize_job
-
             finalize_job(storage, bg_worker_id, status="failed", error_message=str(e)[:500])
         log.error("yt-artist error: %s", e)
         log.debug("Traceback:", exc_info=True)
@@ -700,12 +772,16 @@ def main() -> None:
 def _cmd_fetch_channel(ctx: AppContext) -> None:
     """Bulk urllist for channel; writes markdown and upserts artists/videos. No dependency fill."""
     args, storage, data_dir = ctx.args, ctx.storage, ctx.data_dir
-    args.channel_url = validate_youtube_channel_url(args.channel_url)
-    path, count = fetch_channel(args.channel_url, storage, data_dir=data_dir)
+    channel_urls = [validate_youtube_channel_url(u) for u in args.channel_url]
+    if len(channel_urls) > 1:
+        _fetch_channels_report(ctx, channel_urls)
+        return
+    channel_url = channel_urls[0]
+    path, count = fetch_channel(channel_url, storage, data_dir=data_dir)
     print(f"Urllist: {path}")
     print(f"Videos:  {count}")
     # Hint: suggest next step — transcribe
-    artist_id = args.channel_url.rstrip("/").split("/")[-1]
+    artist_id = channel_url.rstrip("/").split("/")[-1]
     videos = storage.list_videos(artist_id=artist_id)
     sample = videos[0]["id"] if videos else "VIDEO_ID"
     _hint(
@@ -718,6 +794,21 @@ def _cmd_fetch_channel(ctx: AppContext) -> None:
     )
 
 
+def _fetch_channels_report(ctx: AppContext, channel_urls: list[str]) -> None:
+    """Fetch several channels in parallel (--concurrency) and print one line per channel."""
+    results = fetch_channels(channel_urls, ctx.storage, data_dir=ctx.data_dir, concurrency=ctx.args.concurrency)
+    failed = 0
+    for url, result in results.items():
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"{url}: failed: {result}", file=sys.stderr)
+        else:
+            path, count = result
+            print(f"{url}: {count} videos → {path}")
+    if failed:
+        raise SystemExit(f"{failed} of {len(results)} channels failed.")
+
+
 def _cmd_transcribe(ctx: AppContext) -> None:
     """Per-video or bulk by --artist-id; reports and runs fetch_channel if artist/videos missing."""
     args, storage, data_dir = ctx.args, ctx.storage, ctx.data_dir
@@ -739,7 +830,7 @@ def _cmd_transcribe(ctx: AppContext) -> None:
             _report_dependency(f"Fetched urllist for {artist_id_arg} ({count} videos).")
             videos = storage.list_videos(artist_id=artist_id_arg)
         # Batch DB check: one query instead of N individual get_transcript calls.
-        all_ids = [v["id"] for v in videos]
+        all_ids = tuple(v["id"] for v in videos)
         have_transcripts = storage.video_ids_with_transcripts(all_ids)
         to_do = [v for v in videos if v["id"] not in have_transcripts]
         if not to_do:
@@ -750,12 +841,9 @@ def _cmd_transcribe(ctx: AppContext) -> None:
                 quiet=ctx.quiet,
             )
             return
-        url_base = "https://www.youtube.com/watch?v="
         concurrency = getattr(args, "concurrency", 1) or 1
 
         if getattr(args, "dry_run", False):
-            from yt_artist.jobs import estimate_time, format_estimate
-
             est = estimate_time(len(to_do), "transcribe", concurrency)
             already = len(videos) - len(to_do)
             print(f"Would transcribe {len(to_do)} videos ({already} already done). Estimated: ~{format_estimate(est)}")
@@ -765,7 +853,7 @@ def _cmd_transcribe(ctx: AppContext) -> None:
             """Worker: transcribe a single video. Returns (video_id, error_or_None)."""
             try:
                 transcribe(
-                    url_base + v["id"],
+                    video_url_for(v["id"]),
                     storage,
                     artist_id=artist_id_arg,
                     write_transcript_file=args.write_file,
@@ -777,8 +865,6 @@ def _cmd_transcribe(ctx: AppContext) -> None:
 
         # Warn if bulk transcribing 50+ videos without cookies (rate-limit risk)
         if len(to_do) >= 50 and not ctx.quiet:
-            from yt_artist.yt_dlp_util import get_auth_config
-
             auth = get_auth_config()
             if not auth["cookies_browser"] and not auth["cookies_file"]:
                 _hint(
@@ -788,10 +874,8 @@ def _cmd_transcribe(ctx: AppContext) -> None:
                     quiet=ctx.quiet,
                 )
 
-        # Suggest --bg for large batches (foreground only)
-        if not ctx.bg_job_id:
-            from yt_artist.jobs import maybe_suggest_background
-
+        # Suggest --bg for large batches (foreground, interactive only)
+        if not ctx.bg_job_id and sys.stderr.isatty():
             maybe_suggest_background(len(to_do), "transcribe", concurrency, sys.argv, quiet=ctx.quiet)
 
         # Rate-limit warning before starting bulk work
@@ -863,7 +947,7 @@ def _summarize_single(ctx: AppContext, video_spec: str) -> None:
         video_id = extract_video_id(video_spec)
     except ValueError:
         video_id = video_spec
-    url = video_spec if video_spec.startswith("http") else f"https://www.youtube.com/watch?v={video_id}"
+    url = video_spec if video_spec.startswith(("http://", "https://")) else video_url_for(video_id)
     t0 = time.monotonic()
     log.info("[1/4] Resolving artist and video…")
     artist_id, _ = ensure_artist_and_video_for_video_url(url, storage, data_dir)
@@ -885,10 +969,12 @@ def _summarize_single(ctx: AppContext, video_spec: str) -> None:
     )
     elapsed = time.monotonic() - t0
     log.info("Done in %.1fs.", elapsed)
-    rows = storage.get_summaries_for_video(video_id)
-    content = next((r["content"] for r in rows if r["prompt_id"] == prompt_id), "")
-    if args.max_preview > 0 and len(content) > args.max_preview:
-        content = content[: args.max_preview] + "..."
+    row = storage.get_summary(video_id, prompt_id)
+    content = row["content"] if row else ""
+    if args.max_preview > 0:
+        preview = content[: args.max_preview]
+        if len(preview) < len(content):
+            content = preview + "..."
     print(f"Summary id: {summary_id}")
     print(content)
     _hint(
@@ -901,6 +987,25 @@ def _summarize_single(ctx: AppContext, video_spec: str) -> None:
     )
 
 
+def _print_summary_previews(storage: Storage, videos: list, prompt_id: str, max_preview: int) -> None:
+    """Print 'Summary <id>: <preview>' for each video that has a *prompt_id* summary (one batch query)."""
+    summaries = storage.get_summaries_for_videos([v["id"] for v in videos])
+    out = sys.stdout
+    for v in videos:
+        rows = summaries.get(v["id"], [])
+        content = next((r["content"] for r in rows if r["prompt_id"] == prompt_id), "")
+        if not content:
+            continue
+        # Write the (possibly long) content as-is or as one slice, without building the full line.
+        out.write(f"Summary {v['id']}:{prompt_id}: ")
+        if max_preview > 0 and len(content) > max_preview:
+            out.write(content[:max_preview])
+            out.write("…\n")
+        else:
+            out.write(content)
+            out.write("\n")
+
+
 def _summarize_pipeline(
     ctx: AppContext,
     *,
@@ -908,7 +1013,7 @@ def _summarize_pipeline(
     videos: list,
     artist_id_arg: str,
     prompt_id: str,
-    all_ids: list[str],
+    all_ids: tuple[str, ...],
     missing: list[str],
     have_transcripts: set[str],
     already_summarized: set[str],
@@ -921,12 +1026,12 @@ def _summarize_pipeline(
     _report_dependency(f"{len(missing)} videos had no transcript → pipeline mode.")
     immediate_summarize = [vid for vid in all_ids if vid in have_transcripts and vid not in already_summarized]
 
-    url_base = "https://www.youtube.com/watch?v="
-
     def _transcribe_vid(vid: str) -> tuple[str, str | None]:
         """Worker: transcribe a single video by ID."""
         try:
-            transcribe(url_base + vid, storage, artist_id=artist_id_arg, write_transcript_file=False, data_dir=data_dir)
+            transcribe(
+                video_url_for(vid), storage, artist_id=artist_id_arg, write_transcript_file=False, data_dir=data_dir
+            )
             return (vid, None)
         except Exception as exc:  # noqa: BLE001
             return (vid, str(exc))
@@ -995,16 +1100,7 @@ def _summarize_pipeline(
         score_poll_fn=_score_poll_fn,
     )
     # Print summary previews for completed items
-    for v in to_summarize:
-        rows = storage.get_summaries_for_video(v["id"])
-        content = next((r["content"] for r in rows if r["prompt_id"] == prompt_id), "")
-        if content:
-            summary_id = f"{v['id']}:{prompt_id}"
-            if args.max_preview > 0 and len(content) > args.max_preview:
-                preview = content[: args.max_preview] + "…"
-            else:
-                preview = content
-            print(f"Summary {summary_id}: {preview}")
+    _print_summary_previews(storage, to_summarize, prompt_id, args.max_preview)
     t_err = f", {pipe_result.transcribe_errors} transcribe errors" if pipe_result.transcribe_errors else ""
     s_err = f", {pipe_result.summarize_errors} summarize errors" if pipe_result.summarize_errors else ""
     sc_info = f", scored {pipe_result.scored}" if pipe_result.scored else ""
@@ -1029,7 +1125,7 @@ def _summarize_bulk_sequential(
     videos: list,
     artist_id_arg: str,
     prompt_id: str,
-    all_ids: list[str],
+    all_ids: tuple[str, ...],
     skipped: int,
     concurrency: int,
     enable_scoring: bool,
@@ -1062,16 +1158,7 @@ def _summarize_bulk_sequential(
     )
     # Print summaries for completed items
     done = progress_s.done - progress_s.errors
-    for v in to_summarize:
-        rows = storage.get_summaries_for_video(v["id"])
-        content = next((r["content"] for r in rows if r["prompt_id"] == prompt_id), "")
-        if content:
-            summary_id = f"{v['id']}:{prompt_id}"
-            if args.max_preview > 0 and len(content) > args.max_preview:
-                preview = content[: args.max_preview] + "…"
-            else:
-                preview = content
-            print(f"Summary {summary_id}: {preview}")
+    _print_summary_previews(storage, to_summarize, prompt_id, args.max_preview)
     total_sum = time.monotonic() - progress_s.t0
     err_msg = f", {progress_s.errors} errors" if progress_s.errors else ""
     print(f"Summarized {done} new, {skipped} already done ({total_sum:.0f}s{err_msg}).")
@@ -1098,8 +1185,6 @@ def _summarize_bulk_sequential(
 def _cmd_summarize(ctx: AppContext) -> None:
     """Per-video or bulk; ensures artist/video/transcript, reports dependencies; prompt from --prompt or artist default."""
     args, storage, data_dir = ctx.args, ctx.storage, ctx.data_dir
-    # Pre-flight: verify LLM endpoint is reachable before doing any expensive work.
-    _check_llm()
 
     video_spec = (args.video or "").strip()
     artist_id_arg = (args.artist_id or "").strip()
@@ -1110,6 +1195,8 @@ def _cmd_summarize(ctx: AppContext) -> None:
 
     # Single-video path
     if not artist_id_arg:
+        # Pre-flight: verify LLM endpoint is reachable before doing any expensive work.
+        _check_llm()
         _summarize_single(ctx, video_spec)
         return
 
@@ -1127,7 +1214,8 @@ def _cmd_summarize(ctx: AppContext) -> None:
     concurrency = getattr(args, "concurrency", 1) or 1
 
     # Batch DB check: one query for transcript existence instead of N.
-    all_ids = [v["id"] for v in videos]
+    # One immutable id tuple is shared by every batch lookup below.
+    all_ids = tuple(v["id"] for v in videos)
     have_transcripts = storage.video_ids_with_transcripts(all_ids)
     missing = [vid for vid in all_ids if vid not in have_transcripts]
 
@@ -1189,9 +1277,10 @@ def _cmd_summarize(ctx: AppContext) -> None:
         )
         return
 
-    if getattr(args, "dry_run", False):
-        from yt_artist.jobs import estimate_time, format_estimate
+    # Pre-flight: only probe the LLM endpoint once there is work for it.
+    _check_llm()
 
+    if getattr(args, "dry_run", False):
         if missing:
             print(f"Would transcribe {len(missing)} videos (missing transcripts).")
         est = estimate_time(len(to_summarize), "summarize", concurrency)
@@ -1206,11 +1295,9 @@ def _cmd_summarize(ctx: AppContext) -> None:
         )
         return
 
-    # Suggest --bg for large batches (foreground only)
-    if not ctx.bg_job_id:
+    # Suggest --bg for large batches (foreground, interactive only)
+    if not ctx.bg_job_id and sys.stderr.isatty():
         total_work = len(missing) + len(to_summarize)
-        from yt_artist.jobs import maybe_suggest_background
-
         maybe_suggest_background(total_work, "summarize", concurrency, sys.argv, quiet=ctx.quiet)
 
     # Rate-limit warning before starting bulk work
@@ -1219,9 +1306,7 @@ def _cmd_summarize(ctx: AppContext) -> None:
     check_rate_warning(storage, quiet=ctx.quiet)
 
     # Determine scoring mode: --score forces on, --no-score forces off, else auto (on if <3h)
-    from yt_artist.jobs import estimate_time as _est_time
-
-    _est_secs = _est_time(len(to_summarize), "summarize", concurrency)
+    _est_secs = estimate_time(len(to_summarize), "summarize", concurrency)
     enable_scoring = _est_secs <= 3 * 3600  # auto: on if estimate <=3h
     if getattr(args, "score", None) is True:
         enable_scoring = True
@@ -1304,10 +1389,13 @@ def _cmd_list_prompts(ctx: AppContext) -> None:
     if not rows:
         print("No prompts stored. Add one with: yt-artist add-prompt --id <id> --name <name> --template '...'")
         return
+    out = []
     for r in rows:
-        template_preview = (r["template"][:60] + "...") if len(r["template"]) > 60 else r["template"]
-        print(f"  {r['id']}: {r['name']}")
-        print(f"    template: {template_preview}")
+        template_preview = r["template"][:60]
+        if len(template_preview) < len(r["template"]):
+            template_preview += "..."
+        out.append(f"  {r['id']}: {r['name']}\n    template: {template_preview}\n")
+    sys.stdout.write("".join(out))
     _hint(
         "\U0001f4a1 Use a prompt: yt-artist summarize VIDEO_ID --prompt <id>",
         "   Or set a default: yt-artist set-default-prompt --artist-id @CHANNEL --prompt <id>",
@@ -1320,9 +1408,10 @@ def _cmd_set_default_prompt(ctx: AppContext) -> None:
     args, storage = ctx.args, ctx.storage
     artist_id = (args.artist_id or "").strip()
     prompt_id = (args.prompt_id or "").strip()
-    if not storage.get_artist(artist_id):
+    artist_exists, prompt_exists = storage.check_artist_and_prompt(artist_id, prompt_id)
+    if not artist_exists:
         raise SystemExit(f"Artist {artist_id} not in DB. Run fetch-channel/urllist first.")
-    if not storage.get_prompt(prompt_id):
+    if not prompt_exists:
         raise SystemExit(f"Prompt {prompt_id} not found. Run list-prompts to see available prompts.")
     storage.set_artist_default_prompt(artist_id, prompt_id)
     print(f"Default prompt for {artist_id} set to: {prompt_id}")
@@ -1367,21 +1456,35 @@ def _cmd_build_artist_prompt(ctx: AppContext) -> None:
     channel_url = artist.get("channel_url") or channel_url_for(artist_id)
     name = artist.get("name") or artist_id
     log.info("Building about text (search + LLM)...")
-    about = build_artist_about(artist_id, name, channel_url)
-    storage.set_artist_about(artist_id, about)
-    print(f"About saved for {artist_id} ({len(about)} chars).")
+    from yt_artist.artist_about_cache import AboutCache
+    from yt_artist.artist_prompt import build_artist_about
+    from yt_artist.llm_cache import LLMCache
+    from yt_artist.paths import cache_db_path
+
+    cache_path = cache_db_path(data_dir)
+    about = build_artist_about(
+        artist_id,
+        name,
+        channel_url,
+        cache=AboutCache(cache_path),
+        llm_cache=LLMCache(cache_path),
+        refresh=args.force,
+    )
     if args.save_as_default:
         prompt_id = f"about-{artist_id.replace('@', '')}"
         template = (
             "Summarize the following transcript for a general audience. Artist context: {artist}\n\nVideo: {video}."
         )
-        storage.upsert_prompt(
+        # About, prompt and default pointer land in one transaction (one commit).
+        storage.save_artist_about_prompt(
+            artist_id,
+            about,
             prompt_id=prompt_id,
             name=f"About-based summary for {name}",
             template=template,
             artist_component=about[:200],
         )
-        storage.set_artist_default_prompt(artist_id, prompt_id)
+        print(f"About saved for {artist_id} ({len(about)} chars).")
         print(f"Created prompt '{prompt_id}' and set as default for {artist_id}.")
         _hint(
             "\U0001f4a1 Prompt is set! Now summarize:",
@@ -1389,6 +1492,8 @@ def _cmd_build_artist_prompt(ctx: AppContext) -> None:
             quiet=ctx.quiet,
         )
     else:
+        storage.set_artist_about(artist_id, about)
+        print(f"About saved for {artist_id} ({len(about)} chars).")
         _hint(
             "\U0001f4a1 Next: create a prompt from this about text:",
             f"   yt-artist build-artist-prompt --artist-id {artist_id} --save-as-default",
@@ -1447,12 +1552,15 @@ def _list_transcripts(ctx: AppContext) -> None:
             quiet=ctx.quiet,
         )
         return
-    print(f"{'VIDEO_ID':<16}\t{'ARTIST':<20}\t{'CHARS':>8}\t{'TITLE'}")
+    # One write for the whole table instead of a print() per row.
+    out = [f"{'VIDEO_ID':<16}\t{'ARTIST':<20}\t{'CHARS':>8}\t{'TITLE'}\n"]
     for r in rows:
-        title = (r.get("title") or "")[:50]
-        if len(r.get("title") or "") > 50:
+        full_title = r.get("title") or ""
+        title = full_title[:50]
+        if len(title) < len(full_title):
             title += "..."
-        print(f"{r['video_id']:<16}\t{r.get('artist_id', ''):<20}\t{r.get('transcript_len', 0):>8}\t{title}")
+        out.append(f"{r['video_id']:<16}\t{r.get('artist_id', ''):<20}\t{r.get('transcript_len', 0):>8}\t{title}\n")
+    sys.stdout.write("".join(out))
     sample_vid = rows[0]["video_id"]
     _hint(
         "\U0001f4a1 Summarize a transcript:",
@@ -1497,15 +1605,17 @@ def _search_transcripts_fts(ctx: AppContext) -> None:
             )
         return
 
-    print(f"{'VIDEO_ID':<16}  {'ARTIST':<16}  {'TITLE':<30}  SNIPPET")
+    out = [f"{'VIDEO_ID':<16}  {'ARTIST':<16}  {'TITLE':<30}  SNIPPET\n"]
     for r in rows:
         vid = r["video_id"][:16]
         artist = (r.get("artist_id") or "")[:16]
-        title = (r.get("title") or "")[:30]
-        if len(r.get("title") or "") > 30:
+        full_title = r.get("title") or ""
+        title = full_title[:30]
+        if len(title) < len(full_title):
             title = title[:27] + "..."
         snippet = (r.get("snippet") or "")[:80]
-        print(f"{vid:<16}  {artist:<16}  {title:<30}  {snippet}")
+        out.append(f"{vid:<16}  {artist:<16}  {title:<30}  {snippet}\n")
+    sys.stdout.write("".join(out))
 
     if len(rows) == limit:
         print(f"\n  (showing top {limit} results; use --limit N for more)")
@@ -1515,87 +1625,143 @@ def _search_transcripts_fts(ctx: AppContext) -> None:
     )
 
 
+# Rendered once per quickstart run; {db_flag} is " --db PATH" or "".
+_QUICKSTART_TEMPLATE = """\
+============================================================
+  yt-artist quickstart
+============================================================
+
+yt-artist works in 3 steps: fetch → transcribe → summarize
+
+This walkthrough uses the @TED channel as an example.
+A built-in 'default' prompt is ready to use — no setup needed.
+
+------------------------------------------------------------
+PREREQUISITE: Check your setup
+------------------------------------------------------------
+
+  yt-artist{db_flag} doctor
+
+  This checks yt-dlp, YouTube authentication, and LLM connectivity.
+
+  YouTube requires a PO token for subtitle downloads.
+  yt-artist auto-installs a PO token provider (rustypipe) so
+  tokens are generated automatically — no manual setup needed.
+
+  If doctor reports a PO token warning, install the provider:
+    pip install yt-dlp-get-pot-rustypipe
+
+  Or set a manual token as fallback:
+    export YT_ARTIST_PO_TOKEN=web.subs+<token>
+  Guide: https://github.com/yt-dlp/yt-dlp/wiki/PO-Token-Guide
+
+------------------------------------------------------------
+STEP 1: Fetch the channel's video list
+------------------------------------------------------------
+
+  yt-artist{db_flag} fetch-channel "{channel_url}"
+
+  This downloads the list of all videos and stores them in the DB.
+  Large channels (1000+ videos) may take a few minutes.
+
+------------------------------------------------------------
+STEP 2: Transcribe a video
+------------------------------------------------------------
+
+  yt-artist{db_flag} transcribe "{video_url}"
+
+  This downloads subtitles (or auto-captions) for one video.
+  For all videos: yt-artist{db_flag} transcribe --artist-id {channel}
+
+------------------------------------------------------------
+STEP 3: Summarize
+------------------------------------------------------------
+
+  yt-artist{db_flag} summarize {video_id}
+
+  This generates an AI summary using the default prompt.
+  (Requires Ollama running locally, or set OPENAI_API_KEY)
+  For all videos: yt-artist{db_flag} summarize --artist-id {channel}
+
+------------------------------------------------------------
+SHORTCUT: summarize does everything automatically!
+------------------------------------------------------------
+
+  yt-artist{db_flag} summarize "{video_url}"
+
+  This single command auto-creates the artist, fetches the video,
+  downloads the transcript, and generates the summary.
+
+============================================================
+  Copy any command above and paste it in your terminal to start!
+============================================================
+"""
+
+
 def _cmd_quickstart(ctx: AppContext) -> None:
     """Guided tour: print copy-pasteable commands for the 3-step workflow."""
     args = ctx.args
     db_flag = f" --db {args.db}" if args.db else ""
-    w = 60
-    print("=" * w)
-    print("  yt-artist quickstart")
-    print("=" * w)
-    print()
-    print("yt-artist works in 3 steps: fetch \u2192 transcribe \u2192 summarize")
-    print()
-    print("This walkthrough uses the @TED channel as an example.")
-    print("A built-in 'default' prompt is ready to use \u2014 no setup needed.")
-    print()
-    print("-" * w)
-    print("PREREQUISITE: Check your setup")
-    print("-" * w)
-    print()
-    print(f"  yt-artist{db_flag} doctor")
-    print()
-    print("  This checks yt-dlp, YouTube authentication, and LLM connectivity.")
-    print()
-    print("  YouTube requires a PO token for subtitle downloads.")
-    print("  yt-artist auto-installs a PO token provider (rustypipe) so")
-    print("  tokens are generated automatically — no manual setup needed.")
-    print()
-    print("  If doctor reports a PO token warning, install the provider:")
-    print("    pip install yt-dlp-get-pot-rustypipe")
-    print()
-    print("  Or set a manual token as fallback:")
-    print("    export YT_ARTIST_PO_TOKEN=web.subs+<token>")
-    print("  Guide: https://github.com/yt-dlp/yt-dlp/wiki/PO-Token-Guide")
-    print()
-    print("-" * w)
-    print("STEP 1: Fetch the channel's video list")
-    print("-" * w)
-    print()
-    print(f'  yt-artist{db_flag} fetch-channel "{_DEMO_CHANNEL_URL}"')
-    print()
-    print("  This downloads the list of all videos and stores them in the DB.")
-    print("  Large channels (1000+ videos) may take a few minutes.")
-    print()
-    print("-" * w)
-    print("STEP 2: Transcribe a video")
-    print("-" * w)
-    print()
-    print(f'  yt-artist{db_flag} transcribe "{_DEMO_VIDEO_URL}"')
-    print()
-    print("  This downloads subtitles (or auto-captions) for one video.")
-    print(f"  For all videos: yt-artist{db_flag} transcribe --artist-id {_DEMO_CHANNEL}")
-    print()
-    print("-" * w)
-    print("STEP 3: Summarize")
-    print("-" * w)
-    print()
-    print(f"  yt-artist{db_flag} summarize {_DEMO_VIDEO_ID}")
-    print()
-    print("  This generates an AI summary using the default prompt.")
-    print("  (Requires Ollama running locally, or set OPENAI_API_KEY)")
-    print(f"  For all videos: yt-artist{db_flag} summarize --artist-id {_DEMO_CHANNEL}")
-    print()
-    print("-" * w)
-    print("SHORTCUT: summarize does everything automatically!")
-    print("-" * w)
-    print()
-    print(f'  yt-artist{db_flag} summarize "{_DEMO_VIDEO_URL}"')
-    print()
-    print("  This single command auto-creates the artist, fetches the video,")
-    print("  downloads the transcript, and generates the summary.")
-    print()
-    print("=" * w)
-    print("  Copy any command above and paste it in your terminal to start!")
-    print("=" * w)
+    sys.stdout.write(
+        _QUICKSTART_TEMPLATE.format(
+            db_flag=db_flag,
+            channel=_DEMO_CHANNEL,
+            channel_url=_DEMO_CHANNEL_URL,
+            video_url=_DEMO_VIDEO_URL,
+            video_id=_DEMO_VIDEO_ID,
+        )
+    )
+
+
+_DOCTOR_TEST_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw"  # "Me at the zoo" — first YT video
+_DOCTOR_RULE = "=" * 50
+
+
+def _doctor_yt_dlp_version(exe: str) -> str:
+    """doctor probe: message describing the installed yt-dlp and its version."""
+    import subprocess
+
+    try:
+        ver = subprocess.run(["yt-dlp", "--version"], capture_output=True, text=True, timeout=10)
+    except Exception:
+        return f"yt-dlp found: {exe} (could not get version)"
+    return f"yt-dlp found: {exe} (version {(ver.stdout or '').strip()})"
+
+
+def _doctor_llm(base_url: str) -> tuple[str, str]:
+    """doctor probe: ``(status, message)`` for LLM endpoint reachability."""
+    from yt_artist.llm import check_connectivity
+
+    try:
+        check_connectivity()
+    except RuntimeError as e:
+        return "fail", f"LLM endpoint unreachable. {e}"
+    return "ok", f"LLM endpoint reachable ({base_url})"
+
+
+def _doctor_youtube_fetch() -> tuple[str, str]:
+    """doctor probe: ``(status, message)`` for a quick yt-dlp metadata fetch from YouTube."""
+    import subprocess
+
+    try:
+        cmd = yt_dlp_cmd() + ["--skip-download", "--no-warnings", "-j", _DOCTOR_TEST_URL]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if result.returncode == 0:
+            return "ok", "yt-dlp can reach YouTube and fetch video metadata"
+        stderr = (result.stderr or "").strip()
+        err_type, err_msg = _classify_yt_dlp_error(stderr)
+        if err_type != "generic":
+            return "fail", f"YouTube access issue: {err_msg}"
+        return "fail", f"yt-dlp metadata fetch failed (exit {result.returncode}): {stderr[:200]}"
+    except subprocess.TimeoutExpired:
+        return "warn", "yt-dlp metadata fetch timed out (30s). Network may be slow."
+    except Exception as e:
+        return "fail", f"yt-dlp test failed: {e}"
 
 
 def _cmd_doctor(ctx: AppContext) -> None:
     """Pre-flight checks: yt-dlp, YouTube auth, PO token, LLM, test subtitle fetch."""
     args, storage = ctx.args, ctx.storage
-    import shutil
-    import subprocess
-
     ok_count = 0
     warn_count = 0
     fail_count = 0
@@ -1625,25 +1791,25 @@ def _cmd_doctor(ctx: AppContext) -> None:
 
     if not _is_json:
         print("yt-artist doctor")
-        print("=" * 50)
+        print(_DOCTOR_RULE)
         print()
 
+    _report = {"ok": _ok, "warn": _warn, "fail": _fail}
+
+    # The yt-dlp version, LLM and YouTube probes are independent network/subprocess
+    # calls; start them together so doctor waits for the slowest, not their sum.
+    llm = get_config_summary()
+    yt_dlp_exe = yt_dlp_path()
+    probe_pool = ThreadPoolExecutor(max_workers=3)
+    f_version = probe_pool.submit(_doctor_yt_dlp_version, yt_dlp_exe) if yt_dlp_exe else None
+    f_llm = probe_pool.submit(_doctor_llm, llm["base_url"])
+    f_youtube = probe_pool.submit(_doctor_youtube_fetch) if yt_dlp_exe else None
+
     # --- [1/7] yt-dlp installation ---
     if not _is_json:
         print("[1/7] yt-dlp installation")
-    yt_dlp_path = shutil.which("yt-dlp")
-    if yt_dlp_path:
-        try:
-            ver = subprocess.run(
-                ["yt-dlp", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            version_str = (ver.stdout or "").strip()
-            _ok(f"yt-dlp found: {yt_dlp_path} (version {version_str})", name="yt-dlp")
-        except Exception:
-            _ok(f"yt-dlp found: {yt_dlp_path} (could not get version)", name="yt-dlp")
+    if f_version is not None:
+        _ok(f_version.result(), name="yt-dlp")
     else:
         _fail("yt-dlp not found on PATH. Install: pip install yt-dlp", name="yt-dlp")
     if not _is_json:
@@ -1670,14 +1836,7 @@ def _cmd_doctor(ctx: AppContext) -> None:
     # --- [3/7] PO token ---
     if not _is_json:
         print("[3/7] PO token (proof of origin)")
-    has_provider = False
-    try:
-        from importlib.metadata import distribution
-
-        distribution("yt-dlp-get-pot-rustypipe")
-        has_provider = True
-    except Exception:
-        pass
+    has_provider = has_pot_provider()
     if auth["po_token"]:
         extra = " (auto-provider also installed)" if has_provider else ""
         _ok(f"PO token is set via YT_ARTIST_PO_TOKEN{extra}", name="po_token")
@@ -1697,49 +1856,24 @@ def _cmd_doctor(ctx: AppContext) -> None:
     # --- [4/7] LLM endpoint ---
     if not _is_json:
         print("[4/7] LLM endpoint (for summarize)")
-    from yt_artist.llm import check_connectivity, get_config_summary
-
-    llm = get_config_summary()
-    provider = "Ollama (local)" if llm["is_ollama"] else "OpenAI-compatible API"
-    if not _is_json:
+        provider = "Ollama (local)" if llm["is_ollama"] else "OpenAI-compatible API"
         print(f"       Provider: {provider}")
         print(f"       Endpoint: {llm['base_url']}")
         print(f"       Model:    {llm['model']}")
-    try:
-        check_connectivity()
-        _ok(f"LLM endpoint reachable ({llm['base_url']})", name="llm")
-    except RuntimeError as e:
-        _fail(f"LLM endpoint unreachable. {e}", name="llm")
+    status, msg = f_llm.result()
+    _report[status](msg, name="llm")
     if not _is_json:
         print()
 
     # --- [5/7] Test subtitle fetch ---
     if not _is_json:
         print("[5/7] Test subtitle fetch (quick metadata check)")
-    if yt_dlp_path:
-        test_url = "https://www.youtube.com/watch?v=jNQXAC9IVRw"  # "Me at the zoo" — first YT video
-        try:
-            from yt_artist.yt_dlp_util import yt_dlp_cmd
-
-            cmd = yt_dlp_cmd() + ["--skip-download", "--no-warnings", "-j", test_url]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                _ok("yt-dlp can reach YouTube and fetch video metadata", name="youtube")
-            else:
-                stderr = (result.stderr or "").strip()
-                from yt_artist.transcriber import _classify_yt_dlp_error
-
-                err_type, err_msg = _classify_yt_dlp_error(stderr)
-                if err_type != "generic":
-                    _fail(f"YouTube access issue: {err_msg}", name="youtube")
-                else:
-                    _fail(f"yt-dlp metadata fetch failed (exit {result.returncode}): {stderr[:200]}", name="youtube")
-        except subprocess.TimeoutExpired:
-            _warn("yt-dlp metadata fetch timed out (30s). Network may be slow.", name="youtube")
-        except Exception as e:
-            _fail(f"yt-dlp test failed: {e}", name="youtube")
+    if f_youtube is not None:
+        status, msg = f_youtube.result()
+        _report[status](msg, name="youtube")
     else:
         _warn("Skipped (yt-dlp not installed)", name="youtube")
+    probe_pool.shutdown(wait=False)
 
     # --- [6/7] Transcript quality backfill ---
     if not _is_json:
@@ -1776,7 +1910,7 @@ def _cmd_doctor(ctx: AppContext) -> None:
         return
 
     print()
-    print("=" * 50)
+    print(_DOCTOR_RULE)
     total = ok_count + warn_count + fail_count
     print(f"  {ok_count}/{total} checks passed", end="")
     if warn_count:
@@ -1870,7 +2004,6 @@ def _cmd_score(ctx: AppContext) -> None:
 def _cmd_status(ctx: AppContext) -> None:
     """Show project status: artists, videos, transcripts, summaries, jobs, DB size."""
     args, storage = ctx.args, ctx.storage
-    from yt_artist.jobs import list_jobs
     from yt_artist.rate_limit import get_rate_status
 
     n_artists = storage.count_artists()
@@ -2106,8 +2239,6 @@ def _cmd_history(ctx: AppContext) -> None:
 def _cmd_jobs(ctx: AppContext) -> None:
     """Handle jobs subcommands: list, attach, stop, clean."""
     args, storage, data_dir = ctx.args, ctx.storage, ctx.data_dir
-    from yt_artist.jobs import attach_job, cleanup_old_jobs, list_jobs, stop_job
-
     action = getattr(args, "jobs_action", "list") or "list"
 
     if action == "list":
@@ -2130,7 +2261,7 @@ def _cmd_jobs(ctx: AppContext) -> None:
         if not rows:
             print("No background jobs.")
             return
-        print(f"{'ID':>10}  {'STATUS':<10}  {'PROGRESS':<12}  {'STARTED':<20}  {'COMMAND'}")
+        out = [f"{'ID':>10}  {'STATUS':<10}  {'PROGRESS':<12}  {'STARTED':<20}  {'COMMAND'}\n"]
         for r in rows:
             jid = r["id"][:8]
             status = r["status"]
@@ -2139,7 +2270,8 @@ def _cmd_jobs(ctx: AppContext) -> None:
             progress = f"{done}/{total}" if total > 0 else "-"
             started = (r.get("started_at") or "")[:19]
             command = (r.get("command") or "")[:50]
-            print(f"{jid:>10}  {status:<10}  {progress:<12}  {started:<20}  {command}")
+            out.append(f"{jid:>10}  {status:<10}  {progress:<12}  {started:<20}  {command}\n")
+        sys.stdout.write("".join(out))
 
     elif action == "attach":
         attach_job(storage, args.job_id)
@@ -2148,8 +2280,6 @@ def _cmd_jobs(ctx: AppContext) -> None:
         stop_job(storage, args.job_id)
 
     elif action == "retry":
-        from yt_artist.jobs import get_job, retry_job
-
         job = get_job(storage, args.job_id)
         if not job:
             raise SystemExit(f"Job {args.job_id} not found.")
@@ -9,14 +9,19 @@ from __future__ import annotations
 
 import functools
 import os
+import re
+import sys
 from dataclasses import dataclass
 
+# Slotted config instances (no per-instance __dict__) where dataclasses supports it (3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # ---------------------------------------------------------------------------
 # YouTube / yt-dlp configuration
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class YouTubeConfig:
     """YouTube and yt-dlp related settings."""
 
@@ -28,6 +33,11 @@ class YouTubeConfig:
     po_token: str  # YT_ARTIST_PO_TOKEN
 
 
+def _env(key: str, default: str = "") -> str:
+    """Return env var *key* stripped; *default* when unset or empty."""
+    return (os.environ.get(key) or default).strip()
+
+
 def _parse_delay(raw: str, default: float) -> float:
     """Parse a float from a raw env string, returning *default* on failure."""
     raw = raw.strip()
@@ -39,22 +49,45 @@ def _parse_delay(raw: str, default: float) -> float:
     return default
 
 
+def _parse_int(raw: str, default: int, *, min_value: int = 0) -> int:
+    """Parse an int from a raw env string (clamped to *min_value*), returning *default* on failure."""
+    raw = raw.strip()
+    if raw:
+        try:
+            return max(min_value, int(raw))
+        except ValueError:
+            pass
+    return default
+
+
 @functools.lru_cache(maxsize=1)
 def get_youtube_config() -> YouTubeConfig:
     """Return YouTube config from environment variables (cached)."""
     return YouTubeConfig(
-        inter_video_delay=_parse_delay(
-            os.environ.get("YT_ARTIST_INTER_VIDEO_DELAY", ""),
-            2.0,
-        ),
-        sleep_requests=(os.environ.get("YT_ARTIST_SLEEP_REQUESTS") or "").strip() or "1",
-        sleep_subtitles=(os.environ.get("YT_ARTIST_SLEEP_SUBTITLES") or "").strip() or "3",
-        cookies_browser=(os.environ.get("YT_ARTIST_COOKIES_BROWSER") or "").strip(),
-        cookies_file=(os.environ.get("YT_ARTIST_COOKIES_FILE") or "").strip(),
-        po_token=(os.environ.get("YT_ARTIST_PO_TOKEN") or "").strip(),
+        inter_video_delay=_parse_delay(_env("YT_ARTIST_INTER_VIDEO_DELAY"), 2.0),
+        sleep_requests=_env("YT_ARTIST_SLEEP_REQUESTS") or "1",
+        sleep_subtitles=_env("YT_ARTIST_SLEEP_SUBTITLES") or "3",
+        cookies_browser=_env("YT_ARTIST_COOKIES_BROWSER"),
+        cookies_file=_env("YT_ARTIST_COOKIES_FILE"),
+        po_token=_env("YT_ARTIST_PO_TOKEN"),
     )
 
 
+@functools.lru_cache(maxsize=1)
+def has_pot_provider() -> bool:
+    """True if the yt-dlp-get-pot-rustypipe PO token plugin is installed (cached).
+
+    Reading package metadata scans site-packages, so do it once per process.
+    """
+    try:
+        from importlib.metadata import distribution
+
+        distribution("yt-dlp-get-pot-rustypipe")
+        return True
+    except Exception:
+        return False
+
+
 # ---------------------------------------------------------------------------
 # LLM configuration
 # ---------------------------------------------------------------------------
@@ -63,11 +96,15 @@ OLLAMA_BASE_URL = "http://localhost:11434/v1"
 OLLAMA_DEFAULT_MODEL = "mistral"
 
 
+# Ollama's default port or the word "ollama" anywhere in the base URL.
+_OLLAMA_RE = re.compile(r"11434|ollama", re.IGNORECASE)
+
+
 def _is_ollama(base_url: str) -> bool:
-    return "11434" in base_url or "ollama" in base_url.lower()
+    return _OLLAMA_RE.search(base_url) is not None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class LLMConfig:
     """LLM endpoint settings."""
 
@@ -80,9 +117,9 @@ class LLMConfig:
 @functools.lru_cache(maxsize=1)
 def get_llm_config() -> LLMConfig:
     """Return LLM config from environment variables (cached)."""
-    base_url = (os.environ.get("OPENAI_BASE_URL") or "").strip()
-    api_key = (os.environ.get("OPENAI_API_KEY") or "").strip()
-    model_env = (os.environ.get("OPENAI_MODEL") or "").strip()
+    base_url = _env("OPENAI_BASE_URL")
+    api_key = _env("OPENAI_API_KEY")
+    model_env = _env("OPENAI_MODEL")
 
     # Determine base_url, api_key, and default model
     if base_url and _is_ollama(base_url):
@@ -119,7 +156,7 @@ def get_llm_config() -> LLMConfig:
 _DEFAULT_MAX_CONCURRENCY = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ConcurrencyConfig:
     """Concurrency budget for bulk operations."""
 
@@ -131,6 +168,8 @@ class ConcurrencyConfig:
 
         Returns ``(transcribe_workers, summarize_workers)``.
         Transcribe gets more workers (YouTube I/O is the bottleneck).
+        *total* is the command's clamped ``--concurrency``, not ``map_concurrency``,
+        so the split can't be precomputed at config-load time.
         """
         if total <= 2:
             return (1, 1)
@@ -140,14 +179,9 @@ class ConcurrencyConfig:
 @functools.lru_cache(maxsize=1)
 def get_concurrency_config() -> ConcurrencyConfig:
     """Return concurrency config (cached)."""
-    raw = (os.environ.get("YT_ARTIST_MAP_CONCURRENCY") or "").strip()
-    try:
-        map_c = int(raw) if raw else _DEFAULT_MAX_CONCURRENCY
-    except ValueError:
-        map_c = _DEFAULT_MAX_CONCURRENCY
     return ConcurrencyConfig(
         max_concurrency=_DEFAULT_MAX_CONCURRENCY,
-        map_concurrency=max(1, map_c),
+        map_concurrency=_parse_int(_env("YT_ARTIST_MAP_CONCURRENCY"), _DEFAULT_MAX_CONCURRENCY, min_value=1),
     )
 
 
@@ -156,7 +190,11 @@ def get_concurrency_config() -> ConcurrencyConfig:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+# Valid YT_ARTIST_SUMMARIZE_STRATEGY values (summarizer.STRATEGIES, as a set).
+_STRATEGIES = frozenset({"auto", "truncate", "map-reduce", "refine"})
+
+
+@dataclass(frozen=True, **_SLOTS)
 class AppConfig:
     """Application-wide settings."""
 
@@ -166,28 +204,23 @@ class AppConfig:
     default_prompt: str  # YT_ARTIST_DEFAULT_PROMPT
     max_transcript_chars: int  # YT_ARTIST_MAX_TRANSCRIPT_CHARS
     summarize_strategy: str  # YT_ARTIST_SUMMARIZE_STRATEGY
+    prewarm_about: bool  # YT_ARTIST_PREWARM_ABOUT (MCP server: fill about cache on startup)
 
 
 @functools.lru_cache(maxsize=1)
 def get_app_config() -> AppConfig:
     """Return application config from environment variables (cached)."""
-    # Parse max_transcript_chars with validation
-    raw_chars = (os.environ.get("YT_ARTIST_MAX_TRANSCRIPT_CHARS") or "").strip()
-    try:
-        max_chars = int(raw_chars) if raw_chars else 30_000
-    except ValueError:
-        max_chars = 30_000
-
     # Parse strategy with validation
-    strategy = (os.environ.get("YT_ARTIST_SUMMARIZE_STRATEGY") or "auto").strip().lower()
-    if strategy not in ("auto", "truncate", "map-reduce", "refine"):
+    strategy = _env("YT_ARTIST_SUMMARIZE_STRATEGY", "auto").lower()
+    if strategy not in _STRATEGIES:
         strategy = "auto"
 
     return AppConfig(
-        log_level=(os.environ.get("YT_ARTIST_LOG_LEVEL") or "INFO").strip().upper(),
-        data_dir_env=(os.environ.get("YT_ARTIST_DATA_DIR") or "").strip(),
-        db_env=(os.environ.get("YT_ARTIST_DB") or "").strip(),
-        default_prompt=(os.environ.get("YT_ARTIST_DEFAULT_PROMPT") or "").strip() or "default",
-        max_transcript_chars=max_chars,
+        log_level=_env("YT_ARTIST_LOG_LEVEL", "INFO").upper(),
+        data_dir_env=_env("YT_ARTIST_DATA_DIR"),
+        db_env=_env("YT_ARTIST_DB"),
+        default_prompt=_env("YT_ARTIST_DEFAULT_PROMPT") or "default",
+        max_transcript_chars=_parse_int(_env("YT_ARTIST_MAX_TRANSCRIPT_CHARS"), 30_000, min_value=1),
         summarize_strategy=strategy,
+        prewarm_about=_env("YT_ARTIST_PREWARM_ABOUT").lower() in ("1", "true", "yes"),
     )
@@ -2,7 +2,8 @@
 
 Produces chunked JSON (per-artist, N videos per file) or flat CSV tables.
 Each JSON chunk is self-contained (includes artist metadata + prompts).
-Uses stdlib only — zero external dependencies.
+Uses stdlib only; orjson (``pip install yt-artist[export]``) speeds up JSON
+encoding when installed.
 """
 
 from __future__ import annotations
@@ -12,17 +13,32 @@ import json
 import logging
 import re
 import zipfile
+from collections import Counter, deque
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from yt_artist import __version__
-from yt_artist.storage import Storage
+from yt_artist.storage import Storage, VideoRow
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
 
 log = logging.getLogger("yt_artist.exporter")
 
 EXPORT_VERSION = 1
 DEFAULT_CHUNK_SIZE = 50
+# zlib level for --zip. Transcript JSON/CSV is highly redundant text: level 1
+# gets close to level 6's ratio at a fraction of the CPU.
+DEFAULT_COMPRESS_LEVEL = 1
+# Threads that encode/write JSON chunks while the main thread reads the next
+# chunk from the DB. zlib and file writes release the GIL, so --zip exports
+# deflate in parallel. Also caps the chunks held in memory awaiting a writer.
+_CHUNK_WRITERS = 4
 
 
 # ---------------------------------------------------------------------------
@@ -30,9 +46,13 @@ DEFAULT_CHUNK_SIZE = 50
 # ---------------------------------------------------------------------------
 
 
+# Anything but word chars, "@" and "-" is replaced in export directory names.
+_UNSAFE_DIRNAME_RE = re.compile(r"[^\w@\-]")
+
+
 def _sanitize_dirname(name: str) -> str:
     """Replace filesystem-unsafe chars in *name*."""
-    return re.sub(r"[^\w@\-]", "_", name).strip("_") or "unknown"
+    return _UNSAFE_DIRNAME_RE.sub("_", name).strip("_") or "unknown"
 
 
 def _now_iso() -> str:
@@ -47,21 +67,57 @@ def _make_export_dir(base_dir: Path, timestamp: str | None = None) -> Path:
     return out
 
 
-def _zip_file(path: Path) -> Path:
+def _zip_file(path: Path, compress_level: int = DEFAULT_COMPRESS_LEVEL) -> Path:
     """Compress *path* into a ``.zip``, delete original, return zip path."""
     zip_path = path.with_suffix(path.suffix + ".zip")
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=compress_level) as zf:
         zf.write(path, arcname=path.name)
     path.unlink()
     return zip_path
 
 
-def _write_json(path: Path, data: Any) -> None:
-    """Write *data* as pretty-printed JSON to *path*."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, default=str, indent=2, ensure_ascii=False)
-        f.write("\n")
+def _json_bytes(data: Any) -> bytes:
+    """Serialize *data* as pretty-printed UTF-8 JSON with a trailing newline.
+
+    Uses orjson when installed, which encodes straight to bytes, else
+    ``json.dumps`` (one string, not ``json.dump``'s per-token writes). Both give
+    equivalent JSON in the same indented layout, though not always identical
+    bytes (float formatting differs). Values orjson rejects, such as integers
+    beyond 64 bits, fall back to ``json``.
+    """
+    if _orjson is not None:
+        opts = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS | _orjson.OPT_APPEND_NEWLINE
+        try:
+            return _orjson.dumps(data, default=str, option=opts)
+        except _orjson.JSONEncodeError:
+            log.debug("orjson could not encode export data; using json", exc_info=True)
+    return (json.dumps(data, default=str, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _write_json(path: Path, data: Any) -> int:
+    """Write *data* as pretty-printed JSON to *path* (directory must exist) in a single write.
+
+    Returns the number of bytes written (the file size, without a ``stat()``).
+    """
+    with open(path, "wb") as f:
+        return f.write(_json_bytes(data))
+
+
+def _write_json_zip(
+    zip_path: Path,
+    arcname: str,
+    data: Any,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+) -> int:
+    """Write *data* as JSON straight into a new ``.zip`` (no temp file on disk).
+
+    Returns the archive size in bytes, taken from the file position after the
+    central directory is written (no ``stat()``).
+    """
+    with open(zip_path, "wb") as raw:
+        with zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED, compresslevel=compress_level) as zf:
+            zf.writestr(arcname, _json_bytes(data))
+        return raw.tell()
 
 
 def _file_size(path: Path) -> int:
@@ -132,6 +188,21 @@ def _build_video_entry(
 # ---------------------------------------------------------------------------
 
 
+def _emit_chunk(
+    artist_dir: Path,
+    filename: str,
+    chunk_data: dict[str, Any],
+    compress: bool,
+    compress_level: int,
+) -> tuple[Path, int]:
+    """Write one chunk (zipped if *compress*) under *artist_dir*; return ``(path, size)``."""
+    if compress:
+        filepath = artist_dir / f"{filename}.zip"
+        return filepath, _write_json_zip(filepath, filename, chunk_data, compress_level)
+    filepath = artist_dir / filename
+    return filepath, _write_json(filepath, chunk_data)
+
+
 def export_json(
     storage: Storage,
     output_dir: Path,
@@ -140,96 +211,107 @@ def export_json(
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     include_vtt: bool = False,
     compress: bool = False,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
 ) -> dict[str, Any]:
-    """Export data as chunked JSON files.  Returns manifest dict."""
+    """Export data as chunked JSON files.  Returns manifest dict.
+
+    DB reads stay on the calling thread, in one read snapshot; encoding and
+    writing each chunk is handed to a small thread pool (at most
+    ``_CHUNK_WRITERS`` chunks pending).
+    """
     export_dir = _make_export_dir(output_dir)
     exported_at = _now_iso()
-    all_prompts = {p["id"]: dict(p) for p in storage.list_prompts()}
     file_sizes: dict[str, int] = {}
     artist_stats: list[dict[str, Any]] = []
-
-    artists = [storage.get_artist(artist_id)] if artist_id else storage.list_artists()
-    artists = [a for a in artists if a]  # filter None
-
-    for artist in artists:
-        aid = artist["id"]
-        videos = storage.list_videos(artist_id=aid)
-        safe_name = _sanitize_dirname(aid)
-        artist_dir = export_dir / safe_name
-        artist_dir.mkdir(parents=True, exist_ok=True)
-
-        n_transcripts = 0
-        n_summaries = 0
-        total_chunks = max(1, (len(videos) + chunk_size - 1) // chunk_size)
-
-        for chunk_num in range(total_chunks):
-            start = chunk_num * chunk_size
-            chunk_videos = videos[start : start + chunk_size]
-            if not chunk_videos:
-                continue
-
-            chunk_ids = [v["id"] for v in chunk_videos]
-            transcripts_map = storage.get_transcripts_for_videos(chunk_ids)
-            summaries_map = storage.get_summaries_for_videos(chunk_ids)
-
-            video_entries = []
-            chunk_prompt_ids: set[str] = set()
-            for v in chunk_videos:
-                vid = v["id"]
-                entry = _build_video_entry(
-                    v,
-                    transcripts_map.get(vid),
-                    summaries_map.get(vid, []),
-                    include_vtt=include_vtt,
-                )
-                video_entries.append(entry)
-                if entry["transcript"]:
-                    n_transcripts += 1
-                for s in entry["summaries"]:
-                    n_summaries += 1
-                    chunk_prompt_ids.add(s["prompt_id"])
-
-            chunk_prompts = [all_prompts[pid] for pid in sorted(chunk_prompt_ids) if pid in all_prompts]
-
-            chunk_data = {
-                "export_version": EXPORT_VERSION,
-                "exported_at": exported_at,
-                "yt_artist_version": __version__,
-                "artist": {
-                    "id": artist["id"],
-                    "name": artist["name"],
-                    "channel_url": artist["channel_url"],
-                    "created_at": artist.get("created_at", ""),
-                    "about": artist.get("about"),
-                },
-                "prompts": chunk_prompts,
-                "chunk": {
-                    "number": chunk_num + 1,
-                    "total_chunks": total_chunks,
-                    "video_count": len(video_entries),
-                },
-                "videos": video_entries,
-            }
-
-            filename = f"{safe_name}_{chunk_num + 1:03d}.json"
-            filepath = artist_dir / filename
-            _write_json(filepath, chunk_data)
-
-            if compress:
-                filepath = _zip_file(filepath)
-
-            rel = str(filepath.relative_to(export_dir))
-            file_sizes[rel] = _file_size(filepath)
-
-        artist_stats.append(
-            {
-                "id": aid,
-                "videos": len(videos),
-                "transcripts": n_transcripts,
-                "summaries": n_summaries,
-                "chunks": total_chunks if videos else 0,
-            }
-        )
+    pending: deque[Future[tuple[Path, int]]] = deque()
+
+    def _collect(fut: Future[tuple[Path, int]]) -> None:
+        filepath, size = fut.result()
+        file_sizes[str(filepath.relative_to(export_dir))] = size
+
+    with storage.read_snapshot(), ThreadPoolExecutor(max_workers=_CHUNK_WRITERS) as writers:
+        # list_prompts() is ORDER BY id, so iterating this dict yields prompts sorted by id.
+        all_prompts = {p["id"]: p for p in storage.list_prompts()}
+        artists = [storage.get_artist(artist_id)] if artist_id else storage.list_artists()
+        artists = [a for a in artists if a]  # filter None
+
+        for artist in artists:
+            aid = artist["id"]
+            videos = storage.list_videos(artist_id=aid)
+            safe_name = _sanitize_dirname(aid)
+            artist_dir = export_dir / safe_name
+            artist_dir.mkdir(parents=True, exist_ok=True)
+
+            n_transcripts = 0
+            n_summaries = 0
+            total_chunks = max(1, (len(videos) + chunk_size - 1) // chunk_size)
+
+            for chunk_num in range(total_chunks):
+                start = chunk_num * chunk_size
+                chunk_videos = videos[start : start + chunk_size]
+                if not chunk_videos:
+                    continue
+
+                chunk_ids = [v["id"] for v in chunk_videos]
+                transcripts_map = storage.get_transcripts_for_videos(chunk_ids)
+                summaries_map = storage.get_summaries_for_videos(chunk_ids)
+
+                video_entries = []
+                chunk_prompt_ids: set[str] = set()
+                for v in chunk_videos:
+                    vid = v["id"]
+                    entry = _build_video_entry(
+                        v,
+                        transcripts_map.get(vid),
+                        summaries_map.get(vid, []),
+                        include_vtt=include_vtt,
+                    )
+                    video_entries.append(entry)
+                    if entry["transcript"]:
+                        n_transcripts += 1
+                    for s in entry["summaries"]:
+                        n_summaries += 1
+                        chunk_prompt_ids.add(s["prompt_id"])
+
+                chunk_prompts = [p for pid, p in all_prompts.items() if pid in chunk_prompt_ids]
+
+                chunk_data = {
+                    "export_version": EXPORT_VERSION,
+                    "exported_at": exported_at,
+                    "yt_artist_version": __version__,
+                    "artist": {
+                        "id": artist["id"],
+                        "name": artist["name"],
+                        "channel_url": artist["channel_url"],
+                        "created_at": artist.get("created_at", ""),
+                        "about": artist.get("about"),
+                    },
+                    "prompts": chunk_prompts,
+                    "chunk": {
+                        "number": chunk_num + 1,
+                        "total_chunks": total_chunks,
+                        "video_count": len(video_entries),
+                    },
+                    "videos": video_entries,
+                }
+
+                filename = f"{safe_name}_{chunk_num + 1:03d}.json"
+                pending.append(writers.submit(_emit_chunk, artist_dir, filename, chunk_data, compress, compress_level))
+                if len(pending) > _CHUNK_WRITERS:
+                    _collect(pending.popleft())
+
+            artist_stats.append(
+                {
+                    "id": aid,
+                    "videos": len(videos),
+                    "transcripts": n_transcripts,
+                    "summaries": n_summaries,
+                    "chunks": total_chunks if videos else 0,
+                }
+            )
+
+        while pending:
+            _collect(pending.popleft())
 
     manifest = {
         "export_version": EXPORT_VERSION,
@@ -244,6 +326,7 @@ def export_json(
             "include_vtt": include_vtt,
             "chunk_size": chunk_size,
             "compress": compress,
+            "compress_level": compress_level,
         },
     }
     _write_json(export_dir / "manifest.json", manifest)
@@ -274,17 +357,40 @@ _SUMMARY_FIELDS = [
 _PROMPT_FIELDS = ["id", "name", "template"]
 
 
+# Write buffer for CSV tables: text files default to ~8 KiB blocks, so a
+# large transcripts.csv would otherwise take one write() per 8 KiB.
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _open_csv(path: Path) -> TextIO:
+    """Open *path* for ``csv.writer`` with a 1 MiB write buffer."""
+    return open(path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE)
+
+
+def _csv_values(row: Mapping[str, Any], fieldnames: list[str]) -> list[Any]:
+    """Project *row* onto *fieldnames* ("" for missing keys, extras ignored).
+
+    Storage rows are already dicts, so they are passed through without copying.
+
+    Same output as ``csv.DictWriter(extrasaction="ignore")`` without its
+    per-row wrapper and extras check.
+    """
+    return [row.get(k, "") for k in fieldnames]
+
+
 def _write_csv(
     path: Path,
     fieldnames: list[str],
-    rows: list[dict[str, Any]],
+    rows: Iterable[Mapping[str, Any]],
 ) -> None:
-    """Write rows as CSV with header."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(rows)
+    """Write rows as CSV with header (directory must exist).
+
+    *rows* is consumed lazily, so callers can pass a generator.
+    """
+    with _open_csv(path) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(_csv_values(r, fieldnames) for r in rows)
 
 
 def export_csv(
@@ -294,91 +400,94 @@ def export_csv(
     artist_id: str | None = None,
     include_vtt: bool = False,
     compress: bool = False,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
 ) -> dict[str, Any]:
-    """Export data as flat CSV tables.  Returns manifest dict."""
+    """Export data as flat CSV tables.  Returns manifest dict.
+
+    All tables are read inside one read snapshot, so they agree with each other.
+    """
     export_dir = _make_export_dir(output_dir)
     exported_at = _now_iso()
     file_sizes: dict[str, int] = {}
 
-    # Artists
-    if artist_id:
-        a = storage.get_artist(artist_id)
-        artists = [a] if a else []
-    else:
-        artists = storage.list_artists()
-
-    artists_path = export_dir / "artists.csv"
-    _write_csv(artists_path, _ARTIST_FIELDS, [dict(a) for a in artists])
-    if compress:
-        artists_path = _zip_file(artists_path)
-    file_sizes[artists_path.name] = _file_size(artists_path)
-
-    # Videos
-    all_videos: list[dict[str, Any]] = []
-    for a in artists:
-        all_videos.extend(dict(v) for v in storage.list_videos(artist_id=a["id"]))
-    videos_path = export_dir / "videos.csv"
-    _write_csv(videos_path, _VIDEO_FIELDS, all_videos)
-    if compress:
-        videos_path = _zip_file(videos_path)
-    file_sizes[videos_path.name] = _file_size(videos_path)
-
-    # Batch-fetch transcripts and summaries (eliminates N+1 per-video queries)
-    all_video_ids = [v["id"] for v in all_videos]
-    transcripts_map = storage.get_transcripts_for_videos(all_video_ids)
-    summaries_map = storage.get_summaries_for_videos(all_video_ids)
-
-    # Transcripts
-    t_fields = _TRANSCRIPT_FIELDS_VTT if include_vtt else _TRANSCRIPT_FIELDS
-    transcripts_path = export_dir / "transcripts.csv"
-    transcripts_path.parent.mkdir(parents=True, exist_ok=True)
-    n_transcripts = 0
-    with open(transcripts_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=t_fields, extrasaction="ignore")
-        writer.writeheader()
-        for v in all_videos:
-            t = transcripts_map.get(v["id"])
-            if t:
-                writer.writerow(dict(t))
-                n_transcripts += 1
-    if compress:
-        transcripts_path = _zip_file(transcripts_path)
-    file_sizes[transcripts_path.name] = _file_size(transcripts_path)
-
-    # Summaries
-    summaries_path = export_dir / "summaries.csv"
-    n_summaries = 0
-    with open(summaries_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=_SUMMARY_FIELDS, extrasaction="ignore")
-        writer.writeheader()
-        for v in all_videos:
-            for s in summaries_map.get(v["id"], []):
-                writer.writerow(dict(s))
-                n_summaries += 1
-    if compress:
-        summaries_path = _zip_file(summaries_path)
-    file_sizes[summaries_path.name] = _file_size(summaries_path)
-
-    # Prompts
-    prompts_path = export_dir / "prompts.csv"
-    _write_csv(prompts_path, _PROMPT_FIELDS, [dict(p) for p in storage.list_prompts()])
-    if compress:
-        prompts_path = _zip_file(prompts_path)
-    file_sizes[prompts_path.name] = _file_size(prompts_path)
-
-    # Artist stats (reuse batch-fetched data — no extra queries)
-    artist_stats = []
-    for a in artists:
-        aid = a["id"]
-        vids = [v for v in all_videos if v["artist_id"] == aid]
-        artist_stats.append(
-            {
-                "id": aid,
-                "videos": len(vids),
-                "transcripts": sum(1 for v in vids if v["id"] in transcripts_map),
-                "summaries": sum(len(summaries_map.get(v["id"], [])) for v in vids),
-            }
-        )
+    with storage.read_snapshot():
+        # Artists
+        if artist_id:
+            a = storage.get_artist(artist_id)
+            artists = [a] if a else []
+        else:
+            artists = storage.list_artists()
+
+        artists_path = export_dir / "artists.csv"
+        _write_csv(artists_path, _ARTIST_FIELDS, artists)
+        if compress:
+            artists_path = _zip_file(artists_path, compress_level)
+        file_sizes[artists_path.name] = _file_size(artists_path)
+
+        # Videos
+        all_videos: list[VideoRow] = []
+        video_counts: dict[str, int] = {}
+        for a in artists:
+            vids = storage.list_videos(artist_id=a["id"])
+            video_counts[a["id"]] = len(vids)
+            all_videos.extend(vids)
+        videos_path = export_dir / "videos.csv"
+        _write_csv(videos_path, _VIDEO_FIELDS, all_videos)
+        if compress:
+            videos_path = _zip_file(videos_path, compress_level)
+        file_sizes[videos_path.name] = _file_size(videos_path)
+
+        # Stream transcripts and summaries one IN-batch at a time (no N+1 queries,
+        # and no whole-table maps of transcript text held in memory).
+        all_video_ids = [v["id"] for v in all_videos]
+        artist_of = {v["id"]: v["artist_id"] for v in all_videos}
+        transcript_counts: Counter[str] = Counter()
+        summary_counts: Counter[str] = Counter()
+
+        # Transcripts
+        t_fields = _TRANSCRIPT_FIELDS_VTT if include_vtt else _TRANSCRIPT_FIELDS
+        transcripts_path = export_dir / "transcripts.csv"
+        with _open_csv(transcripts_path) as f:
+            writer = csv.writer(f)
+            writer.writerow(t_fields)
+            for t in storage.iter_transcripts_for_videos(all_video_ids):
+                writer.writerow(_csv_values(t, t_fields))
+                transcript_counts[artist_of[t["video_id"]]] += 1
+        if compress:
+            transcripts_path = _zip_file(transcripts_path, compress_level)
+        file_sizes[transcripts_path.name] = _file_size(transcripts_path)
+
+        # Summaries
+        summaries_path = export_dir / "summaries.csv"
+        with _open_csv(summaries_path) as f:
+            writer = csv.writer(f)
+            writer.writerow(_SUMMARY_FIELDS)
+            for s in storage.iter_summaries_for_videos(all_video_ids):
+                writer.writerow(_csv_values(s, _SUMMARY_FIELDS))
+                summary_counts[artist_of[s["video_id"]]] += 1
+        if compress:
+            summaries_path = _zip_file(summaries_path, compress_level)
+        file_sizes[summaries_path.name] = _file_size(summaries_path)
+
+        # Prompts
+        prompts_path = export_dir / "prompts.csv"
+        _write_csv(prompts_path, _PROMPT_FIELDS, storage.list_prompts())
+        if compress:
+            prompts_path = _zip_file(prompts_path, compress_level)
+        file_sizes[prompts_path.name] = _file_size(prompts_path)
+
+        # Artist stats (counted while streaming — no extra queries)
+        artist_stats = []
+        for a in artists:
+            aid = a["id"]
+            artist_stats.append(
+                {
+                    "id": aid,
+                    "videos": video_counts[aid],
+                    "transcripts": transcript_counts[aid],
+                    "summaries": summary_counts[aid],
+                }
+            )
 
     manifest = {
         "export_version": EXPORT_VERSION,
@@ -392,6 +501,7 @@ def export_csv(
         "options": {
             "include_vtt": include_vtt,
             "compress": compress,
+            "compress_level": compress_level,
         },
     }
     _write_json(export_dir / "manifest.json", manifest)
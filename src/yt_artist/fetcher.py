@@ -2,18 +2,44 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import subprocess
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from yt_artist.rate_limit import log_request
 from yt_artist.storage import Storage
+from yt_artist.transcriber import extract_video_id
+from yt_artist.yt_dlp_util import video_url_for
 from yt_artist.yt_dlp_util import yt_dlp_cmd as _yt_dlp_cmd
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
 log = logging.getLogger("yt_artist.fetcher")
 
 
+def _loads(raw: Union[str, bytes]) -> Any:
+    """Parse one yt-dlp JSON document; orjson when installed, else stdlib.
+
+    orjson is strict about NaN/Infinity and >64-bit integers, which Python's
+    encoder (and so yt-dlp) can emit; such documents fall back to ``json``.
+    Raises ValueError when neither parser accepts *raw*.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except ValueError:
+            pass
+    return json.loads(raw)
+
+
 def _run_yt_dlp_flat_playlist_json(channel_url: str, storage: Optional[Storage] = None) -> List[Dict[str, Any]]:
     """Run yt-dlp --flat-playlist -j and return list of parsed JSON entries (id, url, title)."""
     cmd = _yt_dlp_cmd() + [
@@ -23,40 +49,37 @@ def _run_yt_dlp_flat_playlist_json(channel_url: str, storage: Optional[Storage]
         channel_url,
     ]
     try:
+        # Raw bytes: a large channel dumps tens of MB of NDJSON, and both
+        # parsers take bytes, so skip decoding the whole buffer to str first.
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=120,
         )
         result.check_returncode()
     except subprocess.TimeoutExpired:
         raise RuntimeError(f"yt-dlp timed out fetching playlist for {channel_url}")
     except subprocess.CalledProcessError as e:
-        stderr = (e.stderr or "").strip()
+        stderr = (e.stderr or b"").decode("utf-8", errors="replace").strip()
         raise RuntimeError(f"yt-dlp failed (exit {e.returncode}) for {channel_url}: {stderr}") from e
-    # Log request for rate-limit monitoring
+    # Log request for rate-limit monitoring (best-effort)
     if storage is not None:
-        try:
-            from yt_artist.rate_limit import log_request
-
+        with contextlib.suppress(Exception):
             log_request(storage, "playlist")
-        except Exception:  # noqa: BLE001
-            pass  # best-effort
     entries: List[Dict[str, Any]] = []
-    for line in result.stdout.strip().splitlines():
+    for line in result.stdout.splitlines():
         line = line.strip()
         if not line:
             continue
         try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
-            log.debug("Skipping unparseable yt-dlp line: %.100s", line)
+            obj = _loads(line)
+        except ValueError:
+            log.debug("Skipping unparseable yt-dlp line: %.100r", line)
             continue
         video_id = obj.get("id")
         if not video_id:
             continue
-        url = obj.get("url") or f"https://www.youtube.com/watch?v={video_id}"
+        url = obj.get("url") or video_url_for(video_id)
         title = obj.get("title") or ""
         entry = {"id": video_id, "url": url, "title": title}
         for key in ("channel_id", "channel", "uploader_id", "uploader"):
@@ -104,17 +127,13 @@ def _video_metadata(video_url: str, storage: Optional[Storage] = None) -> Dict[s
     except subprocess.CalledProcessError as e:
         stderr = (e.stderr or "").strip()
         raise RuntimeError(f"yt-dlp failed (exit {e.returncode}) for {video_url}: {stderr}") from e
-    # Log request for rate-limit monitoring
+    # Log request for rate-limit monitoring (best-effort)
     if storage is not None:
-        try:
-            from yt_artist.rate_limit import log_request
-
+        with contextlib.suppress(Exception):
             log_request(storage, "metadata")
-        except Exception:  # noqa: BLE001
-            pass  # best-effort
     try:
-        return json.loads(result.stdout.strip())
-    except json.JSONDecodeError as e:
+        return _loads(result.stdout.strip())
+    except ValueError as e:
         raise RuntimeError(f"yt-dlp returned non-JSON output for {video_url}") from e
 
 
@@ -162,8 +181,6 @@ def ensure_artist_and_video_for_video_url(
     Returns (artist_id, video_id).
     """
     # Fast path: extract video_id from URL locally (no subprocess) and check DB.
-    from yt_artist.transcriber import extract_video_id
-
     try:
         vid_candidate = extract_video_id(video_url)
         video = storage.get_video(vid_candidate)
@@ -191,7 +208,7 @@ def ensure_artist_and_video_for_video_url(
         )
         log.info("Auto-created artist %s (%s) from video metadata.", artist_id, artist_name)
     if not video:
-        url = video_url if video_url.startswith("http") else f"https://www.youtube.com/watch?v={video_id}"
+        url = video_url if video_url.startswith(("http://", "https://")) else video_url_for(video_id)
         storage.upsert_video(
             video_id=video_id,
             artist_id=artist_id,
@@ -211,8 +228,52 @@ def fetch_channel(
     Fetch all video URLs for a channel; write urllist markdown and upsert Artist + Video rows.
     Returns (urllist_path, video_count).
     """
-    data_dir = Path(data_dir)
     entries = _run_yt_dlp_flat_playlist_json(channel_url, storage=storage)
+    return _save_channel_entries(channel_url, entries, storage, data_dir)
+
+
+def fetch_channels(
+    channel_urls: Sequence[str],
+    storage: Storage,
+    data_dir: Union[str, Path],
+    *,
+    concurrency: int = 1,
+) -> Dict[str, Union[Tuple[str, int], Exception]]:
+    """
+    Fetch several channels like :func:`fetch_channel`, listing up to *concurrency* at once.
+
+    The yt-dlp playlist listings (network-bound subprocesses) run in worker threads
+    without DB access; the request log, urllist files and DB rows are written on the
+    calling thread as each listing completes, so SQLite sees one writer. Returns
+    ``{channel_url: (urllist_path, video_count) or the exception}`` in *channel_urls*
+    order; one channel failing does not stop the others.
+    """
+    urls = list(dict.fromkeys(channel_urls))  # de-duplicate, keep order
+    results: Dict[str, Union[Tuple[str, int], Exception]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(_run_yt_dlp_flat_playlist_json, url): url for url in urls}
+        for fut in as_completed(futures):
+            url = futures[fut]
+            try:
+                entries = fut.result()
+                # Log request for rate-limit monitoring (best-effort)
+                with contextlib.suppress(Exception):
+                    log_request(storage, "playlist")
+                results[url] = _save_channel_entries(url, entries, storage, data_dir)
+            except Exception as exc:  # noqa: BLE001
+                log.warning("Fetching %s failed: %s", url, exc)
+                results[url] = exc
+    return {url: results[url] for url in urls}
+
+
+def _save_channel_entries(
+    channel_url: str,
+    entries: List[Dict[str, Any]],
+    storage: Storage,
+    data_dir: Union[str, Path],
+) -> Tuple[str, int]:
+    """Write the urllist markdown and upsert Artist + Video rows for one fetched channel."""
+    data_dir = Path(data_dir)
     if not entries:
         raise ValueError(f"No video entries returned for {channel_url}")
 
@@ -221,10 +282,9 @@ def fetch_channel(
     full_path = data_dir / urllist_path
     full_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines = [f"# {artist_name}\n", f"# Channel: {channel_url}\n\n"]
-    for e in entries:
-        lines.append(f"- {e['url']}  ({e['title']})\n")
-    full_path.write_text("".join(lines), encoding="utf-8")
+    header = f"# {artist_name}\n# Channel: {channel_url}\n\n"
+    body = "".join([f"- {e['url']}  ({e['title']})\n" for e in entries])
+    full_path.write_text(header + body, encoding="utf-8")
 
     # Batch all DB writes in a single transaction (one connection, one commit).
     with storage.transaction() as conn:
@@ -239,18 +299,22 @@ def fetch_channel(
             """,
             (artist_id, artist_name, channel_url, urllist_path),
         )
-        for e in entries:
-            conn.execute(
-                """
-                INSERT INTO videos (id, artist_id, url, title)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    artist_id = excluded.artist_id,
-                    url = excluded.url,
-                    title = excluded.title,
-                    fetched_at = datetime('now')
-                """,
-                (e["id"], artist_id, e["url"], e["title"] or ""),
-            )
+        # Re-fetching a channel mostly returns rows we already have; the WHERE
+        # leaves unchanged rows alone so a refresh only rewrites what changed.
+        conn.executemany(
+            """
+            INSERT INTO videos (id, artist_id, url, title)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                artist_id = excluded.artist_id,
+                url = excluded.url,
+                title = excluded.title,
+                fetched_at = datetime('now')
+            WHERE videos.artist_id IS NOT excluded.artist_id
+               OR videos.url IS NOT excluded.url
+               OR videos.title IS NOT excluded.title
+            """,
+            [(e["id"], artist_id, e["url"], e["title"] or "") for e in entries],
+        )
 
     return (urllist_path, len(entries))
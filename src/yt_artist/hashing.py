@@ -2,7 +2,18 @@
 
 import hashlib
 
+# Texts longer than this (in characters) are encoded and hashed slice by slice,
+# so a multi-MB transcript never needs a second full-size UTF-8 copy in memory.
+_HASH_SLICE = 1 << 16
+
 
 def content_hash(text: str) -> str:
     """Return hex SHA-256 digest of *text* (UTF-8 encoded)."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    if len(text) <= _HASH_SLICE:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    # Slicing a str splits between code points, so the concatenated slice
+    # encodings are byte-for-byte the whole text's encoding: same digest.
+    h = hashlib.sha256()
+    for i in range(0, len(text), _HASH_SLICE):
+        h.update(text[i : i + _HASH_SLICE].encode("utf-8"))
+    return h.hexdigest()
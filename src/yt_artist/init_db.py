@@ -1,8 +1,11 @@
 """Initialize or ensure SQLite schema exists."""
 
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def get_schema_sql() -> str:
+    """Return the bundled schema.sql (read once per process)."""
     path = Path(__file__).parent / "schema.sql"
     return path.read_text()
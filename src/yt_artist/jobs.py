@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import logging
 import os
+import secrets
 import signal
 import subprocess
 import sys
 import time
-import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -24,6 +24,11 @@ EST_TRANSCRIBE_PER_VIDEO = 8.0  # yt-dlp subtitle fetch + processing
 EST_SUMMARIZE_PER_VIDEO = 15.0  # LLM call + DB write
 EST_INTER_VIDEO_DELAY = 2.0  # Default inter-video delay
 
+# attach_job: log poll interval, and how often to re-read job status from the
+# DB while the worker PID is still alive (a dead PID triggers an immediate check).
+_ATTACH_POLL_INTERVAL = 0.5
+_ATTACH_STATUS_INTERVAL = 5.0
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -32,7 +37,7 @@ EST_INTER_VIDEO_DELAY = 2.0  # Default inter-video delay
 
 def _generate_job_id() -> str:
     """Generate a 12-hex-char unique job ID."""
-    return uuid.uuid4().hex[:12]
+    return secrets.token_hex(6)
 
 
 def jobs_dir(data_dir: Path) -> Path:
@@ -313,22 +318,38 @@ def attach_job(storage: Storage, job_id: str) -> None:
             for line in f:
                 sys.stdout.write(line)
 
-            # Tail for new content while job is running
+            # Tail for new content while job is running.  Liveness is a cheap
+            # signal-0 check each idle poll; the DB is only consulted every
+            # few seconds or once the worker process is gone.  A pid <= 0 means
+            # the worker hasn't been launched yet (create_job stores -1 until
+            # Popen returns), so keep polling and pick up the real pid later.
+            pid = job["pid"]
+            next_status_check = 0.0
             while True:
                 line = f.readline()
                 if line:
                     sys.stdout.write(line)
                     sys.stdout.flush()
-                else:
-                    # Check if job is still running
+                    continue
+                now = time.monotonic()
+                dead = pid > 0 and not _is_pid_alive(pid)
+                if now >= next_status_check or dead:
                     current = get_job(storage, job["id"])
-                    if current and current["status"] != "running":
+                    status = current["status"] if current else "unknown"
+                    if current and current["pid"] != pid:
+                        pid = current["pid"]
+                        dead = pid > 0 and not _is_pid_alive(pid)
+                    if status == "running" and dead:
+                        _mark_job_stale(storage, job["id"])
+                        status = "failed"
+                    if status != "running":
                         remaining = f.read()
                         if remaining:
                             sys.stdout.write(remaining)
-                        sys.stderr.write(f"\n--- Job {job['id'][:8]} finished (status: {current['status']})\n")
+                        sys.stderr.write(f"\n--- Job {job['id'][:8]} finished (status: {status})\n")
                         break
-                    time.sleep(0.5)
+                    next_status_check = now + _ATTACH_STATUS_INTERVAL
+                time.sleep(_ATTACH_POLL_INTERVAL)
     except KeyboardInterrupt:
         sys.stderr.write(f"\n--- Detached from job {job['id'][:8]} (still running in background)\n")
 
@@ -409,7 +430,5 @@ def cleanup_old_jobs(storage: Storage, max_age_days: int = 7) -> int:
     """Remove finished jobs (+ log files) older than max_age_days.  Returns count removed."""
     rows = storage.delete_old_jobs(max_age_days=max_age_days)
     for row in rows:
-        log_path = Path(row["log_file"])
-        if log_path.exists():
-            log_path.unlink()
+        Path(row["log_file"]).unlink(missing_ok=True)
     return len(rows)
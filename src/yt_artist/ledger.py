@@ -12,9 +12,12 @@ from yt_artist.storage import Storage
 log = logging.getLogger("yt_artist.ledger")
 
 
+_ISO_FMT = "%Y-%m-%dT%H:%M:%SZ"
+
+
 def _now_iso() -> str:
     """Return current UTC timestamp in ISO-8601 format."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return datetime.now(timezone.utc).strftime(_ISO_FMT)
 
 
 class WorkTimer:
@@ -29,12 +32,17 @@ class WorkTimer:
     """
 
     def __init__(self) -> None:
-        self.started_at = _now_iso()
-        self._t0 = time.monotonic()
+        self._wall0 = time.time()
+        self._t0 = time.perf_counter_ns()
+
+    @property
+    def started_at(self) -> str:
+        """UTC ISO-8601 timestamp of timer creation (formatted on access)."""
+        return datetime.fromtimestamp(self._wall0, timezone.utc).strftime(_ISO_FMT)
 
     def elapsed_ms(self) -> int:
         """Return wall-clock milliseconds since timer was created."""
-        return int((time.monotonic() - self._t0) * 1000)
+        return (time.perf_counter_ns() - self._t0) // 1_000_000
 
 
 def record_operation(
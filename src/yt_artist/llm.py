@@ -5,15 +5,15 @@ from __future__ import annotations
 import logging
 import socket
 import time as _time
+from collections.abc import Iterator
 from typing import Any, Optional, Tuple
 from urllib.parse import urlparse
 
 from yt_artist.config import get_llm_config
 
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None  # type: ignore[misc, assignment]
+# Resolved on first get_client(): importing the openai SDK costs ~100s of ms,
+# which every CLI command would otherwise pay at startup.
+OpenAI: Any = None
 
 log = logging.getLogger("yt_artist.llm")
 
@@ -91,9 +91,12 @@ def get_client() -> Any:
     The client is recreated only when OPENAI_BASE_URL or OPENAI_API_KEY changes.
     This avoids TCP/TLS handshake overhead on every LLM call during bulk operations.
     """
-    global _cached_client, _cached_client_key
+    global OpenAI, _cached_client, _cached_client_key
     if OpenAI is None:
-        raise RuntimeError("openai package is required; install with: pip install openai")
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise RuntimeError("openai package is required; install with: pip install openai") from None
     base_url, api_key, _ = _resolve_config()
     key = (base_url, api_key)
     if _cached_client is not None and _cached_client_key == key:
@@ -132,17 +135,20 @@ def complete(
     *,
     model: Optional[str] = None,
     max_retries: int = _MAX_LLM_RETRIES,
+    timeout: Optional[float] = None,
 ) -> str:
     """
     Call chat completion with system and user messages.
     Uses OPENAI_MODEL or defaults to mistral for Ollama, gpt-4o-mini for OpenAI.
     Retries up to *max_retries* times on transient errors (429, 5xx, timeouts).
+    *timeout* (seconds) caps each attempt; default is the SDK's own timeout.
     Raises RuntimeError on persistent API errors so callers can handle gracefully.
     """
     client = get_client()
     model = model or get_llm_config().model
     backoff = _LLM_INITIAL_BACKOFF
     last_exc: Optional[Exception] = None
+    extra: dict = {"timeout": timeout} if timeout is not None else {}
 
     for attempt in range(max_retries + 1):
         try:
@@ -152,6 +158,7 @@ def complete(
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_content},
                 ],
+                **extra,
             )
             choice = resp.choices[0] if resp.choices else None
             if not choice or not getattr(choice, "message", None):
@@ -168,13 +175,59 @@ def complete(
                 backoff = min(backoff * 2, 30)
                 continue
             # Non-transient or retries exhausted
-            base_url, _, _ = _resolve_config()
-            if _is_ollama(base_url):
-                log.error("LLM API call failed (Ollama at %s): %s", base_url, exc)
-                raise RuntimeError(
-                    f"LLM API call failed. Is Ollama running? Start with: ollama serve\nError: {exc}"
-                ) from exc
-            log.error("LLM API call failed (%s): %s", base_url, exc)
-            raise RuntimeError(f"LLM API call failed ({base_url}): {exc}") from exc
+            raise _api_error(exc) from exc
     # Should not reach here, but just in case
     raise RuntimeError(f"LLM API call failed after {max_retries + 1} attempts: {last_exc}")
+
+
+def _api_error(exc: Exception) -> RuntimeError:
+    """Log *exc* and return an actionable RuntimeError (Ollama vs remote endpoint)."""
+    base_url, _, _ = _resolve_config()
+    if _is_ollama(base_url):
+        log.error("LLM API call failed (Ollama at %s): %s", base_url, exc)
+        return RuntimeError(f"LLM API call failed. Is Ollama running? Start with: ollama serve\nError: {exc}")
+    log.error("LLM API call failed (%s): %s", base_url, exc)
+    return RuntimeError(f"LLM API call failed ({base_url}): {exc}")
+
+
+def complete_stream(
+    system_prompt: str,
+    user_content: str,
+    *,
+    model: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Stream a chat completion, yielding text deltas as they arrive.
+    Callers that only need the start of the answer can stop early; closing the
+    generator closes the HTTP response so the connection goes back to the pool.
+    No retries (a partially consumed stream can't be replayed). Raises RuntimeError on API errors.
+    """
+    client = get_client()
+    model = model or get_llm_config().model
+    extra: dict = {"timeout": timeout} if timeout is not None else {}
+    try:
+        stream = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            stream=True,
+            **extra,
+        )
+    except Exception as exc:
+        raise _api_error(exc) from exc
+    try:
+        for chunk in stream:
+            choice = chunk.choices[0] if chunk.choices else None
+            delta = getattr(choice, "delta", None)
+            text = getattr(delta, "content", None)
+            if text:
+                yield text
+    except Exception as exc:
+        raise _api_error(exc) from exc
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,55 @@
+"""Exact-match LLM response cache: skip the round-trip when the same prompt was answered before."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from yt_artist.artist_about_cache import _SqliteTTLCache
+from yt_artist.hashing import content_hash
+from yt_artist.llm import complete, get_model_name
+
+log = logging.getLogger("yt_artist.llm_cache")
+
+DEFAULT_TTL = 30 * 86400  # seconds
+
+
+class LLMCache(_SqliteTTLCache):
+    """Completion store; can share the cache DB file with AboutCache under its own table."""
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__(path, "llm_cache")
+
+
+def llm_cache_key(system_prompt: str, user_content: str, model: Optional[str] = None) -> str:
+    """Return deterministic key for (model, system prompt, user content)."""
+    return content_hash(f"{get_model_name(model)}\x1f{system_prompt}\x1f{user_content}")
+
+
+def cached_complete(
+    system_prompt: str,
+    user_content: str,
+    *,
+    cache: Optional[LLMCache] = None,
+    model: Optional[str] = None,
+    complete_fn: Optional[Callable[..., str]] = None,
+    **kwargs: Any,
+) -> str:
+    """Like llm.complete(), but return a stored completion for an identical prompt.
+
+    *complete_fn* (default llm.complete) performs the actual call on a miss.
+    Without *cache* this is a plain *complete_fn* call. Empty completions are not stored.
+    """
+    complete_fn = complete_fn or complete
+    if cache is None:
+        return complete_fn(system_prompt, user_content, model=model, **kwargs)
+    key = llm_cache_key(system_prompt, user_content, model)
+    hit = cache.get(key)
+    if hit is not None:
+        log.debug("LLM cache hit (%s)", key[:12])
+        return hit
+    content = complete_fn(system_prompt, user_content, model=model, **kwargs)
+    if content:
+        cache.set(key, content, ttl=DEFAULT_TTL)
+    return content
@@ -37,6 +37,17 @@ def _get_data_dir() -> Path:
     return Path(cfg.data_dir_env or os.getcwd())
 
 
+def _start_about_prewarm() -> None:
+    """Background-fill the about cache for artists without about text (YT_ARTIST_PREWARM_ABOUT)."""
+    from yt_artist.artist_about_cache import AboutCache
+    from yt_artist.artist_prompt import prewarm
+    from yt_artist.llm_cache import LLMCache
+    from yt_artist.paths import cache_db_path
+
+    cache_path = cache_db_path(_get_data_dir())
+    prewarm(_get_storage().list_artists(), cache=AboutCache(cache_path), llm_cache=LLMCache(cache_path))
+
+
 def run_mcp_server() -> None:
     try:
         from mcp.server.fastmcp import FastMCP
@@ -92,8 +103,8 @@ def run_mcp_server() -> None:
             intent_override=intent,
             audience_override=audience,
         )
-        rows = storage.get_summaries_for_video(video_id)
-        content = next((r["content"] for r in rows if r["prompt_id"] == prompt_id), "")
+        row = storage.get_summary(video_id, prompt_id)
+        content = row["content"] if row else ""
         return {"summary_id": summary_id, "content": content}
 
     @mcp.tool()
@@ -153,6 +164,8 @@ def run_mcp_server() -> None:
             ]
         }
 
+    if get_app_config().prewarm_about:
+        _start_about_prewarm()
     mcp.run(transport="stdio")
 
 
@@ -52,3 +52,8 @@ def job_log_file(data_dir: Path, job_id: str) -> Path:
 def export_dir(data_dir: Path) -> Path:
     """Return base directory for export output."""
     return data_dir / "data" / "exports"
+
+
+def cache_db_path(data_dir: Path) -> Path:
+    """Return path of the on-disk cache DB (search/LLM results; safe to delete)."""
+    return data_dir / "data" / "cache.db"
@@ -65,9 +65,11 @@ def run_pipeline(
 ) -> PipelineResult:
     """Run transcribe→summarize→score pipeline with overlapping execution.
 
-    Producer: transcribe workers process *video_ids_to_transcribe*.
+    Producer: transcribe workers process *video_ids_to_transcribe*; each
+              successful transcript is handed to the summarize pool right away.
     Consumer: summarize workers process *video_ids_to_summarize* immediately,
-              plus poll for newly transcribed videos via *poll_fn*.
+              plus poll for newly transcribed videos via *poll_fn* (catches
+              transcripts written by other processes and anything missed).
     Scorer (optional): polls for summarized-but-unscored videos via *score_poll_fn*
               and runs *score_fn* on each.  Activated only when both are provided.
 
@@ -168,10 +170,9 @@ def run_pipeline(
     # -- producer: transcribe pool (blocking until all transcriptions done) ----
 
     with ThreadPoolExecutor(max_workers=transcribe_workers) as transcribe_pool:
-        transcribe_futures: dict = {}
+        transcribe_futures: List[Future] = []
         for i, vid in enumerate(video_ids_to_transcribe):
-            fut = transcribe_pool.submit(transcribe_fn, vid)
-            transcribe_futures[fut] = vid
+            transcribe_futures.append(transcribe_pool.submit(transcribe_fn, vid))
             if inter_delay > 0 and i < len(video_ids_to_transcribe) - 1:
                 time.sleep(inter_delay)
 
@@ -184,6 +185,15 @@ def run_pipeline(
                     result.transcribed += 1
             if transcribe_progress is not None:
                 transcribe_progress.tick("Pipeline:Transcribing", vid_id, error=err)
+            # Hand the fresh transcript straight to the summarize pool instead of
+            # waiting up to poll_interval for the poller to find it in the DB.
+            if not err:
+                with submitted_lock:
+                    hand_off = vid_id in all_summarizable and vid_id not in submitted
+                    if hand_off:
+                        submitted.add(vid_id)
+                if hand_off:
+                    _submit_summarize(vid_id)
 
     # -- signal producer done, wait for consumer to drain ----------------------
 
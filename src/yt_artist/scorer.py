@@ -470,8 +470,7 @@ def score_video_summary(
     timer = WorkTimer()
     effective_model = get_model_name(model) if not skip_llm else None
 
-    rows = storage.get_summaries_for_video(video_id)
-    summary_row = next((r for r in rows if r["prompt_id"] == prompt_id), None)
+    summary_row = storage.get_summary(video_id, prompt_id)
     if not summary_row:
         log.warning("No summary for video_id=%s prompt_id=%s", video_id, prompt_id)
         record_operation(
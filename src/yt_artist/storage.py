@@ -2,10 +2,11 @@
 
 import logging
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from yt_artist.init_db import get_schema_sql
 
@@ -17,6 +18,30 @@ log = logging.getLogger("yt_artist.storage")
 # well under the limit.
 _IN_BATCH_SIZE = 500
 
+# Stored in PRAGMA user_version once ensure_schema() has run the schema script
+# and every migration.  Bump it whenever schema.sql or a migration changes so
+# existing DBs re-run ensure_schema(); an up-to-date DB skips straight past it.
+# tests/test_storage.py fingerprints both and fails until the bump is made.
+_SCHEMA_VERSION = 1
+
+# How long a connection waits on a locked DB before raising "database is locked".
+_BUSY_TIMEOUT_MS = 10_000
+
+# Page cache for read_snapshot() connections (negative = KiB, so 64 MiB).
+_SNAPSHOT_CACHE_KIB = 65_536
+
+_UPSERT_PROMPT_SQL = """
+    INSERT INTO prompts (id, name, template, artist_component, video_component, intent_component, audience_component)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        template = excluded.template,
+        artist_component = excluded.artist_component,
+        video_component = excluded.video_component,
+        intent_component = excluded.intent_component,
+        audience_component = excluded.audience_component
+"""
+
 # ---------------------------------------------------------------------------
 # TypedDict row types — give callers type-safe access to dict keys.
 # Using total=False only where columns may be absent on older DBs.
@@ -153,12 +178,19 @@ class Storage:
             raise ValueError(
                 "Database path is empty. Set --db to a file path (e.g. ./yt_artist.db) or set the DB environment variable."
             )
+        # Per-thread connection pinned by read_snapshot(); None outside a snapshot.
+        self._local = threading.local()
 
     def _conn(self) -> sqlite3.Connection:
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = _dict_row
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA journal_mode = WAL")
+        # WAL + NORMAL only fsyncs at checkpoints; still crash-safe (last commits may roll back on power loss).
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # Bulk workers write concurrently; wait for the lock instead of failing with SQLITE_BUSY.
+        conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
         return conn
 
     @contextmanager
@@ -174,9 +206,39 @@ class Storage:
         finally:
             conn.close()
 
+    @contextmanager
+    def read_snapshot(self) -> Generator[None, None, None]:
+        """Serve this thread's reads from one connection inside a single read transaction.
+
+        For long read-only passes (export): :meth:`_read_conn` calls on the
+        calling thread reuse the connection instead of connecting and setting
+        PRAGMAs per query, and all reads see one consistent WAL snapshot even
+        while other processes write. Other threads are unaffected; nesting is a no-op.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+        conn = self._conn()
+        try:
+            conn.execute(f"PRAGMA cache_size = -{_SNAPSHOT_CACHE_KIB}")
+            conn.execute("BEGIN")
+            self._local.conn = conn
+            yield
+        finally:
+            self._local.conn = None
+            conn.rollback()
+            conn.close()
+
     @contextmanager
     def _read_conn(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for read-only DB operations; auto-closes."""
+        """Context manager for read-only DB operations; auto-closes.
+
+        Inside :meth:`read_snapshot` yields the snapshot's connection (left open).
+        """
+        pinned = getattr(self._local, "conn", None)
+        if pinned is not None:
+            yield pinned
+            return
         conn = self._conn()
         try:
             yield conn
@@ -208,35 +270,41 @@ class Storage:
     )
 
     def ensure_schema(self) -> None:
+        """Create tables and apply migrations (skipped on an up-to-date DB); ensure the default prompt."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         conn = self._conn()
         try:
-            conn.executescript(get_schema_sql())
-            conn.commit()
-            self._migrate_artists_columns(conn)
-            conn.commit()
-            self._migrate_jobs_table(conn)
-            conn.commit()
-            self._migrate_request_log_table(conn)
-            conn.commit()
-            self._migrate_summary_score_columns(conn)
-            conn.commit()
-            self._migrate_faithfulness_score_column(conn)
-            conn.commit()
-            self._migrate_verification_score_column(conn)
-            conn.commit()
-            self._migrate_provenance_columns(conn)
-            conn.commit()
-            self._migrate_transcript_quality_column(conn)
-            conn.commit()
-            self._migrate_transcript_raw_vtt_column(conn)
-            conn.commit()
-            self._migrate_hash_columns(conn)
-            conn.commit()
-            self._migrate_work_ledger_table(conn)
-            conn.commit()
-            self._migrate_fts5_transcripts(conn)
-            conn.commit()
+            if conn.execute("PRAGMA user_version").fetchone()["user_version"] < _SCHEMA_VERSION:
+                conn.executescript(get_schema_sql())
+                conn.commit()
+                self._migrate_artists_columns(conn)
+                conn.commit()
+                self._migrate_jobs_table(conn)
+                conn.commit()
+                self._migrate_request_log_table(conn)
+                conn.commit()
+                self._migrate_summary_score_columns(conn)
+                conn.commit()
+                self._migrate_faithfulness_score_column(conn)
+                conn.commit()
+                self._migrate_verification_score_column(conn)
+                conn.commit()
+                self._migrate_provenance_columns(conn)
+                conn.commit()
+                self._migrate_transcript_quality_column(conn)
+                conn.commit()
+                self._migrate_transcript_raw_vtt_column(conn)
+                conn.commit()
+                self._migrate_hash_columns(conn)
+                conn.commit()
+                self._migrate_work_ledger_table(conn)
+                conn.commit()
+                self._migrate_fts5_transcripts(conn)
+                conn.commit()
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                conn.commit()
+            # Outside the version gate: one COUNT(*), and it restores the built-in
+            # prompt if the prompts table was emptied on an already-migrated DB.
             self._ensure_default_prompt(conn)
             conn.commit()
         finally:
@@ -504,18 +572,14 @@ class Storage:
             )
 
     def list_artists(self) -> List[ArtistRow]:
-        conn = self._conn()
-        try:
+        with self._read_conn() as conn:
             cur = conn.execute("SELECT * FROM artists ORDER BY name")
             return cur.fetchall()  # type: ignore[return-value]
-        finally:
-            conn.close()
 
     # ------ Videos ------
 
     def list_videos(self, artist_id: Optional[str] = None) -> List[VideoRow]:
-        conn = self._conn()
-        try:
+        with self._read_conn() as conn:
             if artist_id:
                 cur = conn.execute(
                     "SELECT * FROM videos WHERE artist_id = ? ORDER BY fetched_at DESC",
@@ -524,8 +588,6 @@ class Storage:
             else:
                 cur = conn.execute("SELECT * FROM videos ORDER BY fetched_at DESC")
             return cur.fetchall()  # type: ignore[return-value]
-        finally:
-            conn.close()
 
     def upsert_video(
         self,
@@ -612,6 +674,22 @@ class Storage:
             )
         return {row["video_id"]: row for row in rows}
 
+    def iter_transcripts_for_videos(self, video_ids: Sequence[str]) -> Iterator[TranscriptRow]:
+        """Yield transcripts for *video_ids* in the given order, skipping videos without one.
+
+        Streaming form of :meth:`get_transcripts_for_videos` for exports: only
+        one ``_IN_BATCH_SIZE`` batch of rows is held in memory at a time.
+        """
+        with self._read_conn() as conn:
+            for batch, rows in self._iter_chunked_in(
+                conn, "SELECT * FROM transcripts WHERE video_id IN ({placeholders})", video_ids
+            ):
+                by_id = {row["video_id"]: row for row in rows}
+                for vid in batch:
+                    row = by_id.get(vid)
+                    if row is not None:
+                        yield row
+
     def list_transcripts(
         self,
         artist_id: Optional[str] = None,
@@ -653,14 +731,10 @@ class Storage:
 
         Returns BM25-ranked results with snippet context.
         Raises ValueError if FTS5 is not available or query syntax is invalid.
+        A missing index is detected from the query error rather than a
+        sqlite_master probe, so a search is a single statement.
         """
         with self._read_conn() as conn:
-            cur = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='transcripts_fts'")
-            if not cur.fetchone():
-                raise ValueError(
-                    "Full-text search is not available. "
-                    "Re-run any command to trigger migration, or check that your SQLite supports FTS5."
-                )
             sql = """
                 SELECT t.video_id, v.artist_id, v.title,
                        length(t.raw_text) AS transcript_len,
@@ -682,6 +756,11 @@ class Storage:
                 cur = conn.execute(sql, params)
             except sqlite3.OperationalError as exc:
                 msg = str(exc)
+                if "no such table: transcripts_fts" in msg:
+                    raise ValueError(
+                        "Full-text search is not available. "
+                        "Re-run any command to trigger migration, or check that your SQLite supports FTS5."
+                    ) from exc
                 if "fts5: syntax error" in msg or "parse error" in msg:
                     raise ValueError(
                         f"Invalid search query: {query!r}. "
@@ -725,17 +804,7 @@ class Storage:
         conn = self._conn()
         try:
             conn.execute(
-                """
-                INSERT INTO prompts (id, name, template, artist_component, video_component, intent_component, audience_component)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    name = excluded.name,
-                    template = excluded.template,
-                    artist_component = excluded.artist_component,
-                    video_component = excluded.video_component,
-                    intent_component = excluded.intent_component,
-                    audience_component = excluded.audience_component
-                """,
+                _UPSERT_PROMPT_SQL,
                 (
                     prompt_id,
                     name,
@@ -750,6 +819,32 @@ class Storage:
         finally:
             conn.close()
 
+    def save_artist_about_prompt(
+        self,
+        artist_id: str,
+        about: str,
+        *,
+        prompt_id: str,
+        name: str,
+        template: str,
+        artist_component: Optional[str] = None,
+    ) -> None:
+        """Set artist about, upsert *prompt_id* and make it the artist default in one transaction."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE artists SET about = ? WHERE id = ?", (about or "", artist_id))
+            conn.execute(_UPSERT_PROMPT_SQL, (prompt_id, name, template, artist_component or "", "", "", ""))
+            conn.execute("UPDATE artists SET default_prompt_id = ? WHERE id = ?", (prompt_id, artist_id))
+
+    def check_artist_and_prompt(self, artist_id: str, prompt_id: str) -> Tuple[bool, bool]:
+        """Return ``(artist_exists, prompt_exists)`` using a single query."""
+        with self._read_conn() as conn:
+            row = conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM artists WHERE id = ?) AS artist,"
+                " EXISTS(SELECT 1 FROM prompts WHERE id = ?) AS prompt",
+                (artist_id, prompt_id),
+            ).fetchone()
+        return bool(row["artist"]), bool(row["prompt"])
+
     def get_prompt(self, prompt_id: str) -> Optional[PromptRow]:
         conn = self._conn()
         try:
@@ -759,12 +854,9 @@ class Storage:
             conn.close()
 
     def list_prompts(self) -> List[PromptRow]:
-        conn = self._conn()
-        try:
+        with self._read_conn() as conn:
             cur = conn.execute("SELECT id, name, template FROM prompts ORDER BY id")
             return cur.fetchall()  # type: ignore[return-value]
-        finally:
-            conn.close()
 
     # ------ Summaries ------
 
@@ -811,6 +903,15 @@ class Storage:
         finally:
             conn.close()
 
+    def get_summary(self, video_id: str, prompt_id: str) -> Optional[SummaryRow]:
+        """Return the summary for one (video, prompt) pair, or None. Served by the UNIQUE index."""
+        with self._read_conn() as conn:
+            cur = conn.execute(
+                "SELECT * FROM summaries WHERE video_id = ? AND prompt_id = ?",
+                (video_id, prompt_id),
+            )
+            return cur.fetchone()  # type: ignore[return-value]
+
     def get_summaries_for_videos(self, video_ids: List[str]) -> Dict[str, List[SummaryRow]]:
         """Batch-fetch summaries for multiple videos.
 
@@ -830,6 +931,22 @@ class Storage:
             result.setdefault(row["video_id"], []).append(row)
         return result
 
+    def iter_summaries_for_videos(self, video_ids: Sequence[str]) -> Iterator[SummaryRow]:
+        """Yield summaries grouped by video in *video_ids* order (each video's by created_at).
+
+        Streaming form of :meth:`get_summaries_for_videos`; see
+        :meth:`iter_transcripts_for_videos`.
+        """
+        with self._read_conn() as conn:
+            for batch, rows in self._iter_chunked_in(
+                conn, "SELECT * FROM summaries WHERE video_id IN ({placeholders}) ORDER BY created_at", video_ids
+            ):
+                by_id: Dict[str, List[SummaryRow]] = {}
+                for row in rows:
+                    by_id.setdefault(row["video_id"], []).append(row)
+                for vid in batch:
+                    yield from by_id.get(vid, ())
+
     def list_summaries(self, artist_id: Optional[str] = None) -> List[SummaryRow]:
         """Return all summaries, optionally filtered to an artist's videos."""
         with self._read_conn() as conn:
@@ -849,27 +966,49 @@ class Storage:
     def _execute_chunked_in(
         conn: sqlite3.Connection,
         query_template: str,
-        id_list: List[str],
+        id_list: Sequence[str],
         extra_params: Optional[List] = None,
     ) -> List:
         """Execute a query with IN clause in batches to stay under SQLite param limit.
 
         *query_template* must contain ``{placeholders}`` where the IN list goes.
+        *id_list* may be any sequence (list or tuple).
         *extra_params* are prepended to each batch's parameter list (e.g. prompt_id).
+        Full batches share one SQL string, so sqlite3's statement cache re-uses
+        the prepared statement; only a short final batch is prepared separately.
         Returns all rows from all batches concatenated.
         """
         results: List = []
-        prefix = extra_params or []
+        for _batch, rows in Storage._iter_chunked_in(conn, query_template, id_list, extra_params):
+            results.extend(rows)
+        return results
+
+    @staticmethod
+    def _iter_chunked_in(
+        conn: sqlite3.Connection,
+        query_template: str,
+        id_list: Sequence[str],
+        extra_params: Optional[List] = None,
+    ) -> Iterator[Tuple[List[str], List]]:
+        """Lazy form of :meth:`_execute_chunked_in`: yield ``(batch_ids, rows)`` per batch."""
+        prefix = list(extra_params or [])
+        full_sql: Optional[str] = None
         for i in range(0, len(id_list), _IN_BATCH_SIZE):
-            batch = id_list[i : i + _IN_BATCH_SIZE]
-            placeholders = ",".join("?" for _ in batch)
-            sql = query_template.format(placeholders=placeholders)
+            batch = list(id_list[i : i + _IN_BATCH_SIZE])
+            if len(batch) == _IN_BATCH_SIZE:
+                if full_sql is None:
+                    full_sql = query_template.format(placeholders=",".join("?" * _IN_BATCH_SIZE))
+                sql = full_sql
+            else:
+                sql = query_template.format(placeholders=",".join("?" * len(batch)))
             cur = conn.execute(sql, prefix + batch)
-            results.extend(cur.fetchall())
-        return results
+            yield batch, cur.fetchall()
 
-    def video_ids_with_transcripts(self, video_ids: List[str]) -> set:
-        """Return the subset of video_ids that already have transcripts."""
+    def video_ids_with_transcripts(self, video_ids: Sequence[str]) -> Set[str]:
+        """Return the subset of video_ids that already have transcripts.
+
+        Always a set: bulk callers filter large channels with ``vid not in result``.
+        """
         if not video_ids:
             return set()
         conn = self._conn()
@@ -883,8 +1022,8 @@ class Storage:
         finally:
             conn.close()
 
-    def video_ids_with_summary(self, video_ids: List[str], prompt_id: str) -> set:
-        """Return the subset of video_ids that already have a summary for the given prompt_id."""
+    def video_ids_with_summary(self, video_ids: Sequence[str], prompt_id: str) -> Set[str]:
+        """Return the subset of video_ids that already have a summary for the given prompt_id (as a set)."""
         if not video_ids:
             return set()
         conn = self._conn()
@@ -1027,7 +1166,7 @@ class Storage:
         finally:
             conn.close()
 
-    def get_unscored_summaries(self, prompt_id: str, video_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def get_unscored_summaries(self, prompt_id: str, video_ids: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         """Return summaries that have no quality_score yet for the given prompt.
 
         If *video_ids* is provided, restrict to that set.
@@ -35,11 +35,15 @@ STRATEGIES = ("auto", "truncate", "map-reduce", "refine")
 # single-pass and final-reduce phases (the "creative" prompts).
 # ---------------------------------------------------------------------------
 
+# The per-call section number goes last so every map call (any chunk, any video)
+# starts with identical instructions — providers with prefix caching and
+# Ollama's KV cache can reuse that shared prefix.
 _CHUNK_SYSTEM_PROMPT = (
     "Summarize this section of a transcript. Preserve key facts, data points, "
-    "quotes, and conclusions. Be thorough — this is section {chunk_index} of {total_chunks}.\n\n"
+    "quotes, and conclusions. Be thorough.\n\n"
     "Only include information explicitly stated in the transcript. "
-    "Do not invent names, quotes, statistics, or facts not present in the text."
+    "Do not invent names, quotes, statistics, or facts not present in the text.\n\n"
+    "This is section {chunk_index} of {total_chunks}."
 )
 
 _REDUCE_SUFFIX = (
@@ -11,8 +11,9 @@ import time as _time
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
-from yt_artist.config import get_youtube_config
+from yt_artist.config import get_youtube_config, has_pot_provider
 from yt_artist.storage import Storage
+from yt_artist.yt_dlp_util import video_url_for
 from yt_artist.yt_dlp_util import yt_dlp_cmd as _yt_dlp_cmd
 
 log = logging.getLogger("yt_artist.transcriber")
@@ -326,14 +327,7 @@ def _run_yt_dlp_subtitles(video_url: str, out_dir: Path, storage: Optional[Stora
     )
     # Check PO token status and provider plugin — give the most relevant hint.
     has_manual_token = bool(get_youtube_config().po_token)
-    has_provider = False
-    try:
-        from importlib.metadata import distribution
-
-        distribution("yt-dlp-get-pot-rustypipe")
-        has_provider = True
-    except Exception:
-        pass
+    has_provider = has_pot_provider()
     if not has_manual_token and not has_provider:
         msg += (
             "\n\n  No PO token provider installed — this is the most common cause of subtitle failures.\n"
@@ -400,7 +394,7 @@ def transcribe(
     from yt_artist.ledger import WorkTimer, record_operation
 
     video_id = extract_video_id(video_url_or_id)
-    url = video_url_or_id if video_url_or_id.startswith("http") else f"https://www.youtube.com/watch?v={video_id}"
+    url = video_url_or_id if video_url_or_id.startswith(("http://", "https://")) else video_url_for(video_id)
     timer = WorkTimer()
 
     try:
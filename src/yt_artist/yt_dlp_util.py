@@ -6,7 +6,7 @@ import functools
 import re
 import shutil
 import sys
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from yt_artist.config import get_concurrency_config, get_youtube_config
 
@@ -18,10 +18,16 @@ MAX_CONCURRENCY: int = get_concurrency_config().max_concurrency
 DEFAULT_INTER_VIDEO_DELAY: float = 2.0
 
 
+@functools.lru_cache(maxsize=1)
+def yt_dlp_path() -> Optional[str]:
+    """Return the yt-dlp executable on PATH, or None (cached; shutil.which stats every PATH entry)."""
+    return shutil.which("yt-dlp")
+
+
 @functools.lru_cache(maxsize=1)
 def _resolve_base() -> Tuple[str, ...]:
     """Detect yt-dlp binary once and cache the result (avoids repeated shutil.which I/O)."""
-    if shutil.which("yt-dlp"):
+    if yt_dlp_path():
         return ("yt-dlp",)
     return (sys.executable, "-m", "yt_dlp")
 
@@ -86,6 +92,15 @@ def get_auth_config() -> dict:
     }
 
 
+# Watch URL for a bare video id; video_url_for() is a plain concatenation onto this.
+VIDEO_URL_PREFIX = "https://www.youtube.com/watch?v="
+
+
+def video_url_for(video_id: str) -> str:
+    """Build YouTube watch URL from a bare video id."""
+    return VIDEO_URL_PREFIX + video_id
+
+
 def channel_url_for(artist_id: str) -> str:
     """Build YouTube channel URL from an artist_id (@handle or channel_id)."""
     if artist_id.startswith("@"):
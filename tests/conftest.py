@@ -8,7 +8,9 @@ from yt_artist.config import (
     get_concurrency_config,
     get_llm_config,
     get_youtube_config,
+    has_pot_provider,
 )
+from yt_artist.yt_dlp_util import yt_dlp_path
 
 
 @pytest.fixture(autouse=True)
@@ -18,11 +20,15 @@ def _clear_config_caches():
     get_llm_config.cache_clear()
     get_app_config.cache_clear()
     get_concurrency_config.cache_clear()
+    has_pot_provider.cache_clear()
+    yt_dlp_path.cache_clear()
     yield
     get_youtube_config.cache_clear()
     get_llm_config.cache_clear()
     get_app_config.cache_clear()
     get_concurrency_config.cache_clear()
+    has_pot_provider.cache_clear()
+    yt_dlp_path.cache_clear()
 
 
 @pytest.fixture
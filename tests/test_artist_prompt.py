@@ -0,0 +1,380 @@
+"""Tests for artist_prompt.py — build_artist_about and its on-disk cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from yt_artist.artist_about_cache import AboutCache, about_cache_key
+from yt_artist.artist_prompt import (
+    _dedupe_snippets,
+    _is_usable_about,
+    _stream_about,
+    _truncate_words,
+    build_artist_about,
+    build_artist_about_many,
+    prewarm,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_negative_search_cache():
+    from yt_artist import artist_prompt
+
+    artist_prompt._neg_cache.clear()
+    yield
+    artist_prompt._neg_cache.clear()
+
+
+class TestAboutCache:
+    def test_miss_returns_none(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        assert cache.get("nope") is None
+
+    def test_set_then_get(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        cache.set("k", "hello")
+        assert cache.get("k") == "hello"
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        cache.set("k", "hello", ttl=-1)
+        assert cache.get("k") is None
+
+    def test_setup_runs_once_per_instance(self, tmp_path):
+        from pathlib import Path
+
+        cache = AboutCache(tmp_path / "sub" / "cache.db")
+        cache.set("k", "hello")
+        with patch.object(Path, "mkdir", side_effect=AssertionError("mkdir on hot path")):
+            cache.set("k2", "again")
+            assert cache.get("k") == "hello"
+
+    def test_key_depends_on_all_fields(self):
+        base = about_cache_key("@a", "A", "https://youtube.com/@a")
+        assert base == about_cache_key("@a", "A", "https://youtube.com/@a")
+        assert base != about_cache_key("@a", "B", "https://youtube.com/@a")
+        assert base != about_cache_key("@a", "A", "https://youtube.com/@b")
+
+
+class TestBuildArtistAboutCache:
+    def test_miss_runs_search_and_stores(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=[]) as mock_search,
+            patch("yt_artist.llm_cache.complete", return_value="A science channel.") as mock_llm,
+        ):
+            about = build_artist_about("@a", "A", "https://youtube.com/@a", cache=cache)
+        assert about == "A science channel."
+        mock_search.assert_called_once()
+        mock_llm.assert_called_once()
+        assert cache.get(about_cache_key("@a", "A", "https://youtube.com/@a")) == "A science channel."
+
+    def test_hit_skips_network(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        cache.set(about_cache_key("@a", "A", "https://youtube.com/@a"), "Cached about.")
+        with (
+            patch("yt_artist.artist_prompt._search_about") as mock_search,
+            patch("yt_artist.llm_cache.complete") as mock_llm,
+        ):
+            about = build_artist_about("@a", "A", "https://youtube.com/@a", cache=cache)
+        assert about == "Cached about."
+        mock_search.assert_not_called()
+        mock_llm.assert_not_called()
+
+    def test_refresh_ignores_hit_and_replaces_it(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        key = about_cache_key("@a", "A", "https://youtube.com/@a")
+        cache.set(key, "Old about.")
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=[]),
+            patch("yt_artist.llm_cache.complete", return_value="New about.") as mock_llm,
+        ):
+            about = build_artist_about("@a", "A", "https://youtube.com/@a", cache=cache, refresh=True)
+        assert about == "New about."
+        mock_llm.assert_called_once()
+        assert cache.get(key) == "New about."
+
+    def test_placeholder_not_cached(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=[]),
+            patch("yt_artist.llm_cache.complete", return_value=""),
+        ):
+            about = build_artist_about("@a", "A", "https://youtube.com/@a", cache=cache)
+        assert about == "A (https://youtube.com/@a)"
+        assert cache.get(about_cache_key("@a", "A", "https://youtube.com/@a")) is None
+
+
+class TestSearchFallbackRace:
+    _SNIPPETS = ["Channel A is a long-running science channel covering physics, biology and space news."]
+
+    def test_search_result_wins(self):
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=self._SNIPPETS),
+            patch("yt_artist.artist_prompt.complete_stream", return_value=(p for p in ["Summ", "ary."])),
+            patch("yt_artist.llm_cache.complete", return_value="Fallback."),
+        ):
+            assert build_artist_about("@a", "A", "https://youtube.com/@a") == "Summary."
+
+    def test_search_win_skips_fallback_request(self):
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=self._SNIPPETS),
+            patch("yt_artist.artist_prompt.complete_stream", return_value=(p for p in ["Summ", "ary."])),
+            patch("yt_artist.llm_cache.complete", return_value="Fallback.") as mock_fallback,
+        ):
+            build_artist_about("@a", "A", "https://youtube.com/@a")
+        mock_fallback.assert_not_called()
+
+    def test_summarizer_failure_falls_back(self):
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=self._SNIPPETS),
+            patch("yt_artist.artist_prompt.complete_stream", side_effect=RuntimeError("LLM API call failed")),
+            patch("yt_artist.llm_cache.complete", return_value="Fallback."),
+        ):
+            assert build_artist_about("@a", "A", "https://youtube.com/@a") == "Fallback."
+
+    def test_llm_calls_have_timeout(self):
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=[]),
+            patch("yt_artist.llm_cache.complete", return_value="Fallback.") as mock_llm,
+        ):
+            build_artist_about("@a", "A", "https://youtube.com/@a")
+        assert mock_llm.call_args.kwargs["timeout"] > 0
+
+    def test_empty_search_uses_fallback(self):
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=[]),
+            patch("yt_artist.llm_cache.complete", return_value="Fallback."),
+        ):
+            assert build_artist_about("@a", "A", "https://youtube.com/@a") == "Fallback."
+
+    def test_slow_search_uses_fallback(self):
+        import threading
+
+        release = threading.Event()
+
+        def slow_search(query):
+            release.wait(5)
+            return self._SNIPPETS
+
+        try:
+            with (
+                patch("yt_artist.artist_prompt._SEARCH_WAIT", 0.05),
+                patch("yt_artist.artist_prompt._search_about", side_effect=slow_search),
+                patch("yt_artist.llm_cache.complete", return_value="Fallback."),
+            ):
+                assert build_artist_about("@a", "A", "https://youtube.com/@a") == "Fallback."
+        finally:
+            release.set()
+
+
+class TestSharedDDGS:
+    def test_client_created_once(self):
+        from unittest.mock import MagicMock
+
+        from yt_artist import artist_prompt
+
+        fake_ddgs = MagicMock()
+        fake_ddgs.return_value.text.return_value = [{"body": "snippet"}]
+        artist_prompt._close_ddgs()
+        try:
+            with patch.object(artist_prompt, "_DDGS", fake_ddgs):
+                assert artist_prompt._search_about("q1") == ["snippet"]
+                assert artist_prompt._search_about("q2") == ["snippet"]
+            fake_ddgs.assert_called_once()
+        finally:
+            artist_prompt._close_ddgs()
+
+    def test_missing_package_returns_empty(self):
+        from yt_artist import artist_prompt
+
+        artist_prompt._close_ddgs()
+        with patch.object(artist_prompt, "_DDGS", None):
+            assert artist_prompt._search_about("q") == []
+
+
+class TestSnippetShrinking:
+    def test_dedupe_drops_near_duplicates(self):
+        snippets = [
+            "Channel A covers physics and space news every week.",
+            "channel a covers physics and space news every week!",
+            "A completely different snippet about the host.",
+        ]
+        assert _dedupe_snippets(snippets) == [snippets[0], snippets[2]]
+
+    def test_dedupe_drops_empty(self):
+        assert _dedupe_snippets(["", "  ", "text"]) == ["text"]
+
+    def test_truncate_words_keeps_short_text(self):
+        assert _truncate_words("short text", 100) == "short text"
+
+    def test_truncate_words_cuts_at_word_boundary(self):
+        assert _truncate_words("alpha beta gamma", 12) == "alpha beta"
+
+    def test_summarizer_receives_deduped_bullets(self):
+        snippets = ["Channel A covers physics and space news weekly."] * 3 + ["Hosted by a former NASA engineer."]
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=snippets),
+            patch("yt_artist.artist_prompt.complete_stream", return_value=(p for p in ["Summary."])) as mock_stream,
+            patch("yt_artist.llm_cache.complete", return_value="Fallback."),
+        ):
+            build_artist_about("@a", "A", "https://youtube.com/@a")
+        assert mock_stream.call_args.args[1] == (
+            "- Channel A covers physics and space news weekly.\n- Hosted by a former NASA engineer."
+        )
+
+
+class TestDirectSnippet:
+    _GOOD = (
+        "Channel A is a weekly science show about physics and space. "
+        "It is hosted by a former NASA engineer and has two million subscribers."
+    )
+
+    def test_short_clean_text_is_usable(self):
+        assert _is_usable_about(self._GOOD)
+
+    def test_too_short_or_long_rejected(self):
+        assert not _is_usable_about("Too short.")
+        assert not _is_usable_about("Long sentence. " * 40)
+
+    def test_urls_and_html_rejected(self):
+        assert not _is_usable_about(self._GOOD + " See https://example.com.")
+        assert not _is_usable_about("<b>Channel A</b> " + self._GOOD)
+
+    def test_elided_or_many_sentences_rejected(self):
+        assert not _is_usable_about(self._GOOD[:-1] + "...")
+        assert not _is_usable_about("One. Two. Three. Four. " + self._GOOD)
+
+    def test_usable_snippet_skips_summarizer(self):
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=[self._GOOD]),
+            patch("yt_artist.artist_prompt.complete_stream") as mock_stream,
+            patch("yt_artist.llm_cache.complete", return_value="Fallback."),
+        ):
+            assert build_artist_about("@a", "A", "https://youtube.com/@a") == self._GOOD
+        mock_stream.assert_not_called()
+
+
+class TestBuildArtistAboutMany:
+    def test_builds_all_items(self):
+        def fake_build(artist_id, name, url, **kwargs):
+            return f"About {name}."
+
+        items = [("@a", "A", "https://youtube.com/@a"), ("@b", "B", "https://youtube.com/@b")]
+        with patch("yt_artist.artist_prompt.build_artist_about", side_effect=fake_build):
+            result = build_artist_about_many(items, concurrency=2)
+        assert result == {"@a": "About A.", "@b": "About B."}
+
+    def test_failed_item_omitted(self):
+        def fake_build(artist_id, name, url, **kwargs):
+            if artist_id == "@b":
+                raise RuntimeError("LLM down")
+            return "ok"
+
+        items = [("@a", "A", "u1"), ("@b", "B", "u2")]
+        with patch("yt_artist.artist_prompt.build_artist_about", side_effect=fake_build):
+            assert build_artist_about_many(items) == {"@a": "ok"}
+
+    def test_empty_items(self):
+        assert build_artist_about_many([]) == {}
+
+
+class TestNegativeSearchCache:
+    def _fake_ddgs(self, side_effect):
+        from unittest.mock import MagicMock
+
+        fake_ddgs = MagicMock()
+        fake_ddgs.return_value.text.side_effect = side_effect
+        return fake_ddgs, fake_ddgs.return_value
+
+    def test_failed_query_not_retried(self):
+        from yt_artist import artist_prompt
+
+        fake_ddgs, client = self._fake_ddgs(RuntimeError("network down"))
+        artist_prompt._close_ddgs()
+        try:
+            with patch.object(artist_prompt, "_DDGS", fake_ddgs):
+                assert artist_prompt._search_about("q") == []
+                assert artist_prompt._search_about("q") == []
+            assert client.text.call_count == 1
+        finally:
+            artist_prompt._close_ddgs()
+
+    def test_expired_entry_retries(self):
+        from yt_artist import artist_prompt
+
+        fake_ddgs, client = self._fake_ddgs(lambda *a, **k: [])
+        artist_prompt._close_ddgs()
+        try:
+            with patch.object(artist_prompt, "_DDGS", fake_ddgs), patch.object(artist_prompt, "_NEG_CACHE_TTL", -1):
+                artist_prompt._search_about("q")
+                artist_prompt._search_about("q")
+            assert client.text.call_count == 2
+        finally:
+            artist_prompt._close_ddgs()
+
+    def test_success_not_cached(self):
+        from yt_artist import artist_prompt
+
+        fake_ddgs, client = self._fake_ddgs(lambda *a, **k: [{"body": "hit"}])
+        artist_prompt._close_ddgs()
+        try:
+            with patch.object(artist_prompt, "_DDGS", fake_ddgs):
+                artist_prompt._search_about("q")
+                artist_prompt._search_about("q")
+            assert client.text.call_count == 2
+        finally:
+            artist_prompt._close_ddgs()
+
+
+class TestStreamAbout:
+    def test_stops_after_max_sentences(self):
+        pieces = ["One is here. ", "Two is here. ", "Three is here. ", "Four is ", "here. Five."]
+        consumed = []
+
+        def gen():
+            for p in pieces:
+                consumed.append(p)
+                yield p
+
+        with patch("yt_artist.artist_prompt.complete_stream", return_value=gen()):
+            out = _stream_about("sys", "user")
+        assert out == "One is here. Two is here. Three is here."
+        assert len(consumed) < len(pieces)
+
+    def test_short_answer_returned_whole(self):
+        with patch("yt_artist.artist_prompt.complete_stream", return_value=(p for p in ["Only ", "one sentence."])):
+            assert _stream_about("sys", "user") == "Only one sentence."
+
+
+class TestPrewarm:
+    def test_only_artists_without_about(self, tmp_path):
+        artists = [
+            {"id": "@a", "name": "A", "channel_url": "https://youtube.com/@a", "about": ""},
+            {"id": "@b", "name": "B", "channel_url": "https://youtube.com/@b", "about": "Already set."},
+            {"id": "@c", "name": "", "channel_url": "https://youtube.com/@c", "about": None},
+        ]
+        cache = AboutCache(tmp_path / "cache.db")
+        with patch("yt_artist.artist_prompt.build_artist_about_many") as mock_many:
+            thread = prewarm(artists, cache=cache)
+            thread.join(5)
+        items = mock_many.call_args.args[0]
+        assert items == [("@a", "A", "https://youtube.com/@a"), ("@c", "@c", "https://youtube.com/@c")]
+        assert mock_many.call_args.kwargs["cache"] is cache
+        assert thread.daemon
+
+    def test_nothing_to_do_returns_none(self, tmp_path):
+        artists = [{"id": "@b", "name": "B", "channel_url": "u", "about": "Set."}]
+        with patch("yt_artist.artist_prompt.build_artist_about_many") as mock_many:
+            assert prewarm(artists, cache=AboutCache(tmp_path / "cache.db")) is None
+        mock_many.assert_not_called()
+
+    def test_fills_cache(self, tmp_path):
+        cache = AboutCache(tmp_path / "cache.db")
+        artists = [{"id": "@a", "name": "A", "channel_url": "https://youtube.com/@a", "about": ""}]
+        with (
+            patch("yt_artist.artist_prompt._search_about", return_value=[]),
+            patch("yt_artist.llm_cache.complete", return_value="Prewarmed."),
+        ):
+            prewarm(artists, cache=cache).join(5)
+        assert cache.get(about_cache_key("@a", "A", "https://youtube.com/@a")) == "Prewarmed."
@@ -255,6 +255,18 @@ class TestJobDB:
         assert removed == 1
         assert not log_path.exists()
 
+    def test_job_cleanup_tolerates_missing_log(self, tmp_path):
+        from yt_artist.jobs import cleanup_old_jobs
+
+        store = _make_store(tmp_path)
+        with store.transaction() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, command, status, pid, log_file, finished_at) "
+                "VALUES ('old_job_5678', 'test cmd', 'failed', 1, ?, datetime('now', '-10 days'))",
+                (str(tmp_path / "gone.log"),),
+            )
+        assert cleanup_old_jobs(store, max_age_days=7) == 1
+
 
 # ---------------------------------------------------------------------------
 # _ProgressCounter integration
@@ -271,6 +283,7 @@ class TestProgressCounterDB:
         pc = _ProgressCounter(5, job_id="abc123def456", job_storage=store)
         pc.tick("Test", "vid1")
         pc.tick("Test", "vid2", error="fail")
+        pc.flush()
         job = get_job(store, "abc123def456")
         assert job["total"] == 5
         assert job["done"] == 2
@@ -288,6 +301,23 @@ class TestProgressCounterDB:
         assert job["status"] == "completed"
         assert job["finished_at"] is not None
 
+    def test_counter_coalesces_progress_writes(self):
+        """Many fast ticks produce far fewer jobs-table writes; finalize writes final counts."""
+        from yt_artist.cli import _ProgressCounter
+
+        with (
+            patch("yt_artist.cli.update_job_progress") as mock_update,
+            patch("yt_artist.cli.finalize_job") as mock_finalize,
+        ):
+            pc = _ProgressCounter(200, job_id="abc123def456", job_storage=MagicMock())
+            for i in range(200):
+                pc.tick("Test", f"vid{i}")
+            pc.finalize()
+        # 1 write for total, a few coalesced flushes, 1 final write.
+        assert mock_update.call_count < 10
+        assert mock_update.call_args.kwargs == {"done": 200, "errors": 0}
+        mock_finalize.assert_called_once()
+
     def test_counter_no_db_without_job_id(self, tmp_path):
         """Without job_id, ProgressCounter should not write to DB."""
         from yt_artist.cli import _ProgressCounter
@@ -314,7 +344,7 @@ class TestBGFlagLaunch:
     def test_bg_flag_launches_subprocess(self, tmp_path, capfd):
         """When --bg is passed, main() should call launch_background and exit."""
         db = tmp_path / "test.db"
-        with patch("yt_artist.jobs.launch_background", return_value="abc123def456") as mock_launch:
+        with patch("yt_artist.cli.launch_background", return_value="abc123def456") as mock_launch:
             code = _run_cli("--bg", "transcribe", "--artist-id", "@Test", db_path=db)
         assert code == 0
         captured = capfd.readouterr()
@@ -397,6 +427,47 @@ class TestJobsCommand:
         assert "Transcribing 1/5" in captured.out
         assert "Transcribing 2/5" in captured.out
 
+    def test_jobs_attach_ends_when_worker_died(self, tmp_path, capfd):
+        """Attaching to a 'running' job whose PID is gone drains the log and marks it failed."""
+        db = tmp_path / "test.db"
+        store = Storage(db)
+        store.ensure_schema()
+        log_file = tmp_path / "job.log"
+        log_file.write_text("INFO: Transcribing 1/5: vid001\n")
+        _seed_job(store, pid=4_000_000, log_file=str(log_file), status="running")
+        with patch("yt_artist.jobs.time.sleep") as mock_sleep:
+            code = _run_cli("jobs", "attach", "abc123de", db_path=db)
+        assert code == 0
+        mock_sleep.assert_not_called()
+        captured = capfd.readouterr()
+        assert "Transcribing 1/5" in captured.out
+        assert "status: failed" in captured.err
+        assert store.get_job("abc123def456")["status"] == "failed"
+
+    def test_jobs_attach_waits_for_unlaunched_worker(self, tmp_path, capfd):
+        """pid=-1 (worker not launched yet) is not treated as a dead process."""
+        db = tmp_path / "test.db"
+        store = Storage(db)
+        store.ensure_schema()
+        log_file = tmp_path / "job.log"
+        log_file.write_text("")
+        _seed_job(store, pid=-1, log_file=str(log_file), status="running")
+
+        def finish_job(_seconds):
+            with store.transaction() as conn:
+                conn.execute("UPDATE jobs SET status = 'completed', pid = ? WHERE id = 'abc123def456'", (os.getpid(),))
+
+        with (
+            patch("yt_artist.jobs._ATTACH_STATUS_INTERVAL", 0.0),
+            patch("yt_artist.jobs.time.sleep", side_effect=finish_job),
+            patch("yt_artist.jobs._mark_job_stale") as mock_stale,
+        ):
+            code = _run_cli("jobs", "attach", "abc123de", db_path=db)
+        assert code == 0
+        mock_stale.assert_not_called()
+        assert "status: completed" in capfd.readouterr().err
+        assert store.get_job("abc123def456")["status"] == "completed"
+
     def test_jobs_stop_sends_sigterm(self, tmp_path, capfd):
         """'jobs stop' should call os.kill with SIGTERM (after alive check with signal 0)."""
         import signal as _sig
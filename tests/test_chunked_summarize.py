@@ -165,6 +165,22 @@ class TestMapReduce:
         assert mock_llm.call_count >= 3  # at least 2 chunks + 1 reduce
         assert result == "Final combined"
 
+    @patch("yt_artist.summarizer.llm_complete")
+    def test_chunk_prompts_share_static_prefix(self, mock_llm):
+        """Map-phase system prompts differ only in a trailing section marker."""
+        mock_llm.return_value = "Chunk summary"
+        long_text = ". ".join(f"Sentence {i} with some content here" for i in range(100))
+        _summarize_map_reduce(long_text, 2000, "Summarize this")
+        map_prompts = [
+            c.kwargs["system_prompt"]
+            for c in mock_llm.call_args_list
+            if "Combine them" not in c.kwargs["system_prompt"]
+        ]
+        assert len(map_prompts) >= 2
+        prefixes = {p.rsplit("This is section", 1)[0] for p in map_prompts}
+        assert len(prefixes) == 1
+        assert any(p.endswith(f"This is section 1 of {len(map_prompts)}.") for p in map_prompts)
+
     @patch("yt_artist.summarizer.llm_complete")
     def test_empty_chunk_summaries_raises(self, mock_llm):
         """If all chunk summaries are empty, raises ValueError."""
@@ -170,6 +170,25 @@ class TestFetchChannel:
         captured = capfd.readouterr()
         assert "Videos:  5" in captured.out
 
+    def test_multiple_channels_report_each(self, tmp_path, capfd):
+        db = tmp_path / "test.db"
+        fake_results = {
+            "https://www.youtube.com/@A": ("data/artists/@A/urllist.md", 3),
+            "https://www.youtube.com/@B": RuntimeError("yt-dlp failed"),
+        }
+        with patch("yt_artist.cli.fetch_channels", return_value=fake_results) as mock_fetch:
+            code = _run_cli(
+                "fetch-channel",
+                "https://www.youtube.com/@A",
+                "https://www.youtube.com/@B",
+                db_path=db,
+            )
+        assert code != 0
+        assert mock_fetch.call_args.args[0] == list(fake_results)
+        captured = capfd.readouterr()
+        assert "@A: 3 videos" in captured.out
+        assert "@B: failed: yt-dlp failed" in captured.err
+
 
 # ---------------------------------------------------------------------------
 # CLI: transcribe (mocked)
@@ -485,6 +504,29 @@ class TestDoctor:
         captured = capfd.readouterr()
         assert "checks passed" in captured.out
 
+    def test_doctor_probes_run_concurrently(self, tmp_path, capfd):
+        """yt-dlp and LLM probes overlap instead of running back to back."""
+        import threading
+
+        db = tmp_path / "test.db"
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _slow_run(*a, **kw):
+            barrier.wait()
+            return MagicMock(returncode=0, stdout="2024.01.01", stderr="")
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/yt-dlp"),
+            patch("subprocess.run", side_effect=_slow_run),
+            patch("yt_artist.llm.check_connectivity", side_effect=lambda: barrier.wait()),
+            patch.dict(os.environ, {}, clear=False),
+        ):
+            code = _run_cli("doctor", db_path=db)
+        assert code == 0
+        out = capfd.readouterr().out
+        # Output order is unchanged even though the probes finished together.
+        assert out.index("[1/7]") < out.index("LLM endpoint reachable") < out.index("fetch video metadata")
+
 
 # ---------------------------------------------------------------------------
 # CLI: URL validation integration (Phase 1)
@@ -868,7 +910,7 @@ class TestSummarizeForce:
 
         with (
             patch("yt_artist.cli.summarize", return_value="testvid00001:p1") as mock_sum,
-            patch("yt_artist.cli._check_llm"),
+            patch("yt_artist.cli._check_llm") as mock_check,
         ):
             code = _run_cli(
                 "summarize",
@@ -882,6 +924,8 @@ class TestSummarizeForce:
         captured = capfd.readouterr()
         assert "already summarized" in captured.out
         assert not mock_sum.called
+        # Nothing to summarize → no LLM connectivity probe.
+        assert not mock_check.called
 
     def test_stale_only_without_force_skips(self, tmp_path, capfd):
         """--stale-only without --force has no effect (skip like normal)."""
@@ -8,6 +8,7 @@ from yt_artist.config import (
     get_concurrency_config,
     get_llm_config,
     get_youtube_config,
+    has_pot_provider,
 )
 
 
@@ -17,6 +18,7 @@ def _clear_all_caches():
     get_llm_config.cache_clear()
     get_app_config.cache_clear()
     get_concurrency_config.cache_clear()
+    has_pot_provider.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +116,11 @@ class TestLLMConfig:
         assert cfg.is_ollama is True
         assert cfg.api_key == "ollama"
 
+    def test_ollama_hostname_detected_case_insensitive(self):
+        with patch.dict("os.environ", {"OPENAI_BASE_URL": "http://My-Ollama-Box:8000/v1"}, clear=True):
+            cfg = get_llm_config()
+        assert cfg.is_ollama is True
+
 
 # ---------------------------------------------------------------------------
 # ConcurrencyConfig
@@ -177,6 +184,7 @@ class TestAppConfig:
         assert cfg.default_prompt == "default"
         assert cfg.max_transcript_chars == 30_000
         assert cfg.summarize_strategy == "auto"
+        assert cfg.prewarm_about is False
 
     def test_env_overrides(self):
         env = {
@@ -186,6 +194,7 @@ class TestAppConfig:
             "YT_ARTIST_DEFAULT_PROMPT": "custom",
             "YT_ARTIST_MAX_TRANSCRIPT_CHARS": "50000",
             "YT_ARTIST_SUMMARIZE_STRATEGY": "refine",
+            "YT_ARTIST_PREWARM_ABOUT": "true",
         }
         with patch.dict("os.environ", env, clear=True):
             cfg = get_app_config()
@@ -195,17 +204,29 @@ class TestAppConfig:
         assert cfg.default_prompt == "custom"
         assert cfg.max_transcript_chars == 50_000
         assert cfg.summarize_strategy == "refine"
+        assert cfg.prewarm_about is True
 
     def test_invalid_max_chars_falls_back(self):
         with patch.dict("os.environ", {"YT_ARTIST_MAX_TRANSCRIPT_CHARS": "not-int"}, clear=True):
             cfg = get_app_config()
         assert cfg.max_transcript_chars == 30_000
 
+    def test_non_positive_max_chars_clamped(self):
+        with patch.dict("os.environ", {"YT_ARTIST_MAX_TRANSCRIPT_CHARS": "-5"}, clear=True):
+            cfg = get_app_config()
+        assert cfg.max_transcript_chars == 1
+
     def test_unknown_strategy_falls_back(self):
         with patch.dict("os.environ", {"YT_ARTIST_SUMMARIZE_STRATEGY": "bogus"}, clear=True):
             cfg = get_app_config()
         assert cfg.summarize_strategy == "auto"
 
+    def test_valid_strategies_match_summarizer(self):
+        from yt_artist.config import _STRATEGIES
+        from yt_artist.summarizer import STRATEGIES
+
+        assert set(STRATEGIES) == _STRATEGIES
+
 
 # ---------------------------------------------------------------------------
 # Cache behavior
@@ -234,3 +255,20 @@ class TestCacheBehavior:
         with patch.dict("os.environ", {"YT_ARTIST_INTER_VIDEO_DELAY": "10"}, clear=True):
             cfg2 = get_youtube_config()
         assert cfg2.inter_video_delay == 10.0
+
+    def test_pot_provider_lookup_cached(self):
+        from importlib.metadata import PackageNotFoundError
+
+        with patch("importlib.metadata.distribution", side_effect=PackageNotFoundError("x")) as mock_dist:
+            assert has_pot_provider() is False
+            assert has_pot_provider() is False
+        assert mock_dist.call_count == 1
+
+    def test_config_instances_are_slotted(self):
+        import sys
+
+        if sys.version_info < (3, 10):
+            return
+        with patch.dict("os.environ", {}, clear=True):
+            for cfg in (get_youtube_config(), get_llm_config(), get_concurrency_config(), get_app_config()):
+                assert not hasattr(cfg, "__dict__")
@@ -6,12 +6,16 @@ import csv
 import json
 import zipfile
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from yt_artist.exporter import (
     EXPORT_VERSION,
     _build_video_entry,
     _make_export_dir,
     _sanitize_dirname,
+    _write_json,
     _zip_file,
     export_csv,
     export_json,
@@ -120,6 +124,37 @@ class TestZipFile:
             assert z.namelist() == ["test.json"]
             assert json.loads(z.read("test.json")) == {"key": "value"}
 
+    def test_compress_level_applied(self, tmp_path):
+        f = tmp_path / "test.csv"
+        f.write_text("a,b\n" * 1000)
+        with patch("yt_artist.exporter.zipfile.ZipFile", wraps=zipfile.ZipFile) as mock_zip:
+            _zip_file(f, compress_level=9)
+        assert mock_zip.call_args.kwargs["compresslevel"] == 9
+
+
+# ---------------------------------------------------------------------------
+# _write_json
+# ---------------------------------------------------------------------------
+
+
+class TestWriteJson:
+    def test_orjson_matches_stdlib_output(self, tmp_path):
+        """orjson and stdlib json produce equivalent JSON."""
+        pytest.importorskip("orjson")
+        data = {"name": "Café ✓", "n": 3, "score": 0.1, "none": None, "items": [{"a": 1}, []], "empty": {}}
+        fast = tmp_path / "fast.json"
+        slow = tmp_path / "slow.json"
+        _write_json(fast, data)
+        with patch("yt_artist.exporter._orjson", None):
+            _write_json(slow, data)
+        assert json.loads(fast.read_bytes()) == json.loads(slow.read_bytes()) == data
+
+    def test_int_beyond_64_bits_falls_back_to_json(self, tmp_path):
+        pytest.importorskip("orjson")
+        out = tmp_path / "big.json"
+        _write_json(out, {"view_count": 2**70})
+        assert json.loads(out.read_bytes()) == {"view_count": 2**70}
+
 
 # ---------------------------------------------------------------------------
 # _build_video_entry
@@ -205,6 +240,19 @@ class TestExportJsonSingle:
         assert len(data["videos"]) == 2
         assert data["videos"][0]["transcript"]["raw_text"].startswith("transcript text")
 
+    def test_chunk_prompts_used_and_sorted(self, store, tmp_path):
+        _seed_full(store, n_videos=1)
+        _seed_prompt(store, prompt_id="b_prompt", name="B")
+        _seed_prompt(store, prompt_id="a_prompt", name="A")
+        _seed_prompt(store, prompt_id="unused", name="U")
+        _seed_summary(store, "UC_test_v000", prompt_id="b_prompt")
+        _seed_summary(store, "UC_test_v000", prompt_id="a_prompt")
+        manifest = export_json(store, tmp_path, artist_id="UC_test")
+
+        chunk_file = next(Path(manifest["output_dir"]).rglob("UC_test_*.json"))
+        data = json.loads(chunk_file.read_text())
+        assert [p["id"] for p in data["prompts"]] == ["a_prompt", "b_prompt", "default"]
+
 
 # ---------------------------------------------------------------------------
 # export_json — multiple chunks
@@ -228,6 +276,17 @@ class TestExportJsonMultiChunk:
         assert c2["chunk"]["number"] == 2
         assert c2["chunk"]["video_count"] == 25
 
+    def test_more_chunks_than_writers(self, store, tmp_path):
+        """Chunks beyond the writer bound are all written and listed in order."""
+        _seed_full(store, n_videos=7)
+        with patch("yt_artist.exporter._CHUNK_WRITERS", 2):
+            manifest = export_json(store, tmp_path, artist_id="UC_test", chunk_size=1, compress=True)
+
+        out_dir = Path(manifest["output_dir"])
+        expected = [f"UC_test/UC_test_{n:03d}.json.zip" for n in range(1, 8)]
+        assert list(manifest["file_sizes"]) == expected
+        assert all((out_dir / rel).exists() for rel in expected)
+
     def test_manifest_chunk_count(self, store, tmp_path):
         _seed_full(store, n_videos=75)
         manifest = export_json(store, tmp_path, artist_id="UC_test", chunk_size=50)
@@ -304,7 +363,7 @@ class TestExportJsonZip:
 
         # Original json should not exist
         jsons_in_artist = list(out_dir.rglob("UC_test*.json"))
-        assert len(jsons_in_artist) == 0  # removed by _zip_file
+        assert len(jsons_in_artist) == 0  # chunks are written straight into the zip
 
         # Zip contents valid
         with zipfile.ZipFile(zips[0]) as z:
@@ -320,6 +379,14 @@ class TestExportJsonZip:
             assert key.endswith(".zip")
         assert manifest["options"]["compress"] is True
 
+    def test_manifest_sizes_match_disk(self, store, tmp_path):
+        _seed_full(store, n_videos=3)
+        for compress in (False, True):
+            manifest = export_json(store, tmp_path / str(compress), chunk_size=2, compress=compress)
+            out_dir = Path(manifest["output_dir"])
+            for rel, size in manifest["file_sizes"].items():
+                assert size == (out_dir / rel).stat().st_size
+
 
 # ---------------------------------------------------------------------------
 # export_csv — basic
@@ -514,6 +581,7 @@ class TestManifestCorrectness:
         assert manifest["options"]["include_vtt"] is True
         assert manifest["options"]["chunk_size"] == 10
         assert manifest["options"]["compress"] is True
+        assert manifest["options"]["compress_level"] == 1
 
 
 # ---------------------------------------------------------------------------
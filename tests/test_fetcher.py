@@ -1,15 +1,17 @@
 """Tests for fetcher: mock yt-dlp output, assert file content and DB state."""
 
 import json
+import sqlite3
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from yt_artist.fetcher import fetch_channel
+from yt_artist.fetcher import fetch_channel, fetch_channels
 
 
-def _make_yt_dlp_lines(videos: list[dict], channel_id: str = "UC_test", channel_name: str = "Test_Channel") -> str:
-    """Build NDJSON lines as yt-dlp would output."""
+def _make_yt_dlp_lines(videos: list[dict], channel_id: str = "UC_test", channel_name: str = "Test_Channel") -> bytes:
+    """Build NDJSON lines as yt-dlp would output (raw bytes, as captured)."""
     lines = []
     for v in videos:
         obj = {
@@ -20,7 +22,7 @@ def _make_yt_dlp_lines(videos: list[dict], channel_id: str = "UC_test", channel_
             "channel": channel_name,
         }
         lines.append(json.dumps(obj))
-    return "\n".join(lines)
+    return "\n".join(lines).encode("utf-8")
 
 
 def test_fetch_channel_writes_urllist_and_upserts_db(store, tmp_path):
@@ -31,7 +33,7 @@ def test_fetch_channel_writes_urllist_and_upserts_db(store, tmp_path):
     yt_dlp_out = _make_yt_dlp_lines(videos)
 
     with patch("yt_artist.fetcher.subprocess.run") as run:
-        run.return_value = MagicMock(returncode=0, stdout=yt_dlp_out, stderr="")
+        run.return_value = MagicMock(returncode=0, stdout=yt_dlp_out, stderr=b"")
         path, count = fetch_channel(
             "https://www.youtube.com/@test",
             store,
@@ -66,12 +68,12 @@ def test_fetch_channel_idempotent(store, tmp_path):
     yt_dlp_out = _make_yt_dlp_lines(videos)
 
     with patch("yt_artist.fetcher.subprocess.run") as run:
-        run.return_value = MagicMock(returncode=0, stdout=yt_dlp_out, stderr="")
+        run.return_value = MagicMock(returncode=0, stdout=yt_dlp_out, stderr=b"")
         fetch_channel("https://www.youtube.com/@test", store, data_dir=tmp_path)
         # Second run: same channel, updated title
         videos[0]["title"] = "Updated Title"
         yt_dlp_out2 = _make_yt_dlp_lines(videos)
-        run.return_value = MagicMock(returncode=0, stdout=yt_dlp_out2, stderr="")
+        run.return_value = MagicMock(returncode=0, stdout=yt_dlp_out2, stderr=b"")
         fetch_channel("https://www.youtube.com/@test", store, data_dir=tmp_path)
 
     video = store.get_video("v1")
@@ -80,8 +82,90 @@ def test_fetch_channel_idempotent(store, tmp_path):
     assert artist is not None
 
 
+def test_fetch_channel_refetch_only_rewrites_changed_rows(store, tmp_path):
+    videos = [{"id": "v1", "title": "Same"}, {"id": "v2", "title": "Old"}]
+    with patch("yt_artist.fetcher.subprocess.run") as run:
+        run.return_value = MagicMock(returncode=0, stdout=_make_yt_dlp_lines(videos), stderr=b"")
+        fetch_channel("https://www.youtube.com/@test", store, data_dir=tmp_path)
+        with store.transaction() as conn:
+            conn.execute("UPDATE videos SET fetched_at = '2000-01-01 00:00:00'")
+        videos[1]["title"] = "New"
+        run.return_value = MagicMock(returncode=0, stdout=_make_yt_dlp_lines(videos), stderr=b"")
+        fetch_channel("https://www.youtube.com/@test", store, data_dir=tmp_path)
+
+    assert store.get_video("v1")["fetched_at"] == "2000-01-01 00:00:00"
+    v2 = store.get_video("v2")
+    assert v2["title"] == "New" and v2["fetched_at"] != "2000-01-01 00:00:00"
+
+
 def test_fetch_channel_empty_raises(store, tmp_path):
     with patch("yt_artist.fetcher.subprocess.run") as run:
-        run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
         with pytest.raises(ValueError, match="No video entries"):
             fetch_channel("https://www.youtube.com/@empty", store, data_dir=tmp_path)
+
+
+def test_fetch_channels_collects_per_channel_results(store, tmp_path):
+    outputs = {
+        "https://www.youtube.com/@a": _make_yt_dlp_lines([{"id": "a1", "title": "A"}], channel_id="UC_a"),
+        "https://www.youtube.com/@b": b"",
+    }
+
+    def fake_run(cmd, **kwargs):
+        return MagicMock(returncode=0, stdout=outputs[cmd[-1]], stderr=b"")
+
+    with patch("yt_artist.fetcher.subprocess.run", side_effect=fake_run):
+        results = fetch_channels(list(outputs), store, data_dir=tmp_path, concurrency=2)
+
+    assert list(results) == list(outputs)
+    path, count = results["https://www.youtube.com/@a"]
+    assert count == 1 and (tmp_path / path).exists()
+    assert isinstance(results["https://www.youtube.com/@b"], ValueError)
+    assert store.get_video("a1")["artist_id"] == "UC_a"
+
+
+def test_fetch_channels_records_db_errors_per_channel(store, tmp_path):
+    from yt_artist import fetcher
+
+    outputs = {
+        "https://www.youtube.com/@a": _make_yt_dlp_lines([{"id": "a1"}], channel_id="UC_a"),
+        "https://www.youtube.com/@b": _make_yt_dlp_lines([{"id": "b1"}], channel_id="UC_b"),
+    }
+    real_save = fetcher._save_channel_entries
+
+    def flaky_save(url, entries, storage, data_dir):
+        if url.endswith("@b"):
+            raise sqlite3.OperationalError("database is locked")
+        return real_save(url, entries, storage, data_dir)
+
+    with (
+        patch("yt_artist.fetcher.subprocess.run", side_effect=lambda cmd, **kw: MagicMock(stdout=outputs[cmd[-1]])),
+        patch("yt_artist.fetcher._save_channel_entries", side_effect=flaky_save),
+    ):
+        results = fetch_channels(list(outputs), store, data_dir=tmp_path, concurrency=2)
+
+    assert results["https://www.youtube.com/@a"][1] == 1
+    assert isinstance(results["https://www.youtube.com/@b"], sqlite3.OperationalError)
+
+
+def test_fetch_channel_skips_bad_lines_and_accepts_nan(store, tmp_path):
+    """Garbage lines are skipped; NaN (emitted by Python's encoder) still parses."""
+    stdout = b"\n".join(
+        [
+            b"not json \xff",
+            b'{"id": "n1", "title": "NaN dur", "duration": NaN, "channel_id": "UC_n", "channel": "N"}',
+        ]
+    )
+    with patch("yt_artist.fetcher.subprocess.run") as run:
+        run.return_value = MagicMock(returncode=0, stdout=stdout, stderr=b"")
+        _, count = fetch_channel("https://www.youtube.com/@n", store, data_dir=tmp_path)
+    assert count == 1
+    assert store.get_video("n1")["title"] == "NaN dur"
+
+
+def test_fetch_channel_yt_dlp_failure_decodes_stderr(store, tmp_path):
+    err = subprocess.CalledProcessError(1, ["yt-dlp"], output=b"", stderr=b"ERROR: channel not found \xe2\x9c\x97\n")
+    with patch("yt_artist.fetcher.subprocess.run") as run:
+        run.return_value.check_returncode.side_effect = err
+        with pytest.raises(RuntimeError, match="exit 1.*channel not found \u2717$"):
+            fetch_channel("https://www.youtube.com/@missing", store, data_dir=tmp_path)
@@ -240,6 +240,8 @@ class TestFtsMigration:
         conn.execute("DROP TRIGGER IF EXISTS transcripts_ai")
         conn.execute("DROP TRIGGER IF EXISTS transcripts_ad")
         conn.execute("DROP TRIGGER IF EXISTS transcripts_au")
+        # Pre-migration DBs also predate the schema version stamp.
+        conn.execute("PRAGMA user_version = 0")
         conn.commit()
         conn.close()
         # Re-run ensure_schema (triggers migration + rebuild).
@@ -35,3 +35,11 @@ class TestContentHash:
     def test_whitespace_sensitivity(self):
         """Trailing whitespace produces a different hash."""
         assert content_hash("text") != content_hash("text ")
+
+    def test_long_text_matches_one_shot_digest(self):
+        """Slice-wise hashing of long text equals hashing the whole encoding."""
+        from yt_artist.hashing import _HASH_SLICE
+
+        text = "aé🎵" * (_HASH_SLICE // 2) + "tail"
+        assert len(text) > _HASH_SLICE
+        assert content_hash(text) == hashlib.sha256(text.encode("utf-8")).hexdigest()
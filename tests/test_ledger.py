@@ -51,6 +51,12 @@ class TestWorkTimer:
         assert "T" in timer.started_at
         assert timer.started_at.endswith("Z")
 
+    def test_started_at_fixed_at_creation(self):
+        """started_at reports creation time, not the time it is read."""
+        with patch("yt_artist.ledger.time.time", return_value=0.0):
+            timer = WorkTimer()
+        assert timer.started_at == "1970-01-01T00:00:00Z"
+
 
 # ---------------------------------------------------------------------------
 # record_operation
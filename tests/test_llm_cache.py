@@ -0,0 +1,55 @@
+"""Tests for llm_cache.py — exact-match LLM response cache."""
+
+from unittest.mock import patch
+
+from yt_artist.llm_cache import LLMCache, cached_complete, llm_cache_key
+
+
+class TestLLMCacheKey:
+    def test_deterministic(self):
+        assert llm_cache_key("sys", "user", "m") == llm_cache_key("sys", "user", "m")
+
+    def test_varies_with_inputs(self):
+        base = llm_cache_key("sys", "user", "m")
+        assert base != llm_cache_key("sys2", "user", "m")
+        assert base != llm_cache_key("sys", "user2", "m")
+        assert base != llm_cache_key("sys", "user", "other-model")
+
+    def test_separator_prevents_collisions(self):
+        assert llm_cache_key("ab", "c", "m") != llm_cache_key("a", "bc", "m")
+
+
+class TestCachedComplete:
+    def test_no_cache_calls_complete(self):
+        with patch("yt_artist.llm_cache.complete", return_value="out") as mock_llm:
+            assert cached_complete("sys", "user") == "out"
+            assert cached_complete("sys", "user") == "out"
+        assert mock_llm.call_count == 2
+
+    def test_second_call_is_hit(self, tmp_path):
+        cache = LLMCache(tmp_path / "cache.db")
+        with patch("yt_artist.llm_cache.complete", return_value="out") as mock_llm:
+            assert cached_complete("sys", "user", cache=cache) == "out"
+            assert cached_complete("sys", "user", cache=cache) == "out"
+        mock_llm.assert_called_once()
+
+    def test_empty_completion_not_stored(self, tmp_path):
+        cache = LLMCache(tmp_path / "cache.db")
+        with patch("yt_artist.llm_cache.complete", return_value="") as mock_llm:
+            cached_complete("sys", "user", cache=cache)
+            cached_complete("sys", "user", cache=cache)
+        assert mock_llm.call_count == 2
+
+    def test_shares_file_with_about_cache(self, tmp_path):
+        from yt_artist.artist_about_cache import AboutCache
+
+        path = tmp_path / "cache.db"
+        AboutCache(path).set("k", "about")
+        LLMCache(path).set("k", "llm")
+        assert AboutCache(path).get("k") == "about"
+        assert LLMCache(path).get("k") == "llm"
+
+    def test_is_not_an_about_cache(self, tmp_path):
+        from yt_artist.artist_about_cache import AboutCache
+
+        assert not isinstance(LLMCache(tmp_path / "cache.db"), AboutCache)
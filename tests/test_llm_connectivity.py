@@ -93,6 +93,19 @@ class TestCompleteRetry:
         assert result == "ok"
         assert mock_client.chat.completions.create.call_count == 1
 
+    def test_timeout_passed_to_sdk(self):
+        """Explicit timeout is forwarded per request; omitted otherwise."""
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = self._mock_response("ok")
+        with (
+            patch("yt_artist.llm.get_client", return_value=mock_client),
+            patch("yt_artist.llm._resolve_config", return_value=("http://localhost:11434/v1", "ollama", "mistral")),
+        ):
+            complete("sys", "user", timeout=7.5)
+            assert mock_client.chat.completions.create.call_args.kwargs["timeout"] == 7.5
+            complete("sys", "user")
+            assert "timeout" not in mock_client.chat.completions.create.call_args.kwargs
+
     def test_transient_failure_retries_then_succeeds(self):
         """Transient error retries and eventually succeeds."""
         resp = self._mock_response("recovered")
@@ -200,3 +213,85 @@ class TestGetModelName:
         with patch.dict("os.environ", {"OPENAI_MODEL": "gemma2"}, clear=False):
             result = get_model_name("llama3")
             assert result == "llama3"
+
+
+# ---------------------------------------------------------------------------
+# complete_stream()
+# ---------------------------------------------------------------------------
+
+
+class TestCompleteStream:
+    def _chunk(self, text):
+        delta = MagicMock()
+        delta.content = text
+        choice = MagicMock()
+        choice.delta = delta
+        chunk = MagicMock()
+        chunk.choices = [choice]
+        return chunk
+
+    def test_yields_deltas_and_closes(self):
+        from yt_artist.llm import complete_stream
+
+        stream = MagicMock()
+        stream.__iter__.return_value = iter([self._chunk("Hel"), self._chunk(None), self._chunk("lo")])
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = stream
+        with patch("yt_artist.llm.get_client", return_value=mock_client):
+            assert list(complete_stream("sys", "user", timeout=5)) == ["Hel", "lo"]
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["timeout"] == 5
+        stream.close.assert_called_once()
+
+    def test_early_close_closes_response(self):
+        from yt_artist.llm import complete_stream
+
+        stream = MagicMock()
+        stream.__iter__.return_value = iter([self._chunk("a"), self._chunk("b")])
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = stream
+        with patch("yt_artist.llm.get_client", return_value=mock_client):
+            gen = complete_stream("sys", "user")
+            assert next(gen) == "a"
+            gen.close()
+        stream.close.assert_called_once()
+
+    def test_api_error_raises_runtime_error(self):
+        from yt_artist.llm import complete_stream
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = ValueError("bad")
+        with (
+            patch("yt_artist.llm.get_client", return_value=mock_client),
+            patch("yt_artist.llm._resolve_config", return_value=("http://localhost:11434/v1", "ollama", "mistral")),
+            pytest.raises(RuntimeError, match="ollama serve"),
+        ):
+            list(complete_stream("sys", "user"))
+
+
+class TestLazyOpenAIImport:
+    def test_cli_import_does_not_load_heavy_deps(self):
+        """openai / duckduckgo_search are imported on first use, not at CLI startup."""
+        import os
+        import subprocess
+        import sys
+
+        code = "import sys, yt_artist.cli; print([m for m in ('openai', 'duckduckgo_search') if m in sys.modules])"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == "[]"
+
+    def test_missing_openai_raises_runtime_error(self):
+        import sys
+
+        import yt_artist.llm as llm
+
+        with (
+            patch.object(llm, "OpenAI", None),
+            patch.object(llm, "_cached_client", None),
+            patch.dict(sys.modules, {"openai": None}),
+            pytest.raises(RuntimeError, match="openai package is required"),
+        ):
+            llm.get_client()
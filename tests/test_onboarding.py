@@ -313,11 +313,24 @@ class TestFirstRunDetection:
     def test_empty_db_shows_quickstart_tip(self, tmp_path, capfd):
         """On first use with empty DB, stderr should mention quickstart."""
         db = tmp_path / "test.db"
-        code = _run_cli("list-prompts", db_path=db)
+        with patch.object(sys.stderr, "isatty", return_value=True):
+            code = _run_cli("list-prompts", db_path=db)
         assert code == 0
         captured = capfd.readouterr()
         assert "quickstart" in captured.err
 
+    def test_non_tty_skips_first_run_query(self, tmp_path, capfd):
+        """With stderr redirected, the tip (and its artists query) is skipped."""
+        db = tmp_path / "test.db"
+        with (
+            patch.object(sys.stderr, "isatty", return_value=False),
+            patch("yt_artist.cli.Storage.list_artists") as mock_list,
+        ):
+            code = _run_cli("list-prompts", db_path=db)
+        assert code == 0
+        mock_list.assert_not_called()
+        assert "First time?" not in capfd.readouterr().err
+
     def test_populated_db_no_quickstart_tip(self, tmp_path, capfd):
         """When DB has artists, quickstart tip should NOT appear."""
         db = tmp_path / "test.db"
@@ -377,7 +390,8 @@ class TestFirstRunMentionsDoctor:
     def test_first_run_mentions_doctor(self, tmp_path, capfd):
         """On first use with empty DB, stderr should mention doctor."""
         db = tmp_path / "test.db"
-        code = _run_cli("list-prompts", db_path=db)
+        with patch.object(sys.stderr, "isatty", return_value=True):
+            code = _run_cli("list-prompts", db_path=db)
         assert code == 0
         captured = capfd.readouterr()
         assert "doctor" in captured.err
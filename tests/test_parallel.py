@@ -47,6 +47,7 @@ class TestBatchDBQueries:
         for vid in ids[:3]:
             store.save_transcript(video_id=vid, raw_text="Text", format="vtt")
         have = store.video_ids_with_transcripts(ids)
+        assert isinstance(have, set)
         assert have == set(ids[:3])
 
     def test_video_ids_with_transcripts_empty(self, tmp_path):
@@ -68,6 +69,7 @@ class TestBatchDBQueries:
         for vid in ids[:2]:
             store.upsert_summary(video_id=vid, prompt_id="p1", content="Summary")
         have = store.video_ids_with_summary(ids, "p1")
+        assert isinstance(have, set)
         assert have == set(ids[:2])
 
     def test_video_ids_with_summary_different_prompts(self, tmp_path):
@@ -83,6 +85,25 @@ class TestBatchDBQueries:
         assert store.video_ids_with_summary(ids, "p2") == {ids[1]}
 
 
+class TestSummaryPreviews:
+    def test_batch_fetch_and_truncate(self, tmp_path, capsys):
+        from yt_artist.cli import _print_summary_previews
+
+        store = _make_store(tmp_path)
+        ids = _seed_full(store, 3)
+        store.upsert_prompt(prompt_id="p1", name="P", template="Summarize")
+        for vid in ids:
+            store.save_transcript(video_id=vid, raw_text="Text", format="vtt")
+        store.upsert_summary(video_id=ids[0], prompt_id="p1", content="x" * 20)
+        store.upsert_summary(video_id=ids[1], prompt_id="p1", content="short")
+        videos = [{"id": vid} for vid in ids]
+        with patch.object(store, "get_summaries_for_video") as mock_single:
+            _print_summary_previews(store, videos, "p1", 10)
+        mock_single.assert_not_called()
+        out = capsys.readouterr().out.splitlines()
+        assert out == [f"Summary {ids[0]}:p1: {'x' * 10}…", f"Summary {ids[1]}:p1: short"]
+
+
 # ---------------------------------------------------------------------------
 # _ProgressCounter
 # ---------------------------------------------------------------------------
@@ -98,6 +119,69 @@ class TestProgressCounter:
         assert pc.done == 2
         assert pc.errors == 1
 
+    def test_tick_log_line(self, caplog):
+        import logging
+
+        from yt_artist.cli import _ProgressCounter
+
+        pc = _ProgressCounter(4)
+        with caplog.at_level(logging.INFO, logger="yt_artist.cli"):
+            pc.tick("Test", "vid1")
+            pc.tick("Test", "vid2", error="boom")
+        assert "Test 1/4: vid1" in caplog.text
+        assert "ETA" in caplog.text
+        assert "ERROR: boom" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# _RateLimiter / _run_bulk pacing
+# ---------------------------------------------------------------------------
+
+
+class TestRateLimiter:
+    def test_first_acquire_does_not_wait(self):
+        import time
+
+        from yt_artist.cli import _RateLimiter
+
+        limiter = _RateLimiter(5.0)
+        t0 = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - t0 < 1.0
+
+    def test_spaces_starts_across_threads(self):
+        import threading
+        import time
+
+        from yt_artist.cli import _RateLimiter
+
+        limiter = _RateLimiter(0.05)
+        starts: list[float] = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.acquire()
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(g >= 0.04 for g in gaps)
+
+    def test_run_bulk_does_not_sleep_on_submit(self):
+        from yt_artist.cli import _run_bulk
+
+        with patch("yt_artist.cli.time.sleep") as mock_sleep:
+            progress = _run_bulk(["a", "b", "c"], lambda v: (v, None), label="Test", concurrency=3, inter_delay=2.0)
+        assert progress.done == 3
+        # Workers 2 and 3 wait for their slot; the first starts immediately.
+        assert mock_sleep.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Parallel transcribe — verifies concurrency > 1 processes all videos
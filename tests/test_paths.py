@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from yt_artist.paths import (
+    cache_db_path,
     db_path,
     job_log_file,
     jobs_dir,
@@ -86,3 +87,8 @@ class TestJobLogFile:
         d = jobs_dir(Path("/d"))
         f = job_log_file(Path("/d"), "j1")
         assert f.parent == d
+
+
+class TestCacheDbPath:
+    def test_correct_location(self):
+        assert cache_db_path(Path("/mydir")) == Path("/mydir/data/cache.db")
@@ -358,6 +358,49 @@ class TestPipelineTermination:
         assert result.summarized == 2
 
 
+class TestPipelineHandOff:
+    def test_transcribed_videos_summarized_without_poll(self, tmp_path):
+        """Fresh transcripts go straight to the summarize pool, even if polling finds nothing."""
+        store = _make_store(tmp_path)
+        vids = _seed(store, n_videos=3, n_transcripts=0)
+        store.upsert_prompt(prompt_id="p1", name="Test", template="Summarize: {video}")
+
+        result = run_pipeline(
+            video_ids_to_transcribe=vids,
+            video_ids_to_summarize=[],
+            transcribe_fn=_make_transcribe_fn(store),
+            summarize_fn=_make_summarize_fn(store),
+            poll_fn=lambda: [],
+            poll_interval=0.1,
+            inter_delay=0,
+        )
+        assert result.summarized == 3
+        assert store.video_ids_with_summary(vids, "p1") == set(vids)
+
+    def test_no_duplicate_summarize_with_poll(self, tmp_path):
+        """Hand-off and poller never submit the same video twice."""
+        store = _make_store(tmp_path)
+        vids = _seed(store, n_videos=4, n_transcripts=0)
+        store.upsert_prompt(prompt_id="p1", name="Test", template="Summarize: {video}")
+        calls: list[str] = []
+        summarize = _make_summarize_fn(store)
+
+        def counting_summarize(vid):
+            calls.append(vid)
+            return summarize(vid)
+
+        run_pipeline(
+            video_ids_to_transcribe=vids,
+            video_ids_to_summarize=[],
+            transcribe_fn=_make_transcribe_fn(store),
+            summarize_fn=counting_summarize,
+            poll_fn=lambda: list(vids),
+            poll_interval=0.05,
+            inter_delay=0,
+        )
+        assert sorted(calls) == sorted(vids)
+
+
 # ---------------------------------------------------------------------------
 # TestPipelineDelay
 # ---------------------------------------------------------------------------
@@ -1,5 +1,10 @@
 """Tests for storage layer: artists, videos, transcripts, prompts, summaries."""
 
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
 
 def test_create_and_get_artist(store):
     store.upsert_artist(
@@ -152,6 +157,36 @@ def test_get_prompt_missing_returns_none(store):
     assert store.get_prompt("missing") is None
 
 
+def test_check_artist_and_prompt(store):
+    store.upsert_artist(artist_id="@A", name="A", channel_url="https://www.youtube.com/@A", urllist_path="a.md")
+    store.upsert_prompt(prompt_id="p1", name="P", template="T")
+    assert store.check_artist_and_prompt("@A", "p1") == (True, True)
+    assert store.check_artist_and_prompt("@A", "missing") == (True, False)
+    assert store.check_artist_and_prompt("@missing", "p1") == (False, True)
+
+
+def test_save_artist_about_prompt(store):
+    store.upsert_artist(artist_id="@A", name="A", channel_url="https://www.youtube.com/@A", urllist_path="a.md")
+    store.save_artist_about_prompt(
+        "@A", "About A.", prompt_id="about-A", name="About A", template="T {artist}", artist_component="About A."
+    )
+    artist = store.get_artist("@A")
+    assert artist["about"] == "About A."
+    assert artist["default_prompt_id"] == "about-A"
+    assert store.get_prompt("about-A")["artist_component"] == "About A."
+
+
+def test_save_artist_about_prompt_rolls_back(store):
+    """A failure part-way through leaves the about text unchanged."""
+    store.upsert_artist(artist_id="@A", name="A", channel_url="https://www.youtube.com/@A", urllist_path="a.md")
+    with (
+        patch("yt_artist.storage._UPSERT_PROMPT_SQL", "INSERT INTO no_such_table VALUES (?, ?, ?, ?, ?, ?, ?)"),
+        pytest.raises(sqlite3.OperationalError),
+    ):
+        store.save_artist_about_prompt("@A", "About A.", prompt_id="about-A", name="About A", template="T")
+    assert (store.get_artist("@A")["about"] or "") == ""
+
+
 def test_save_and_get_summary(store):
     store.upsert_artist(
         artist_id="UC_s",
@@ -177,6 +212,8 @@ def test_save_and_get_summary(store):
     assert rows[0]["prompt_id"] == "p1"
     assert rows[0]["content"] == "This is the summary."
     assert "created_at" in rows[0]
+    assert store.get_summary("sv1", "p1")["content"] == "This is the summary."
+    assert store.get_summary("sv1", "missing") is None
 
 
 def test_upsert_summary_overwrites_same_video_prompt(store):
@@ -325,6 +362,15 @@ class TestChunkedInQueries:
         result = store.video_ids_with_transcripts(ids)
         assert result == set(ids[:20])
 
+    def test_transcripts_accepts_tuple(self, store):
+        ids = _seed_artist_and_videos(store, _IN_BATCH_SIZE + 10)
+        for vid in ids[-5:]:
+            store.save_transcript(video_id=vid, raw_text=f"text for {vid}")
+        assert store.video_ids_with_transcripts(tuple(ids)) == set(ids[-5:])
+        store.upsert_prompt(prompt_id="p1", name="P", template="Summarize")
+        store.upsert_summary(video_id=ids[-1], prompt_id="p1", content="S")
+        assert store.video_ids_with_summary(tuple(ids), "p1") == {ids[-1]}
+
     def test_transcripts_over_limit(self, store):
         """1500 IDs exceeds _IN_BATCH_SIZE — must batch correctly."""
         n = _IN_BATCH_SIZE * 3  # 1500
@@ -459,6 +505,33 @@ class TestBatchFetchMethods:
         result = store.get_summaries_for_videos(ids)
         assert len(result) == 600
 
+    # -- iter_transcripts_for_videos / iter_summaries_for_videos --
+
+    def test_iter_transcripts_keeps_input_order_across_batches(self, store):
+        n = _IN_BATCH_SIZE + 50
+        ids = _seed_artist_and_videos(store, n)
+        transcribed = ids[::3]
+        for vid in reversed(transcribed):
+            store.save_transcript(video_id=vid, raw_text=f"text for {vid}")
+        rows = list(store.iter_transcripts_for_videos(ids))
+        assert [r["video_id"] for r in rows] == transcribed
+        assert rows[0]["raw_text"] == f"text for {ids[0]}"
+
+    def test_iter_summaries_grouped_in_input_order(self, store):
+        ids = _seed_artist_and_videos(store, 4)
+        store.upsert_prompt(prompt_id="p1", name="p1", template="t1")
+        store.upsert_prompt(prompt_id="p2", name="p2", template="t2")
+        for vid in (ids[2], ids[0]):
+            store.save_transcript(video_id=vid, raw_text=f"text for {vid}")
+            store.upsert_summary(video_id=vid, prompt_id="p1", content=f"s1 {vid}")
+            store.upsert_summary(video_id=vid, prompt_id="p2", content=f"s2 {vid}")
+        rows = list(store.iter_summaries_for_videos(ids))
+        assert [r["video_id"] for r in rows] == [ids[0], ids[0], ids[2], ids[2]]
+
+    def test_iter_empty(self, store):
+        assert list(store.iter_transcripts_for_videos([])) == []
+        assert list(store.iter_summaries_for_videos([])) == []
+
     # -- provenance columns --
 
     def test_upsert_summary_with_provenance(self, store):
@@ -600,6 +673,101 @@ class TestConnectionContextManagers:
         assert artist["default_prompt_id"] == "wctx_p"
 
 
+class TestReadSnapshot:
+    def _add_artist(self, store, artist_id):
+        store.upsert_artist(
+            artist_id=artist_id,
+            name=artist_id,
+            channel_url=f"https://www.youtube.com/@{artist_id}",
+            urllist_path=f"data/artists/{artist_id}/urllist.md",
+        )
+
+    def test_reads_share_one_connection(self, store):
+        self._add_artist(store, "UC_a")
+        with store.read_snapshot():
+            with patch.object(store, "_conn", wraps=store._conn) as mock_conn:
+                store.list_artists()
+                store.get_artist("UC_a")
+                store.list_prompts()
+            mock_conn.assert_not_called()
+
+    def test_snapshot_ignores_concurrent_writes(self, store):
+        self._add_artist(store, "UC_a")
+        with store.read_snapshot():
+            assert len(store.list_artists()) == 1
+            self._add_artist(store, "UC_b")  # separate write connection
+            assert len(store.list_artists()) == 1
+        assert len(store.list_artists()) == 2
+
+    def test_nested_snapshot_is_noop(self, store):
+        self._add_artist(store, "UC_a")
+        with store.read_snapshot():
+            with store.read_snapshot():
+                store.list_artists()
+            assert store.get_artist("UC_a") is not None
+
+
+class TestConnectionPragmas:
+    def test_bulk_write_pragmas(self, store):
+        from yt_artist.storage import _BUSY_TIMEOUT_MS
+
+        with store._read_conn() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()["journal_mode"] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()["synchronous"] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()["temp_store"] == 2  # MEMORY
+            assert conn.execute("PRAGMA busy_timeout").fetchone()["timeout"] == _BUSY_TIMEOUT_MS
+
+
+class TestSchemaVersion:
+    def test_ensure_schema_stamps_version(self, store):
+        from yt_artist.storage import _SCHEMA_VERSION
+
+        with store._read_conn() as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()["user_version"] == _SCHEMA_VERSION
+
+    def test_up_to_date_db_skips_migrations(self, store):
+        with patch.object(store, "_migrate_artists_columns") as mock_migrate:
+            store.ensure_schema()
+        mock_migrate.assert_not_called()
+
+    def test_up_to_date_db_restores_default_prompt(self, store):
+        with store._write_conn() as conn:
+            conn.execute("DELETE FROM prompts")
+        store.ensure_schema()
+        assert store.get_prompt("default") is not None
+
+    # _SCHEMA_VERSION -> fingerprint of schema.sql + every Storage._migrate_* method.
+    # When this test fails, bump _SCHEMA_VERSION in storage.py (so existing DBs
+    # re-run ensure_schema) and add the new version's fingerprint here.
+    _FINGERPRINTS = {1: "5d017602bbbff6fcd43a27132f744a02512f4b9bee5a3d428a16b26b78935c6a"}
+
+    @staticmethod
+    def _schema_fingerprint() -> str:
+        import hashlib
+        import inspect
+
+        from yt_artist.init_db import get_schema_sql
+        from yt_artist.storage import Storage
+
+        migrations = sorted(name for name in dir(Storage) if name.startswith("_migrate_"))
+        parts = [get_schema_sql()] + [inspect.getsource(getattr(Storage, name)) for name in migrations]
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    def test_schema_change_bumps_version(self):
+        from yt_artist.storage import _SCHEMA_VERSION
+
+        assert self._FINGERPRINTS.get(_SCHEMA_VERSION) == self._schema_fingerprint(), (
+            "schema.sql or a _migrate_* step changed: bump _SCHEMA_VERSION and record the new fingerprint"
+        )
+
+    def test_unversioned_db_is_migrated(self, store):
+        with store._write_conn() as conn:
+            conn.execute("PRAGMA user_version = 0")
+        with patch.object(store, "_migrate_artists_columns") as mock_migrate:
+            store.ensure_schema()
+        mock_migrate.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Hash persistence and staleness detection
 # ---------------------------------------------------------------------------
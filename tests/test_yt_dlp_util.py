@@ -11,6 +11,7 @@ from yt_artist.yt_dlp_util import (
     get_auth_config,
     get_inter_video_delay,
     yt_dlp_cmd,
+    yt_dlp_path,
 )
 
 # Default sleep flags that yt_dlp_cmd always appends.
@@ -36,6 +37,14 @@ def test_falls_back_to_python_module():
     assert result == [sys.executable, "-m", "yt_dlp"] + _SLEEP
 
 
+def test_yt_dlp_path_cached():
+    """PATH is searched once; doctor and _resolve_base share the result."""
+    with patch("yt_artist.yt_dlp_util.shutil.which", return_value="/usr/bin/yt-dlp") as mock_which:
+        assert yt_dlp_path() == "/usr/bin/yt-dlp"
+        assert yt_dlp_path() == "/usr/bin/yt-dlp"
+    assert mock_which.call_count == 1
+
+
 def test_cookies_browser_env_appends_flag():
     """YT_ARTIST_COOKIES_BROWSER adds --cookies-from-browser."""
     _resolve_base.cache_clear()
@@ -218,3 +227,9 @@ def test_get_auth_config_empty():
     assert cfg["cookies_browser"] == ""
     assert cfg["cookies_file"] == ""
     assert cfg["po_token"] is False
+
+
+def test_video_url_for():
+    from yt_artist.yt_dlp_util import video_url_for
+
+    assert video_url_for("dQw4w9WgXcQ") == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"